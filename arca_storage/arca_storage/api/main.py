@@ -2,12 +2,21 @@
 FastAPI main application.
 """
 
+import asyncio
 import logging
-import uuid
-from typing import Any, Dict, Optional
-
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Annotated, Any, AsyncIterator, Callable, Dict, List, Optional, Type
+
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from arca_storage.api.models import (
     ExportCreate,
@@ -24,278 +33,472 @@ from arca_storage.api.models import (
     VolumeCreate,
     VolumeListResponse,
     VolumeQoSApply,
+    VolumeQoSBulkApply,
+    VolumeQoSBulkResponse,
     VolumeQoSResponse,
     VolumeResize,
     VolumeResponse,
 )
 from arca_storage.api.services import export_service, qos_service, snapshot_service, svm_service, volume_service
+from arca_storage.cli.lib.config import load_config
+from arca_storage.cli.lib.state import preload_volume_index
 
-app = FastAPI(title="Arca Storage API", description="REST API for Arca Storage SVM management", version="0.1.0")
 logger = logging.getLogger(__name__)
 
 
+def _orjson_default(obj: Any) -> Any:
+    # Envelopes are built with model_construct(), which fills __dict__ without validation.
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib json module.
+
+    Endpoints return instances of this class directly so FastAPI skips
+    `jsonable_encoder` and response-model validation; `response_model` is kept
+    on the routes for the OpenAPI schema only. Content may be a plain dict or an
+    unvalidated model built with `model_construct()`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
+
+
+# Request ids are 128 random bits rendered as 32 hex characters. Entropy is read
+# in 4 KiB batches and hex-encoded once per batch, so most calls are a string
+# slice instead of a getrandom() syscall plus UUID formatting.
+_REQUEST_ID_HEX_LEN = 32
+_REQUEST_ID_BATCH_BYTES = 4096
+_request_id_lock = threading.Lock()
+_request_id_pool = ""
+_request_id_offset = 0
+
+
+def _reset_request_id_pool() -> None:
+    global _request_id_pool, _request_id_offset
+    _request_id_pool = ""
+    _request_id_offset = 0
+
+
+# A forked worker must not hand out the parent's remaining ids.
+os.register_at_fork(after_in_child=_reset_request_id_pool)
+
+
+def _new_request_id() -> str:
+    global _request_id_pool, _request_id_offset
+    with _request_id_lock:
+        start = _request_id_offset
+        if start >= len(_request_id_pool):
+            _request_id_pool = os.urandom(_REQUEST_ID_BATCH_BYTES).hex()
+            start = 0
+        _request_id_offset = start + _REQUEST_ID_HEX_LEN
+        return _request_id_pool[start : start + _REQUEST_ID_HEX_LEN]
+
+
+# Service calls shell out to LVM/pcs/ip or touch state files, so they run in a
+# dedicated pool sized above Starlette's default of 40 threads.
+SERVICE_THREADPOOL_WORKERS = 64
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that enqueues records unformatted.
+
+    The stock `prepare()` renders the message and traceback in the logging
+    thread so records can be pickled; the queue here never leaves the process,
+    so formatting is left to the listener thread instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _start_log_listener() -> Callable[[], None]:
+    """
+    Route root-logger records through a queue drained by a background thread.
+
+    Returns:
+        Function that stops the listener and restores the original root handlers
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    queue: "SimpleQueue[logging.LogRecord]" = SimpleQueue()
+    # Without configured handlers, keep logging's last-resort stderr output.
+    listener = QueueListener(queue, *(handlers or [logging.lastResort]), respect_handler_level=True)
+    root.handlers = [_DeferredQueueHandler(queue)]
+    listener.start()
+
+    def stop() -> None:
+        listener.stop()
+        root.handlers = handlers
+
+    return stop
+
+
+def _warm_caches() -> None:
+    """
+    Parse the config and index the volume state before serving requests.
+
+    Failures are logged and left for the first request to surface.
+    """
+    try:
+        load_config()
+        preload_volume_index()
+    except Exception:
+        logger.warning("Cache warmup failed", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Install the service threadpool and the background log listener, then warm the caches."""
+    executor = ThreadPoolExecutor(max_workers=SERVICE_THREADPOOL_WORKERS, thread_name_prefix="arca-api")
+    asyncio.get_running_loop().set_default_executor(executor)
+    stop_log_listener = _start_log_listener()
+    await asyncio.to_thread(_warm_caches)
+    try:
+        yield
+    finally:
+        stop_log_listener()
+        executor.shutdown(wait=False)
+
+
+def _ok(
+    model: Type[BaseModel], request_id: str, key: str, value: Any, status_code: int = 200
+) -> ORJSONResponse:
+    """Wrap a single result in the standard `{"request_id", "status", "data"}` envelope."""
+    return ORJSONResponse(
+        model.model_construct(request_id=request_id, status="ok", data={key: value}), status_code=status_code
+    )
+
+
+# List bodies are flushed in chunks of about this size so a large page never
+# has to exist as one serialized blob.
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+async def _stream_list(
+    request_id: str, items: List[Dict[str, Any]], next_cursor: Optional[str]
+) -> AsyncIterator[bytes]:
+    """Yield the list envelope incrementally, encoding one item at a time."""
+    buf = bytearray(b'{"request_id":"')
+    buf += request_id.encode("ascii")
+    buf += b'","status":"ok","data":{"items":['
+    for index, item in enumerate(items):
+        if index:
+            buf += b","
+        buf += orjson.dumps(item)
+        if len(buf) >= _STREAM_CHUNK_BYTES:
+            yield bytes(buf)
+            buf.clear()
+    buf += b'],"next_cursor":'
+    buf += orjson.dumps(next_cursor)
+    buf += b"}}"
+    yield bytes(buf)
+
+
+def _ok_list(request_id: str, result: Dict[str, Any]) -> StreamingResponse:
+    """Stream a service list result in the standard envelope with `items` and `next_cursor`."""
+    return StreamingResponse(
+        _stream_list(request_id, result["items"], result.get("next_cursor")), media_type="application/json"
+    )
+
+
+class RequestIDMiddleware:
+    """
+    Assign each HTTP request an id, exposed as `request.state.request_id` and
+    echoed back in the `X-Request-ID` response header.
+
+    Implemented as plain ASGI rather than `BaseHTTPMiddleware` to avoid the
+    extra task and response re-wrapping that class adds per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _new_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
+        header = (b"x-request-id", request_id.encode("ascii"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+app = FastAPI(
+    title="Arca Storage API",
+    description="REST API for Arca Storage SVM management",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+app.add_middleware(RequestIDMiddleware)
+
+
+# The 500 body is fixed apart from the request id (plain hex, so it needs no escaping).
+_INTERNAL_ERROR_BODY = (
+    b'{"request_id":"%s","status":"error",'
+    b'"error":{"code":"INTERNAL_ERROR","message":"Internal server error","details":{}}}'
+)
+
+
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """Global exception handler."""
-    request_id = str(uuid.uuid4())
-    logger.exception("Unhandled error (request_id=%s, path=%s)", request_id, request.url.path)
-    return JSONResponse(
+    # This handler runs outside the middleware stack, but shares the request state it set.
+    request_id = getattr(request.state, "request_id", None) or _new_request_id()
+    # The traceback is formatted by the log listener thread, not in the request path.
+    logger.error("Unhandled error (request_id=%s, path=%s)", request_id, request.url.path, exc_info=exc)
+    return Response(
+        _INTERNAL_ERROR_BODY % request_id.encode("ascii"),
         status_code=500,
-        content={
-            "request_id": request_id,
-            "status": "error",
-            "error": {"code": "INTERNAL_ERROR", "message": "Internal server error", "details": {}},
-        },
+        media_type="application/json",
+        headers={"x-request-id": request_id},
     )
 
 
+# Query parameters shared by several endpoints.
+LimitQuery = Annotated[int, Query(ge=1, le=200, description="Maximum number of results")]
+CursorQuery = Annotated[Optional[str], Query(description="Pagination cursor")]
+SVMFilterQuery = Annotated[Optional[str], Query(description="Filter by SVM name")]
+VolumeFilterQuery = Annotated[Optional[str], Query(description="Filter by volume name")]
+SVMNameQuery = Annotated[str, Query(description="SVM name")]
+VolumeNameQuery = Annotated[str, Query(description="Volume name")]
+ForceQuery = Annotated[bool, Query(description="Force deletion")]
+
+
+# Exception-to-status maps shared by the endpoints below.
+_INVALID: Dict[Type[Exception], int] = {ValueError: 400}
+_NOT_FOUND: Dict[Type[Exception], int] = {ValueError: 404}
+_INVALID_OR_CONFLICT: Dict[Type[Exception], int] = {ValueError: 400, RuntimeError: 409}
+_INVALID_OR_MISSING: Dict[Type[Exception], int] = {ValueError: 400, RuntimeError: 404}
+_NOT_FOUND_OR_CONFLICT: Dict[Type[Exception], int] = {ValueError: 404, RuntimeError: 409}
+
+
+async def _call_service(
+    errors: Dict[Type[Exception], int], func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """
+    Run a blocking service call in the threadpool and map its errors to HTTP responses.
+
+    Args:
+        errors: Exception type to HTTP status code for errors the service raises on bad input
+        func: Service function, looked up by the caller at request time
+        *args: Positional arguments for `func`
+        **kwargs: Keyword arguments for `func`
+
+    Returns:
+        The service call's result
+
+    Raises:
+        HTTPException: If `func` raises one of the exception types in `errors`
+    """
+    try:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    except tuple(errors) as e:
+        status_code = next(code for exc_type, code in errors.items() if isinstance(e, exc_type))
+        raise HTTPException(status_code=status_code, detail=str(e))
+
+
 # SVM endpoints
 
 
 @app.post("/v1/svms", response_model=SVMResponse, status_code=201)
-def create_svm(svm: SVMCreate) -> Dict[str, Any]:
+async def create_svm(request: Request, svm: SVMCreate) -> ORJSONResponse:
     """
     Create a new SVM.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = svm_service.create_svm(svm)
-        return {"request_id": request_id, "status": "ok", "data": {"svm": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    result = await _call_service(_INVALID, svm_service.create_svm, svm)
+    return _ok(SVMResponse, request.state.request_id, "svm", result, status_code=201)
 
 
 @app.get("/v1/svms", response_model=SVMListResponse)
-def list_svms(
-    name: Optional[str] = Query(None, description="Filter by SVM name"),
-    limit: int = Query(100, ge=1, le=200, description="Maximum number of results"),
-    cursor: Optional[str] = Query(None, description="Pagination cursor"),
-) -> Dict[str, Any]:
+async def list_svms(
+    request: Request,
+    name: SVMFilterQuery = None,
+    limit: LimitQuery = 100,
+    cursor: CursorQuery = None,
+) -> StreamingResponse:
     """
     List all SVMs.
     """
-    request_id = str(uuid.uuid4())
-    result = svm_service.list_svms(name, limit, cursor)
-    return {
-        "request_id": request_id,
-        "status": "ok",
-        "data": {"items": result["items"], "next_cursor": result.get("next_cursor")},
-    }
+    result = await _call_service(_INVALID, svm_service.list_svms, name, limit, cursor)
+    return _ok_list(request.state.request_id, result)
 
 
 @app.delete("/v1/svms/{name}", response_model=SuccessResponse)
-def delete_svm(
+async def delete_svm(
+    request: Request,
     name: str,
-    force: bool = Query(False, description="Force deletion"),
-    delete_volumes: bool = Query(False, description="Delete volumes as well"),
-) -> Dict[str, Any]:
+    force: ForceQuery = False,
+    delete_volumes: Annotated[bool, Query(description="Delete volumes as well")] = False,
+) -> ORJSONResponse:
     """
     Delete an SVM.
     """
-    try:
-        request_id = str(uuid.uuid4())
-        svm_service.delete_svm(name, force, delete_volumes)
-        return {"request_id": request_id, "status": "ok", "data": {"deleted": True}}
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=409, detail=str(e))
+    await _call_service(_NOT_FOUND_OR_CONFLICT, svm_service.delete_svm, name, force, delete_volumes)
+    return _ok(SuccessResponse, request.state.request_id, "deleted", True)
 
 
 # Volume endpoints
 
 
 @app.post("/v1/volumes", response_model=VolumeResponse, status_code=201)
-def create_volume(volume: VolumeCreate) -> Dict[str, Any]:
+async def create_volume(request: Request, volume: VolumeCreate) -> ORJSONResponse:
     """
     Create a new volume.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = volume_service.create_volume(volume)
-        return {"request_id": request_id, "status": "ok", "data": {"volume": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    result = await _call_service(_INVALID, volume_service.create_volume, volume)
+    return _ok(VolumeResponse, request.state.request_id, "volume", result, status_code=201)
 
 
 @app.patch("/v1/volumes/{name}", response_model=VolumeResponse)
-def resize_volume(name: str, resize: VolumeResize) -> Dict[str, Any]:
+async def resize_volume(request: Request, name: str, resize: VolumeResize) -> ORJSONResponse:
     """
     Resize a volume.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = volume_service.resize_volume(name, resize.svm, resize.new_size_gib)
-        return {"request_id": request_id, "status": "ok", "data": {"volume": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    result = await _call_service(_NOT_FOUND, volume_service.resize_volume, name, resize.svm, resize.new_size_gib)
+    return _ok(VolumeResponse, request.state.request_id, "volume", result)
 
 
 @app.delete("/v1/volumes/{name}", response_model=SuccessResponse)
-def delete_volume(
-    name: str, svm: str = Query(..., description="SVM name"), force: bool = Query(False, description="Force deletion")
-) -> Dict[str, Any]:
+async def delete_volume(
+    request: Request,
+    name: str,
+    svm: SVMNameQuery,
+    force: ForceQuery = False,
+) -> ORJSONResponse:
     """
     Delete a volume.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        volume_service.delete_volume(name, svm, force)
-        return {"request_id": request_id, "status": "ok", "data": {"deleted": True}}
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    await _call_service(_NOT_FOUND, volume_service.delete_volume, name, svm, force)
+    return _ok(SuccessResponse, request.state.request_id, "deleted", True)
 
 
 @app.get("/v1/volumes", response_model=VolumeListResponse)
-def list_volumes(
-    svm: Optional[str] = Query(None, description="Filter by SVM name"),
-    name: Optional[str] = Query(None, description="Filter by volume name"),
-    limit: int = Query(100, ge=1, le=200),
-    cursor: Optional[str] = Query(None),
-) -> Dict[str, Any]:
+async def list_volumes(
+    request: Request,
+    svm: SVMFilterQuery = None,
+    name: VolumeFilterQuery = None,
+    limit: LimitQuery = 100,
+    cursor: CursorQuery = None,
+) -> StreamingResponse:
     """
     List all volumes.
     """
-    request_id = str(uuid.uuid4())
-    result = volume_service.list_volumes(svm, name, limit, cursor)
-    return {
-        "request_id": request_id,
-        "status": "ok",
-        "data": {"items": result["items"], "next_cursor": result.get("next_cursor")},
-    }
+    result = await _call_service(_INVALID, volume_service.list_volumes, svm, name, limit, cursor)
+    return _ok_list(request.state.request_id, result)
 
 
 # Export endpoints
 
 
 @app.post("/v1/exports", response_model=ExportResponse, status_code=201)
-def add_export(export: ExportCreate) -> Dict[str, Any]:
+async def add_export(request: Request, export: ExportCreate) -> ORJSONResponse:
     """
     Add an NFS export.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = export_service.add_export(export)
-        return {"request_id": request_id, "status": "ok", "data": {"export": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    result = await _call_service(_INVALID, export_service.add_export, export)
+    return _ok(ExportResponse, request.state.request_id, "export", result, status_code=201)
 
 
 @app.delete("/v1/exports", response_model=SuccessResponse)
-def remove_export(
-    svm: str = Query(..., description="SVM name"),
-    volume: str = Query(..., description="Volume name"),
-    client: str = Query(..., description="Client CIDR"),
-) -> Dict[str, Any]:
+async def remove_export(
+    request: Request,
+    svm: SVMNameQuery,
+    volume: VolumeNameQuery,
+    client: Annotated[str, Query(description="Client CIDR")],
+) -> ORJSONResponse:
     """
     Remove an NFS export.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        export_service.remove_export(svm, volume, client)
-        return {"request_id": request_id, "status": "ok", "data": {"deleted": True}}
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    await _call_service(_NOT_FOUND, export_service.remove_export, svm, volume, client)
+    return _ok(SuccessResponse, request.state.request_id, "deleted", True)
 
 
 @app.get("/v1/exports", response_model=ExportListResponse)
-def list_exports(
-    svm: Optional[str] = Query(None, description="Filter by SVM name"),
-    volume: Optional[str] = Query(None, description="Filter by volume name"),
-    client: Optional[str] = Query(None, description="Filter by client CIDR"),
-    limit: int = Query(100, ge=1, le=200),
-    cursor: Optional[str] = Query(None),
-) -> Dict[str, Any]:
+async def list_exports(
+    request: Request,
+    svm: SVMFilterQuery = None,
+    volume: VolumeFilterQuery = None,
+    client: Annotated[Optional[str], Query(description="Filter by client CIDR")] = None,
+    limit: LimitQuery = 100,
+    cursor: CursorQuery = None,
+) -> StreamingResponse:
     """
     List all exports.
     """
-    request_id = str(uuid.uuid4())
-    result = export_service.list_exports(svm, volume, client, limit, cursor)
-    return {
-        "request_id": request_id,
-        "status": "ok",
-        "data": {"items": result["items"], "next_cursor": result.get("next_cursor")},
-    }
+    result = await _call_service(_INVALID, export_service.list_exports, svm, volume, client, limit, cursor)
+    return _ok_list(request.state.request_id, result)
 
 
 # Snapshot endpoints
 
 
 @app.post("/v1/snapshots", response_model=SnapshotResponse, status_code=201)
-def create_snapshot(snapshot: SnapshotCreate) -> Dict[str, Any]:
+async def create_snapshot(request: Request, snapshot: SnapshotCreate) -> ORJSONResponse:
     """
     Create a snapshot of a volume.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = snapshot_service.create_snapshot(snapshot)
-        return {"request_id": request_id, "status": "ok", "data": {"snapshot": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=409, detail=str(e))
+    result = await _call_service(_INVALID_OR_CONFLICT, snapshot_service.create_snapshot, snapshot)
+    return _ok(SnapshotResponse, request.state.request_id, "snapshot", result, status_code=201)
 
 
 @app.delete("/v1/snapshots/{name}", response_model=SuccessResponse)
-def delete_snapshot(
+async def delete_snapshot(
+    request: Request,
     name: str,
-    svm: str = Query(..., description="SVM name"),
-    volume: str = Query(..., description="Volume name"),
-    force: bool = Query(False, description="Force deletion"),
-) -> Dict[str, Any]:
+    svm: SVMNameQuery,
+    volume: VolumeNameQuery,
+    force: ForceQuery = False,
+) -> ORJSONResponse:
     """
     Delete a snapshot.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        snapshot_service.delete_snapshot(name, svm, volume, force)
-        return {"request_id": request_id, "status": "ok", "data": {"deleted": True}}
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=409, detail=str(e))
+    await _call_service(_NOT_FOUND_OR_CONFLICT, snapshot_service.delete_snapshot, name, svm, volume, force)
+    return _ok(SuccessResponse, request.state.request_id, "deleted", True)
 
 
 @app.get("/v1/snapshots", response_model=SnapshotListResponse)
-def list_snapshots(
-    svm: Optional[str] = Query(None, description="Filter by SVM name"),
-    volume: Optional[str] = Query(None, description="Filter by volume name"),
-    name: Optional[str] = Query(None, description="Filter by snapshot name"),
-    limit: int = Query(100, ge=1, le=200),
-    cursor: Optional[str] = Query(None),
-) -> Dict[str, Any]:
+async def list_snapshots(
+    request: Request,
+    svm: SVMFilterQuery = None,
+    volume: VolumeFilterQuery = None,
+    name: Annotated[Optional[str], Query(description="Filter by snapshot name")] = None,
+    limit: LimitQuery = 100,
+    cursor: CursorQuery = None,
+) -> StreamingResponse:
     """
     List all snapshots.
     """
-    request_id = str(uuid.uuid4())
-    result = snapshot_service.list_snapshots(svm, volume, name, limit, cursor)
-    return {
-        "request_id": request_id,
-        "status": "ok",
-        "data": {"items": result["items"], "next_cursor": result.get("next_cursor")},
-    }
+    result = await _call_service(_INVALID, snapshot_service.list_snapshots, svm, volume, name, limit, cursor)
+    return _ok_list(request.state.request_id, result)
 
 
 @app.post("/v1/volumes/{name}/clone", response_model=VolumeResponse, status_code=201)
-def clone_volume_from_snapshot(name: str, clone: VolumeCloneCreate) -> Dict[str, Any]:
+async def clone_volume_from_snapshot(request: Request, name: str, clone: VolumeCloneCreate) -> ORJSONResponse:
     """
     Create a new volume from a snapshot (clone).
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = snapshot_service.clone_volume_from_snapshot(clone)
-        return {"request_id": request_id, "status": "ok", "data": {"volume": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    result = await _call_service(_INVALID_OR_MISSING, snapshot_service.clone_volume_from_snapshot, clone)
+    return _ok(VolumeResponse, request.state.request_id, "volume", result, status_code=201)
 
 
 # QoS endpoints
 
 
 @app.patch("/v1/volumes/{name}/qos", response_model=VolumeQoSResponse)
-def apply_qos_to_volume(name: str, qos: VolumeQoSApply) -> Dict[str, Any]:
+async def apply_qos_to_volume(request: Request, name: str, qos: VolumeQoSApply) -> ORJSONResponse:
     """
     Apply QoS limits to a volume.
 
@@ -317,58 +520,71 @@ def apply_qos_to_volume(name: str, qos: VolumeQoSApply) -> Dict[str, Any]:
     }
     ```
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = qos_service.apply_qos_to_volume(
-            svm=qos.svm,
-            volume=name,
-            read_iops=qos.read_iops,
-            write_iops=qos.write_iops,
-            read_bps=qos.read_bps,
-            write_bps=qos.write_bps,
-        )
-        return {"request_id": request_id, "status": "ok", "data": {"qos": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    result = await _call_service(
+        _INVALID_OR_MISSING,
+        qos_service.apply_qos_to_volume,
+        svm=qos.svm,
+        volume=name,
+        read_iops=qos.read_iops,
+        write_iops=qos.write_iops,
+        read_bps=qos.read_bps,
+        write_bps=qos.write_bps,
+    )
+    return _ok(VolumeQoSResponse, request.state.request_id, "qos", result)
+
+
+@app.post("/v1/qos/bulk", response_model=VolumeQoSBulkResponse)
+async def apply_qos_bulk(request: Request, bulk: VolumeQoSBulkApply) -> ORJSONResponse:
+    """
+    Apply QoS limits to many volumes in one request.
+
+    Every volume and its block device are resolved before any limit is
+    written, so an item that cannot be resolved (unknown volume, missing or
+    inactive LV) fails the whole request without changes. The writes
+    themselves are not transactional: if writing a volume's limits fails,
+    volumes earlier in `items` keep their new limits. Re-sending the same
+    request is safe.
+
+    Example:
+    ```json
+    {
+        "items": [
+            {"svm": "production_svm", "volume": "vol1", "read_iops": 5000, "write_iops": 5000},
+            {"svm": "production_svm", "volume": "vol2", "read_bps": 524288000}
+        ]
+    }
+    ```
+    """
+    specs = [item.model_dump() for item in bulk.items]
+    result = await _call_service(_INVALID_OR_MISSING, qos_service.apply_qos_bulk, specs)
+    return _ok(VolumeQoSBulkResponse, request.state.request_id, "items", result)
 
 
 @app.delete("/v1/volumes/{name}/qos", response_model=SuccessResponse)
-def remove_qos_from_volume(
+async def remove_qos_from_volume(
+    request: Request,
     name: str,
-    svm: str = Query(..., description="SVM name"),
-) -> Dict[str, Any]:
+    svm: SVMNameQuery,
+) -> ORJSONResponse:
     """
     Remove QoS limits from a volume.
 
     This resets all I/O limits to unlimited (max).
     """
-    request_id = str(uuid.uuid4())
-    try:
-        qos_service.remove_qos_from_volume(svm=svm, volume=name)
-        return {"request_id": request_id, "status": "ok", "data": {"message": "QoS limits removed"}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    await _call_service(_INVALID_OR_MISSING, qos_service.remove_qos_from_volume, svm=svm, volume=name)
+    return _ok(SuccessResponse, request.state.request_id, "message", "QoS limits removed")
 
 
 @app.get("/v1/volumes/{name}/qos", response_model=VolumeQoSResponse)
-def get_qos_settings(
+async def get_qos_settings(
+    request: Request,
     name: str,
-    svm: str = Query(..., description="SVM name"),
-) -> Dict[str, Any]:
+    svm: SVMNameQuery,
+) -> ORJSONResponse:
     """
     Get current QoS settings for a volume.
 
     Returns the current I/O limits (IOPS and bandwidth) applied to the volume.
     """
-    request_id = str(uuid.uuid4())
-    try:
-        result = qos_service.get_qos_settings(svm=svm, volume=name)
-        return {"request_id": request_id, "status": "ok", "data": {"qos": result}}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    result = await _call_service(_INVALID_OR_MISSING, qos_service.get_qos_settings, svm=svm, volume=name)
+    return _ok(VolumeQoSResponse, request.state.request_id, "qos", result)
@@ -2,11 +2,50 @@
 Pydantic models for API requests and responses.
 """
 
+import ipaddress
+import string
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Request bodies reject unknown fields and are immutable once validated.
+_REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+_NAME_FIRST_CHARS = frozenset(string.ascii_letters + string.digits)
+_NAME_CHARS = (string.ascii_letters + string.digits + "._-").encode("ascii")
+
+
+def _is_valid_name(v: str) -> bool:
+    """Return True if v starts with an alphanumeric and contains only alphanumerics, '.', '_' or '-'."""
+    if not v or v[0] not in _NAME_FIRST_CHARS or not v.isascii():
+        return False
+    # translate() deletes every allowed byte in C; anything left over is an invalid character.
+    return not v.encode("ascii").translate(None, _NAME_CHARS)
+
+
+def _is_plain_ipv4_cidr(v: str) -> bool:
+    """
+    Return True if v is a plain `a.b.c.d/nn` IPv4 CIDR.
+
+    This is a fast path for the common case only: it never returns True for a
+    value `ipaddress` would reject, and anything unusual (leading zeros,
+    netmask prefixes, non-ASCII digits) returns False so the caller falls back
+    to full `ipaddress` validation.
+    """
+    if not v.isascii():
+        return False
+    addr, _, prefix = v.partition("/")
+    if not (prefix.isdigit() and len(prefix) <= 2 and int(prefix) <= 32):
+        return False
+    octets = addr.split(".")
+    if len(octets) != 4:
+        return False
+    for octet in octets:
+        if not octet.isdigit() or len(octet) > 3 or int(octet) > 255 or (len(octet) > 1 and octet[0] == "0"):
+            return False
+    return True
 
 
 class SVMStatus(str, Enum):
@@ -50,6 +89,8 @@ class ExportStatus(str, Enum):
 class SVMCreate(BaseModel):
     """Request model for creating an SVM."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     name: str = Field(..., description="SVM name", min_length=1, max_length=64)
     vlan_id: int = Field(..., description="VLAN ID", ge=1, le=4094)
     ip_cidr: str = Field(..., description="IP address with CIDR (e.g., 192.168.10.5/24)")
@@ -61,9 +102,7 @@ class SVMCreate(BaseModel):
 
     @field_validator("name")
     def validate_name(cls, v: str) -> str:
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$", v):
+        if not _is_valid_name(v):
             raise ValueError(
                 "Name must start with alphanumeric and contain only alphanumeric, dots, underscores, or hyphens"
             )
@@ -71,8 +110,8 @@ class SVMCreate(BaseModel):
 
     @field_validator("ip_cidr")
     def validate_ip_cidr(cls, v: str) -> str:
-        import ipaddress
-
+        if _is_plain_ipv4_cidr(v):
+            return v
         try:
             parts = v.split("/")
             if len(parts) != 2:
@@ -87,8 +126,6 @@ class SVMCreate(BaseModel):
 
     @field_validator("gateway")
     def validate_gateway(cls, v: Optional[str]) -> Optional[str]:
-        import ipaddress
-
         if v is None:
             return v
         try:
@@ -134,6 +171,8 @@ class SVMListResponse(BaseModel):
 class VolumeCreate(BaseModel):
     """Request model for creating a volume."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     name: str = Field(..., description="Volume name", min_length=1, max_length=64)
     svm: str = Field(..., description="SVM name", min_length=1, max_length=64)
     size_gib: int = Field(..., description="Size in GiB", gt=0)
@@ -142,9 +181,7 @@ class VolumeCreate(BaseModel):
 
     @field_validator("name", "svm")
     def validate_name(cls, v: str) -> str:
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$", v):
+        if not _is_valid_name(v):
             raise ValueError(
                 "Name must start with alphanumeric and contain only alphanumeric, dots, underscores, or hyphens"
             )
@@ -154,6 +191,8 @@ class VolumeCreate(BaseModel):
 class VolumeResize(BaseModel):
     """Request model for resizing a volume."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     svm: str = Field(..., description="SVM name")
     new_size_gib: int = Field(..., description="New size in GiB", gt=0)
 
@@ -161,6 +200,8 @@ class VolumeResize(BaseModel):
 class VolumeQoSApply(BaseModel):
     """Request model for applying QoS to a volume."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     svm: str = Field(..., description="SVM name", min_length=1, max_length=64)
     read_iops: Optional[int] = Field(None, description="Read IOPS limit", gt=0)
     write_iops: Optional[int] = Field(None, description="Write IOPS limit", gt=0)
@@ -169,15 +210,35 @@ class VolumeQoSApply(BaseModel):
 
     @field_validator("svm")
     def validate_svm(cls, v: str) -> str:
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$", v):
+        if not _is_valid_name(v):
             raise ValueError(
                 "SVM name must start with alphanumeric and contain only alphanumeric, dots, underscores, or hyphens"
             )
         return v
 
 
+class VolumeQoSBulkItem(VolumeQoSApply):
+    """QoS limits for one volume in a bulk apply request."""
+
+    volume: str = Field(..., description="Volume name", min_length=1, max_length=64)
+
+    @field_validator("volume")
+    def validate_volume(cls, v: str) -> str:
+        if not _is_valid_name(v):
+            raise ValueError(
+                "Volume name must start with alphanumeric and contain only alphanumeric, dots, underscores, or hyphens"
+            )
+        return v
+
+
+class VolumeQoSBulkApply(BaseModel):
+    """Request model for applying QoS to many volumes at once."""
+
+    model_config = _REQUEST_MODEL_CONFIG
+
+    items: List[VolumeQoSBulkItem] = Field(..., description="Per-volume QoS limits", min_length=1)
+
+
 class VolumeQoS(BaseModel):
     """QoS settings response model."""
 
@@ -200,6 +261,14 @@ class VolumeQoSResponse(BaseModel):
     data: dict
 
 
+class VolumeQoSBulkResponse(BaseModel):
+    """Response model for bulk QoS application."""
+
+    request_id: str
+    status: str
+    data: dict
+
+
 class Volume(BaseModel):
     """Volume response model."""
 
@@ -236,15 +305,15 @@ class VolumeListResponse(BaseModel):
 class SnapshotCreate(BaseModel):
     """Request model for creating a snapshot."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     name: str = Field(..., description="Snapshot name", min_length=1, max_length=64)
     svm: str = Field(..., description="SVM name", min_length=1, max_length=64)
     volume: str = Field(..., description="Source volume name", min_length=1, max_length=64)
 
     @field_validator("name", "svm", "volume")
     def validate_name(cls, v: str) -> str:
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$", v):
+        if not _is_valid_name(v):
             raise ValueError(
                 "Name must start with alphanumeric and contain only alphanumeric, dots, underscores, or hyphens"
             )
@@ -254,6 +323,8 @@ class SnapshotCreate(BaseModel):
 class VolumeCloneCreate(BaseModel):
     """Request model for creating a volume from a snapshot."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     name: str = Field(..., description="New volume name", min_length=1, max_length=64)
     svm: str = Field(..., description="SVM name", min_length=1, max_length=64)
     snapshot: str = Field(..., description="Source snapshot name", min_length=1, max_length=64)
@@ -261,9 +332,7 @@ class VolumeCloneCreate(BaseModel):
 
     @field_validator("name", "svm", "snapshot")
     def validate_name(cls, v: str) -> str:
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$", v):
+        if not _is_valid_name(v):
             raise ValueError(
                 "Name must start with alphanumeric and contain only alphanumeric, dots, underscores, or hyphens"
             )
@@ -303,6 +372,8 @@ class SnapshotListResponse(BaseModel):
 class ExportCreate(BaseModel):
     """Request model for creating an export."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     svm: str = Field(..., description="SVM name")
     volume: str = Field(..., description="Volume name")
     client: str = Field(..., description="Client CIDR (e.g., 10.0.0.0/24)")
@@ -312,17 +383,17 @@ class ExportCreate(BaseModel):
 
     @field_validator("access")
     def validate_access(cls, v: str) -> str:
-        if v not in ["rw", "ro"]:
+        if v not in ("rw", "ro"):
             raise ValueError("Access must be 'rw' or 'ro'")
         return v
 
     @field_validator("client")
     def validate_client(cls, v: str) -> str:
-        import ipaddress
-
+        if _is_plain_ipv4_cidr(v):
+            return v
         try:
-            parts = v.split("/")
-            if len(parts) != 2:
+            # IPv4Network rejects extra slashes itself; only a bare address needs an explicit check.
+            if "/" not in v:
                 raise ValueError("CIDR must be in format IP/PREFIX")
             ipaddress.IPv4Network(v, strict=False)
         except Exception as e:
@@ -8,14 +8,55 @@ import argparse
 
 import uvicorn
 
+from arca_storage.api.services.cache import LIST_CACHE_TTL_SECONDS
 from arca_storage.cli.lib.config import load_config
 
+# Connections beyond this get an immediate 503 instead of queueing behind the service threadpool.
+DEFAULT_LIMIT_CONCURRENCY = 1024
+DEFAULT_BACKLOG = 2048
+# Longer than the usual 60s idle timeout of proxies/load balancers, so clients close first
+# and pooled connections are reused instead of being dropped mid-request.
+DEFAULT_KEEP_ALIVE_TIMEOUT = 75
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="arca-storage-api", description="Arca Storage REST API server")
     parser.add_argument("--host", default=None, help="Bind host (default: from config or 127.0.0.1)")
     parser.add_argument("--port", type=int, default=None, help="Bind port (default: from config or 8080)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes (default: from config or 1). Each worker caches list results, so with more than "
+            f"one worker a list may not show a change made through another worker for up to "
+            f"{LIST_CACHE_TTL_SECONDS:g}s"
+        ),
+    )
     parser.add_argument("--log-level", default="info", help="Uvicorn log level (default: info)")
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Enable per-request access logging (default: disabled)",
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=DEFAULT_LIMIT_CONCURRENCY,
+        help=f"Maximum concurrent connections before returning 503 (default: {DEFAULT_LIMIT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=DEFAULT_BACKLOG,
+        help=f"Listen socket backlog (default: {DEFAULT_BACKLOG})",
+    )
+    parser.add_argument(
+        "--timeout-keep-alive",
+        type=int,
+        default=DEFAULT_KEEP_ALIVE_TIMEOUT,
+        help=f"Seconds to keep idle connections open (default: {DEFAULT_KEEP_ALIVE_TIMEOUT})",
+    )
     return parser
 
 
@@ -24,5 +65,24 @@ def main(argv: list[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
     host = args.host or cfg.api_host
     port = args.port or cfg.api_port
-    uvicorn.run("arca_storage.api.main:app", host=host, port=port, log_level=args.log_level)
+    workers = max(1, args.workers or cfg.api_workers)
+    uvicorn.run(
+        "arca_storage.api.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        log_level=args.log_level,
+        # uvloop and httptools ship with uvicorn[standard]; name them explicitly so a
+        # missing extra fails at startup instead of silently falling back to asyncio/h11.
+        loop="uvloop",
+        http="httptools",
+        access_log=args.access_log,
+        proxy_headers=True,
+        limit_concurrency=args.limit_concurrency,
+        backlog=args.backlog,
+        timeout_keep_alive=args.timeout_keep_alive,
+        # The API has no websocket routes and does not advertise the server software.
+        ws="none",
+        server_header=False,
+    )
     return 0
@@ -0,0 +1,120 @@
+"""
+Short-lived in-process cache for list service results.
+
+List endpoints are read-heavy and each call re-reads and parses the JSON state
+files. Results are cached for a couple of seconds per (filters, limit, cursor)
+key, and every mutating service call invalidates its resource class so the API
+process never serves its own stale writes. Changes made by other processes
+(the `arca` CLI, or other API workers when running with `--workers` > 1)
+become visible once the TTL expires, so list endpoints only guarantee
+read-after-write with a single worker.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+LIST_CACHE_TTL_SECONDS = 2.0
+LIST_CACHE_MAXSIZE = 1024
+
+
+class ListCache:
+    """
+    Thread-safe LRU cache with a TTL and per-resource generation counters.
+    """
+
+    def __init__(self, ttl: float = LIST_CACHE_TTL_SECONDS, maxsize: int = LIST_CACHE_MAXSIZE) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, int, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    def get_or_compute(self, resource: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for (resource, key), computing it on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            generation = self._generations.get(resource, 0)
+            full_key = (resource, generation, key)
+            entry = self._entries.get(full_key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(full_key)
+                return entry[1]
+
+        # Compute outside the lock so slow state reads do not serialize other lookups.
+        value = compute()
+
+        with self._lock:
+            # Drop the result if the resource was invalidated while it was being computed.
+            if self._generations.get(resource, 0) == generation:
+                self._entries[full_key] = (now + self._ttl, value)
+                self._entries.move_to_end(full_key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, resource: str) -> None:
+        """
+        Discard every cached result for a resource class.
+        """
+        with self._lock:
+            self._generations[resource] = self._generations.get(resource, 0) + 1
+            for full_key in [k for k in self._entries if k[0] == resource]:
+                del self._entries[full_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            for resource in list(self._generations):
+                self._generations[resource] += 1
+            self._entries.clear()
+
+
+list_cache = ListCache()
+
+
+def cached_list(resource: str) -> Callable[[F], F]:
+    """
+    Cache a list service function's results under `resource`.
+
+    The cache key is the call's positional and keyword arguments.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            return list_cache.get_or_compute(resource, key, lambda: func(*args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidates(*resources: str) -> Callable[[F], F]:
+    """
+    Invalidate cached lists for `resources` after a mutating service call.
+
+    Invalidation also runs when the call fails, since it may have changed state
+    before raising.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                for resource in resources:
+                    list_cache.invalidate(resource)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
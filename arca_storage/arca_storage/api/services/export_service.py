@@ -2,20 +2,20 @@
 Export service layer.
 """
 
-import json
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from arca_storage.api.models import ExportCreate, ExportStatus
+from arca_storage.api.services.cache import cached_list, invalidates
+from arca_storage.api.services.pagination import paginate
 from arca_storage.cli.lib.ganesha import add_export as ganesha_add_export
-from arca_storage.cli.lib.ganesha import list_exports as ganesha_list_exports
+from arca_storage.cli.lib.ganesha import iter_exports as ganesha_iter_exports
 from arca_storage.cli.lib.ganesha import remove_export as ganesha_remove_export
+from arca_storage.cli.lib.state import utc_now
 from arca_storage.cli.lib.validators import validate_ip_cidr, validate_name
-from arca_storage.cli.lib.config import load_config
-from arca_storage.cli.lib.state import get_state_dir
 
 
+@invalidates("exports")
 def add_export(export_data: ExportCreate) -> Dict[str, Any]:
     """
     Add an NFS export.
@@ -31,7 +31,7 @@ def add_export(export_data: ExportCreate) -> Dict[str, Any]:
     validate_ip_cidr(export_data.client)
 
     # Add export to configuration
-    ganesha_add_export(
+    export_entry = ganesha_add_export(
         export_data.svm,
         export_data.volume,
         export_data.client,
@@ -40,27 +40,6 @@ def add_export(export_data: ExportCreate) -> Dict[str, Any]:
         export_data.sec,
     )
 
-    # Load exports to get export_id
-    state_dir = get_state_dir()
-    state_file = state_dir / f"exports.{export_data.svm}.json"
-    if state_file.exists():
-        with open(state_file, "r") as f:
-            exports = json.load(f)
-    else:
-        exports = []
-    export_entry = next(
-        (
-            e
-            for e in exports
-            if e.get("client") == export_data.client
-            and e.get("path") == f"{load_config().export_dir.rstrip('/')}/{export_data.svm}/{export_data.volume}"
-        ),
-        None,
-    )
-
-    if not export_entry:
-        raise RuntimeError("Failed to create export")
-
     return {
         "svm": export_data.svm,
         "volume": export_data.volume,
@@ -71,10 +50,11 @@ def add_export(export_data: ExportCreate) -> Dict[str, Any]:
         "pseudo": export_entry.get("pseudo", f"/exports/{export_data.svm}/{export_data.volume}"),
         "export_id": export_entry.get("export_id", 0),
         "status": ExportStatus.AVAILABLE.value,
-        "created_at": datetime.utcnow(),
+        "created_at": utc_now(),
     }
 
 
+@invalidates("exports")
 def remove_export(svm: str, volume: str, client: str) -> None:
     """
     Remove an NFS export.
@@ -91,6 +71,7 @@ def remove_export(svm: str, volume: str, client: str) -> None:
     ganesha_remove_export(svm, volume, client)
 
 
+@cached_list("exports")
 def list_exports(
     svm: Optional[str] = None,
     volume: Optional[str] = None,
@@ -110,8 +91,16 @@ def list_exports(
 
     Returns:
         Dictionary with items and next_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
     """
-    items = ganesha_list_exports(svm_name=svm, volume_name=volume)
+    # iter_exports yields in (svm, export_id) order and reads per-SVM files lazily.
+    items = ganesha_iter_exports(svm_name=svm, volume_name=volume)
     if client:
-        items = [i for i in items if i.get("client") == client]
-    return {"items": items[:limit], "next_cursor": None}
+        items = (i for i in items if i.get("client") == client)
+    return paginate(items, _export_key, limit, cursor)
+
+
+def _export_key(export: Dict[str, Any]) -> Tuple[str, int]:
+    return (export.get("svm", ""), int(export.get("export_id") or 0))
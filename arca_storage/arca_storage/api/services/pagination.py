@@ -0,0 +1,80 @@
+"""
+Cursor-based pagination for list services.
+
+State files keep their items sorted by a natural key (e.g. `(svm, name)` for
+volumes), so that sort order acts as the index: a cursor is the opaque encoding
+of the last key on the previous page and the next page starts right after it.
+Unlike offset pagination, this keeps pages stable while items are created or
+deleted between requests.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from itertools import dropwhile, islice
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """
+    Encode a sort key as an opaque, URL-safe cursor string.
+    """
+    raw = json.dumps(list(key), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid pagination cursor: {e}")
+    if not isinstance(key, list) or not key:
+        raise ValueError("Invalid pagination cursor")
+    return tuple(key)
+
+
+def paginate(
+    items: Iterable[Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], Tuple[Any, ...]],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Return one page of `items` in the `{"items", "next_cursor"}` service shape.
+
+    Args:
+        items: Items already ordered by `key`
+        key: Function returning the sort key of an item
+        limit: Maximum number of items in the page
+        cursor: Cursor returned with the previous page (optional)
+
+    Returns:
+        Dictionary with items and next_cursor (None on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    it = iter(items)
+    if cursor:
+        after = decode_cursor(cursor)
+        it = dropwhile(lambda item: key(item) <= after, it)
+
+    try:
+        page = list(islice(it, limit + 1))
+    except TypeError:
+        # Cursor key does not compare against this listing's keys.
+        raise ValueError("Invalid pagination cursor")
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(key(page[-1]))
+    return {"items": page, "next_cursor": next_cursor}
@@ -5,15 +5,21 @@ QoS (Quality of Service) management using cgroups v2 I/O Controller.
 from __future__ import annotations
 
 import os
-import subprocess
+import re
+import stat
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from arca_storage.cli.lib.config import load_config
-from arca_storage.cli.lib.state import list_volumes as state_list_volumes
+from arca_storage.cli.lib.state import get_volume as state_get_volume
 from arca_storage.cli.lib.validators import validate_name
 
 
+# io.max key -> QoS settings field
+_IO_MAX_SETTINGS = {"rbps": "read_bps", "wbps": "write_bps", "riops": "read_iops", "wiops": "write_iops"}
+_IO_MAX_LIMIT_RE = re.compile(r"\b(rbps|wbps|riops|wiops)=(\d+)\b")
+
+
 def _get_cgroup_base() -> Path:
     """
     Get the base cgroup path for ARCA Storage.
@@ -38,6 +44,21 @@ def _get_cgroup_path(svm: str, volume: str) -> Path:
     return _get_cgroup_base() / f"svm_{svm}" / f"vol_{volume}"
 
 
+def _make_dir(path: Path) -> None:
+    """
+    Create a directory if it is missing.
+
+    A bare mkdir(2) is tried first, so the common already-exists case costs
+    one syscall (`Path.mkdir(exist_ok=True)` adds a stat on EEXIST).
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+
+
 def _ensure_cgroup_hierarchy() -> None:
     """
     Ensure the base cgroup hierarchy exists.
@@ -49,11 +70,10 @@ def _ensure_cgroup_hierarchy() -> None:
     """
     base_path = _get_cgroup_base()
 
-    if not base_path.exists():
-        try:
-            base_path.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            raise RuntimeError(f"Failed to create cgroup base directory: {e}")
+    try:
+        _make_dir(base_path)
+    except Exception as e:
+        raise RuntimeError(f"Failed to create cgroup base directory: {e}")
 
 
 def _get_device_id(lv_path: str) -> str:
@@ -70,32 +90,25 @@ def _get_device_id(lv_path: str) -> str:
         RuntimeError: If device ID cannot be determined
     """
     try:
-        # Use stat to get device numbers
-        result = subprocess.run(
-            ["stat", "--format=%t:%T", lv_path],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Follows the /dev/<vg>/<lv> symlink to the device-mapper node.
+        st = os.stat(lv_path)
+    except OSError as e:
+        raise RuntimeError(f"Failed to get device ID for {lv_path}: {e}")
 
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to stat device {lv_path}: {result.stderr}")
+    if not stat.S_ISBLK(st.st_mode):
+        raise RuntimeError(f"Failed to get device ID for {lv_path}: not a block device")
 
-        # Convert hex to decimal
-        hex_major, hex_minor = result.stdout.strip().split(":")
-        major = int(hex_major, 16)
-        minor = int(hex_minor, 16)
-
-        return f"{major}:{minor}"
-
-    except Exception as e:
-        raise RuntimeError(f"Failed to get device ID for {lv_path}: {e}")
+    return f"{os.major(st.st_rdev)}:{os.minor(st.st_rdev)}"
 
 
 def _write_cgroup_file(cgroup_path: Path, filename: str, content: str) -> None:
     """
     Write content to a cgroup file.
 
+    The content is written with a single write(2) on a raw descriptor; cgroup
+    control files parse each write separately, and this skips the text-file
+    wrapper and its buffering.
+
     Args:
         cgroup_path: Path to cgroup directory
         filename: Name of the file to write
@@ -107,65 +120,57 @@ def _write_cgroup_file(cgroup_path: Path, filename: str, content: str) -> None:
     file_path = cgroup_path / filename
 
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
     except Exception as e:
         raise RuntimeError(f"Failed to write to {file_path}: {e}")
 
 
-def apply_qos_to_volume(
+def _lookup_lv_path(svm: str, volume: str) -> str:
+    """
+    Return the lv_path of a volume from state.
+
+    Raises:
+        RuntimeError: If the volume is missing or has no lv_path
+    """
+    record = state_get_volume(svm, volume)
+    if record is None:
+        raise RuntimeError(f"Volume {volume} not found in SVM {svm}")
+
+    lv_path = record.get("lv_path")
+    if not lv_path:
+        raise RuntimeError(f"Volume {volume} has no lv_path in state")
+    return lv_path
+
+
+def _apply_io_max(
     svm: str,
     volume: str,
+    device_id: str,
     read_iops: Optional[int] = None,
     write_iops: Optional[int] = None,
     read_bps: Optional[int] = None,
     write_bps: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
-    Apply QoS limits to a volume using cgroups v2 I/O Controller.
+    Create the volume cgroup if needed and write its io.max limits.
 
-    Args:
-        svm: SVM name
-        volume: Volume name
-        read_iops: Read IOPS limit (optional)
-        write_iops: Write IOPS limit (optional)
-        read_bps: Read bandwidth limit in bytes/sec (optional)
-        write_bps: Write bandwidth limit in bytes/sec (optional)
+    The base cgroup hierarchy must already exist and `device_id` must already
+    be resolved (see `_get_device_id`).
 
     Returns:
         Dictionary with applied QoS settings
-
-    Raises:
-        RuntimeError: If QoS application fails
     """
-    validate_name(svm)
-    validate_name(volume)
-
-    # Find volume in state
-    volumes = state_list_volumes(svm=svm, name=volume)
-    if not volumes:
-        raise RuntimeError(f"Volume {volume} not found in SVM {svm}")
-
-    volume_info = volumes[0]
-    lv_path = volume_info.get("lv_path")
-
-    if not lv_path:
-        raise RuntimeError(f"Volume {volume} has no lv_path in state")
-
-    # Ensure base cgroup hierarchy exists
-    _ensure_cgroup_hierarchy()
-
     # Create cgroup for this volume
     cgroup_path = _get_cgroup_path(svm, volume)
 
-    if not cgroup_path.exists():
-        try:
-            cgroup_path.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            raise RuntimeError(f"Failed to create cgroup {cgroup_path}: {e}")
-
-    # Get device ID
-    device_id = _get_device_id(lv_path)
+    try:
+        _make_dir(cgroup_path)
+    except Exception as e:
+        raise RuntimeError(f"Failed to create cgroup {cgroup_path}: {e}")
 
     # Apply I/O limits using io.max
     # Format: <major>:<minor> rbps=<bytes> wbps=<bytes> riops=<iops> wiops=<iops>
@@ -215,6 +220,80 @@ def apply_qos_to_volume(
     return qos_settings
 
 
+def apply_qos_to_volume(
+    svm: str,
+    volume: str,
+    read_iops: Optional[int] = None,
+    write_iops: Optional[int] = None,
+    read_bps: Optional[int] = None,
+    write_bps: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Apply QoS limits to a volume using cgroups v2 I/O Controller.
+
+    Args:
+        svm: SVM name
+        volume: Volume name
+        read_iops: Read IOPS limit (optional)
+        write_iops: Write IOPS limit (optional)
+        read_bps: Read bandwidth limit in bytes/sec (optional)
+        write_bps: Write bandwidth limit in bytes/sec (optional)
+
+    Returns:
+        Dictionary with applied QoS settings
+
+    Raises:
+        RuntimeError: If QoS application fails
+    """
+    validate_name(svm)
+    validate_name(volume)
+
+    # Find volume in state
+    lv_path = _lookup_lv_path(svm, volume)
+    device_id = _get_device_id(lv_path)
+
+    # Ensure base cgroup hierarchy exists
+    _ensure_cgroup_hierarchy()
+
+    return _apply_io_max(svm, volume, device_id, read_iops, write_iops, read_bps, write_bps)
+
+
+def apply_qos_bulk(specs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Apply QoS limits to many volumes.
+
+    Equivalent to calling `apply_qos_to_volume` for each spec, but the base
+    cgroup hierarchy is checked once. Every spec is validated and its volume
+    and device ID resolved before any cgroup or io.max file is written, so a
+    resolution failure leaves all volumes untouched. Writes are applied in
+    order and not rolled back: if one fails, earlier specs keep their new
+    limits.
+
+    Args:
+        specs: Dictionaries with the keyword arguments of `apply_qos_to_volume`
+            (`svm`, `volume` and optional `read_iops`, `write_iops`,
+            `read_bps`, `write_bps`)
+
+    Returns:
+        List of applied QoS settings, in the order of `specs`
+
+    Raises:
+        RuntimeError: If a volume or its device cannot be resolved, or QoS
+            application fails
+    """
+    specs = list(specs)
+    for spec in specs:
+        validate_name(spec["svm"])
+        validate_name(spec["volume"])
+
+    lv_paths = [_lookup_lv_path(spec["svm"], spec["volume"]) for spec in specs]
+    device_ids = [_get_device_id(lv_path) for lv_path in lv_paths]
+
+    _ensure_cgroup_hierarchy()
+
+    return [_apply_io_max(device_id=device_id, **spec) for spec, device_id in zip(specs, device_ids)]
+
+
 def remove_qos_from_volume(svm: str, volume: str) -> None:
     """
     Remove QoS limits from a volume.
@@ -230,15 +309,7 @@ def remove_qos_from_volume(svm: str, volume: str) -> None:
     validate_name(volume)
 
     # Find volume in state
-    volumes = state_list_volumes(svm=svm, name=volume)
-    if not volumes:
-        raise RuntimeError(f"Volume {volume} not found in SVM {svm}")
-
-    volume_info = volumes[0]
-    lv_path = volume_info.get("lv_path")
-
-    if not lv_path:
-        raise RuntimeError(f"Volume {volume} has no lv_path in state")
+    lv_path = _lookup_lv_path(svm, volume)
 
     # Get cgroup path
     cgroup_path = _get_cgroup_path(svm, volume)
@@ -276,45 +347,29 @@ def get_qos_settings(svm: str, volume: str) -> Dict[str, Any]:
     validate_name(volume)
 
     # Find volume in state
-    volumes = state_list_volumes(svm=svm, name=volume)
-    if not volumes:
-        raise RuntimeError(f"Volume {volume} not found in SVM {svm}")
-
-    volume_info = volumes[0]
-    lv_path = volume_info.get("lv_path")
-
-    if not lv_path:
-        raise RuntimeError(f"Volume {volume} has no lv_path in state")
+    lv_path = _lookup_lv_path(svm, volume)
 
     # Get cgroup path
     cgroup_path = _get_cgroup_path(svm, volume)
 
-    if not cgroup_path.exists():
-        return {
-            "svm": svm,
-            "volume": volume,
-            "qos_enabled": False,
-        }
-
-    # Get device ID
-    device_id = _get_device_id(lv_path)
-
-    # Read io.max
+    # Read io.max; a missing cgroup or file means no QoS has been applied
     io_max_file = cgroup_path / "io.max"
 
-    if not io_max_file.exists():
+    try:
+        with open(io_max_file, "r", encoding="utf-8") as f:
+            io_max_content = f.read().strip()
+    except FileNotFoundError:
         return {
             "svm": svm,
             "volume": volume,
             "qos_enabled": False,
         }
-
-    try:
-        with open(io_max_file, "r", encoding="utf-8") as f:
-            io_max_content = f.read().strip()
     except Exception as e:
         raise RuntimeError(f"Failed to read {io_max_file}: {e}")
 
+    # Get device ID
+    device_id = _get_device_id(lv_path)
+
     # Parse io.max content
     # Format: <major>:<minor> rbps=<bytes> wbps=<bytes> riops=<iops> wiops=<iops>
     settings = {
@@ -325,25 +380,12 @@ def get_qos_settings(svm: str, volume: str) -> Dict[str, Any]:
         "cgroup_path": str(cgroup_path),
     }
 
-    for line in io_max_content.split("\n"):
-        if not line or not line.startswith(device_id):
+    for line in io_max_content.splitlines():
+        line_device, _, limits = line.partition(" ")
+        if line_device != device_id:
             continue
-
-        parts = line.split()
-        for part in parts[1:]:  # Skip device_id
-            if "=" in part:
-                key, value = part.split("=", 1)
-
-                if value == "max":
-                    continue
-
-                if key == "rbps":
-                    settings["read_bps"] = int(value)
-                elif key == "wbps":
-                    settings["write_bps"] = int(value)
-                elif key == "riops":
-                    settings["read_iops"] = int(value)
-                elif key == "wiops":
-                    settings["write_iops"] = int(value)
+        # "max" values do not match the pattern and are left unset.
+        for m in _IO_MAX_LIMIT_RE.finditer(limits):
+            settings[_IO_MAX_SETTINGS[m.group(1)]] = int(m.group(2))
 
     return settings
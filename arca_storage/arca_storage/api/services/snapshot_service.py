@@ -2,20 +2,25 @@
 Snapshot service layer.
 """
 
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from arca_storage.api.models import SnapshotCreate, SnapshotStatus, VolumeCloneCreate
+from arca_storage.api.services.cache import cached_list, invalidates
+from arca_storage.api.services.pagination import paginate
+from arca_storage.cli.lib import names
 from arca_storage.cli.lib.lvm import create_lv, create_snapshot_lv, delete_snapshot_lv
 from arca_storage.cli.lib.state import delete_snapshot as state_delete_snapshot
+from arca_storage.cli.lib.state import iter_snapshots as state_iter_snapshots
 from arca_storage.cli.lib.state import list_snapshots as state_list_snapshots
 from arca_storage.cli.lib.state import upsert_snapshot as state_upsert_snapshot
 from arca_storage.cli.lib.state import upsert_volume as state_upsert_volume
+from arca_storage.cli.lib.state import utc_now
 from arca_storage.cli.lib.validators import validate_name
 from arca_storage.cli.lib.xfs import format_xfs, mount_xfs
 from arca_storage.cli.lib.config import load_config
 
 
+@invalidates("snapshots")
 def create_snapshot(snapshot_data: SnapshotCreate) -> Dict[str, Any]:
     """
     Create a snapshot of a volume.
@@ -36,9 +41,8 @@ def create_snapshot(snapshot_data: SnapshotCreate) -> Dict[str, Any]:
     cfg = load_config()
     vg_name = cfg.vg_name
 
-    # LV naming: vol_{svm}_{volume}_snap_{snapshot_name}
-    source_lv = f"vol_{snapshot_data.svm}_{snapshot_data.volume}"
-    snap_lv = f"vol_{snapshot_data.svm}_{snapshot_data.volume}_snap_{snapshot_data.name}"
+    source_lv = names.lv_name(snapshot_data.svm, snapshot_data.volume)
+    snap_lv = names.snapshot_lv_name(snapshot_data.svm, snapshot_data.volume, snapshot_data.name)
 
     # Create thin snapshot
     snap_path = create_snapshot_lv(vg_name, source_lv, snap_lv)
@@ -50,19 +54,15 @@ def create_snapshot(snapshot_data: SnapshotCreate) -> Dict[str, Any]:
         "lv_path": snap_path,
         "lv_name": snap_lv,
         "status": SnapshotStatus.AVAILABLE.value,
-        "created_at": datetime.utcnow(),
+        "created_at": utc_now(),
     }
 
-    state_upsert_snapshot(
-        {
-            **record,
-            "created_at": record["created_at"].isoformat(),
-        }
-    )
+    state_upsert_snapshot(record)
 
     return record
 
 
+@invalidates("snapshots")
 def delete_snapshot(name: str, svm: str, volume: str, force: bool = False) -> None:
     """
     Delete a snapshot.
@@ -83,7 +83,7 @@ def delete_snapshot(name: str, svm: str, volume: str, force: bool = False) -> No
     cfg = load_config()
     vg_name = cfg.vg_name
 
-    snap_lv = f"vol_{svm}_{volume}_snap_{name}"
+    snap_lv = names.snapshot_lv_name(svm, volume, name)
 
     # Delete snapshot LV
     delete_snapshot_lv(vg_name, snap_lv)
@@ -92,6 +92,7 @@ def delete_snapshot(name: str, svm: str, volume: str, force: bool = False) -> No
     state_delete_snapshot(svm, volume, name)
 
 
+@invalidates("volumes")
 def clone_volume_from_snapshot(clone_data: VolumeCloneCreate) -> Dict[str, Any]:
     """
     Create a new volume from a snapshot (clone).
@@ -116,8 +117,7 @@ def clone_volume_from_snapshot(clone_data: VolumeCloneCreate) -> Dict[str, Any]:
 
     cfg = load_config()
     vg_name = cfg.vg_name
-    export_dir = cfg.export_dir.rstrip("/")
-    mount_path = f"{export_dir}/{clone_data.svm}/{clone_data.name}"
+    mount_path = names.mount_path(cfg.export_dir, clone_data.svm, clone_data.name)
 
     # Find the snapshot to clone from
     snapshots = state_list_snapshots(svm=clone_data.svm, name=clone_data.snapshot)
@@ -128,11 +128,11 @@ def clone_volume_from_snapshot(clone_data: VolumeCloneCreate) -> Dict[str, Any]:
     source_volume = snapshot["volume"]
 
     # Snapshot LV name
-    snap_lv = f"vol_{clone_data.svm}_{source_volume}_snap_{clone_data.snapshot}"
+    snap_lv = names.snapshot_lv_name(clone_data.svm, source_volume, clone_data.snapshot)
     snap_path = f"/dev/{vg_name}/{snap_lv}"
 
     # New volume LV name
-    new_lv = f"vol_{clone_data.svm}_{clone_data.name}"
+    new_lv = names.lv_name(clone_data.svm, clone_data.name)
 
     # Determine size (use snapshot size if not specified)
     if clone_data.size_gib:
@@ -164,14 +164,15 @@ def clone_volume_from_snapshot(clone_data: VolumeCloneCreate) -> Dict[str, Any]:
         "lv_path": clone_lv_path,
         "lv_name": new_lv,
         "status": "available",
-        "created_at": datetime.utcnow(),
+        "created_at": utc_now(),
     }
 
-    state_upsert_volume({**record, "created_at": record["created_at"].isoformat()})
+    state_upsert_volume(record)
 
     return record
 
 
+@cached_list("snapshots")
 def list_snapshots(
     svm: Optional[str] = None,
     volume: Optional[str] = None,
@@ -191,6 +192,10 @@ def list_snapshots(
 
     Returns:
         Dictionary with items and next_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
     """
-    items = state_list_snapshots(svm=svm, volume=volume, name=name)
-    return {"items": items[:limit], "next_cursor": None}
+    # snapshots.json is kept sorted by (svm, volume, name).
+    items = state_iter_snapshots(svm=svm, volume=volume, name=name)
+    return paginate(items, lambda s: (s.get("svm", ""), s.get("volume", ""), s.get("name", "")), limit, cursor)
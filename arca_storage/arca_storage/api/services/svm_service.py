@@ -2,16 +2,19 @@
 SVM service layer.
 """
 
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from arca_storage.api.models import SVMCreate, SVMStatus
-from arca_storage.cli.lib.ganesha import render_config
-from arca_storage.cli.lib.netns import attach_vlan, create_namespace, delete_namespace, allocate_vlan_ifname
+from arca_storage.api.services.cache import cached_list, invalidates
+from arca_storage.api.services.pagination import paginate
+from arca_storage.cli.lib import names
+from arca_storage.cli.lib.netns import delete_namespace, allocate_vlan_ifname
 from arca_storage.cli.lib.pacemaker import create_group, delete_group
+from arca_storage.cli.lib.provision import create_svm_resources
 from arca_storage.cli.lib.state import delete_svm as state_delete_svm
-from arca_storage.cli.lib.state import list_svms as state_list_svms
+from arca_storage.cli.lib.state import iter_svms as state_iter_svms
 from arca_storage.cli.lib.state import upsert_svm as state_upsert_svm
+from arca_storage.cli.lib.state import utc_now
 from arca_storage.cli.lib.systemd import stop_unit
 from arca_storage.cli.lib.validators import (
     infer_gateway_from_ip_cidr,
@@ -20,11 +23,10 @@ from arca_storage.cli.lib.validators import (
     validate_name,
     validate_vlan,
 )
-from arca_storage.cli.lib.lvm import create_lv
-from arca_storage.cli.lib.xfs import format_xfs
 from arca_storage.cli.lib.config import load_config
 
 
+@invalidates("svms")
 def create_svm(svm_data: SVMCreate) -> Dict[str, Any]:
     """
     Create a new SVM.
@@ -43,48 +45,27 @@ def create_svm(svm_data: SVMCreate) -> Dict[str, Any]:
         validate_ipv4(svm_data.gateway)
     gateway_ip = svm_data.gateway or infer_gateway_from_ip_cidr(svm_data.ip_cidr)
 
-    # Create namespace
-    create_namespace(svm_data.name)
-
-    # Attach VLAN
     cfg = load_config()
     vlan_ifname = allocate_vlan_ifname(svm_data.name, svm_data.vlan_id)
-    attach_vlan(
+
+    # The root LV overlaps the namespace/VLAN setup; a failed step leaves no
+    # root LV or ganesha config behind (see create_svm_resources).
+    create_svm_resources(
         svm_data.name,
         cfg.parent_if,
         svm_data.vlan_id,
         svm_data.ip_cidr,
         gateway_ip,
         svm_data.mtu,
-        ifname=vlan_ifname,
+        vlan_ifname,
+        svm_data.root_volume_size_gib,
+        cfg,
     )
 
-    # Generate ganesha config
-    render_config(svm_data.name, [])
-
-    # Optional root LV (for Pacemaker Filesystem resource)
-    if svm_data.root_volume_size_gib:
-        vg_name = cfg.vg_name
-        lv_name = f"vol_{svm_data.name}"
-        try:
-            lv_path = create_lv(
-                vg_name,
-                lv_name,
-                svm_data.root_volume_size_gib,
-                thin=True,
-                thinpool_name=cfg.thinpool_name,
-            )
-            format_xfs(lv_path)
-        except Exception as e:
-            if "already exists" not in str(e).lower():
-                raise
-
-    export_dir = cfg.export_dir.rstrip("/")
-
     # Create Pacemaker resource group
     create_group(
         svm_data.name,
-        f"{export_dir}/{svm_data.name}",
+        names.svm_path(cfg.export_dir, svm_data.name),
         vlan_id=svm_data.vlan_id,
         ifname=vlan_ifname,
         ip=ip_addr,
@@ -97,6 +78,7 @@ def create_svm(svm_data: SVMCreate) -> Dict[str, Any]:
         create_filesystem=bool(svm_data.root_volume_size_gib),
     )
 
+    created_at = utc_now()
     state_upsert_svm(
         {
             "name": svm_data.name,
@@ -108,6 +90,7 @@ def create_svm(svm_data: SVMCreate) -> Dict[str, Any]:
             "vip": ip_addr,
             "ifname": vlan_ifname,
             "status": SVMStatus.AVAILABLE.value,
+            "created_at": created_at,
         }
     )
 
@@ -121,10 +104,11 @@ def create_svm(svm_data: SVMCreate) -> Dict[str, Any]:
         "namespace": svm_data.name,
         "vip": ip_addr,
         "status": SVMStatus.AVAILABLE.value,
-        "created_at": datetime.utcnow(),
+        "created_at": created_at,
     }
 
 
+@cached_list("svms")
 def list_svms(name: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
     """
     List SVMs.
@@ -136,11 +120,16 @@ def list_svms(name: Optional[str] = None, limit: int = 100, cursor: Optional[str
 
     Returns:
         Dictionary with items and next_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
     """
-    items = state_list_svms(name=name)
-    return {"items": items[:limit], "next_cursor": None}
+    # svms.json is kept sorted by name.
+    items = state_iter_svms(name=name)
+    return paginate(items, lambda s: (s.get("name", ""),), limit, cursor)
 
 
+@invalidates("svms")
 def delete_svm(name: str, force: bool = False, delete_volumes: bool = False) -> None:
     """
     Delete an SVM.
@@ -2,19 +2,23 @@
 Volume service layer.
 """
 
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from arca_storage.api.models import VolumeCreate, VolumeStatus
+from arca_storage.api.services.cache import cached_list, invalidates
+from arca_storage.api.services.pagination import paginate
+from arca_storage.cli.lib import names
 from arca_storage.cli.lib.lvm import create_lv, delete_lv, resize_lv
 from arca_storage.cli.lib.state import delete_volume as state_delete_volume
-from arca_storage.cli.lib.state import list_volumes as state_list_volumes
+from arca_storage.cli.lib.state import iter_volumes as state_iter_volumes
 from arca_storage.cli.lib.state import upsert_volume as state_upsert_volume
+from arca_storage.cli.lib.state import utc_now
 from arca_storage.cli.lib.validators import validate_name
 from arca_storage.cli.lib.xfs import format_xfs, grow_xfs, mount_xfs, umount_xfs
 from arca_storage.cli.lib.config import load_config
 
 
+@invalidates("volumes")
 def create_volume(volume_data: VolumeCreate) -> Dict[str, Any]:
     """
     Create a new volume.
@@ -30,9 +34,8 @@ def create_volume(volume_data: VolumeCreate) -> Dict[str, Any]:
 
     cfg = load_config()
     vg_name = cfg.vg_name
-    export_dir = cfg.export_dir.rstrip("/")
-    mount_path = f"{export_dir}/{volume_data.svm}/{volume_data.name}"
-    lv_name = f"vol_{volume_data.svm}_{volume_data.name}"
+    mount_path = names.mount_path(cfg.export_dir, volume_data.svm, volume_data.name)
+    lv_name = names.lv_name(volume_data.svm, volume_data.name)
 
     # Create LV
     lv_path = create_lv(
@@ -59,17 +62,13 @@ def create_volume(volume_data: VolumeCreate) -> Dict[str, Any]:
         "lv_path": lv_path,
         "lv_name": lv_name,
         "status": VolumeStatus.AVAILABLE.value,
-        "created_at": datetime.utcnow(),
+        "created_at": utc_now(),
     }
-    state_upsert_volume(
-        {
-            **record,
-            "created_at": record["created_at"].isoformat(),
-        }
-    )
+    state_upsert_volume(record)
     return record
 
 
+@invalidates("volumes")
 def resize_volume(name: str, svm: str, new_size_gib: int) -> Dict[str, Any]:
     """
     Resize a volume.
@@ -87,9 +86,8 @@ def resize_volume(name: str, svm: str, new_size_gib: int) -> Dict[str, Any]:
 
     cfg = load_config()
     vg_name = cfg.vg_name
-    export_dir = cfg.export_dir.rstrip("/")
-    mount_path = f"{export_dir}/{svm}/{name}"
-    lv_name = f"vol_{svm}_{name}"
+    mount_path = names.mount_path(cfg.export_dir, svm, name)
+    lv_name = names.lv_name(svm, name)
 
     # Resize LV
     resize_lv(vg_name, lv_name, new_size_gib)
@@ -107,12 +105,13 @@ def resize_volume(name: str, svm: str, new_size_gib: int) -> Dict[str, Any]:
         "lv_path": f"/dev/{vg_name}/{lv_name}",
         "lv_name": lv_name,
         "status": VolumeStatus.AVAILABLE.value,
-        "created_at": datetime.utcnow(),
+        "created_at": utc_now(),
     }
-    state_upsert_volume({**record, "created_at": record["created_at"].isoformat()})
+    state_upsert_volume(record)
     return record
 
 
+@invalidates("volumes")
 def delete_volume(name: str, svm: str, force: bool = False) -> None:
     """
     Delete a volume.
@@ -127,9 +126,8 @@ def delete_volume(name: str, svm: str, force: bool = False) -> None:
 
     cfg = load_config()
     vg_name = cfg.vg_name
-    export_dir = cfg.export_dir.rstrip("/")
-    mount_path = f"{export_dir}/{svm}/{name}"
-    lv_name = f"vol_{svm}_{name}"
+    mount_path = names.mount_path(cfg.export_dir, svm, name)
+    lv_name = names.lv_name(svm, name)
 
     # Unmount
     umount_xfs(mount_path)
@@ -140,6 +138,7 @@ def delete_volume(name: str, svm: str, force: bool = False) -> None:
     state_delete_volume(svm, name)
 
 
+@cached_list("volumes")
 def list_volumes(
     svm: Optional[str] = None, name: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -154,6 +153,10 @@ def list_volumes(
 
     Returns:
         Dictionary with items and next_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
     """
-    items = state_list_volumes(svm=svm, name=name)
-    return {"items": items[:limit], "next_cursor": None}
+    # volumes.json is kept sorted by (svm, name).
+    items = state_iter_volumes(svm=svm, name=name)
+    return paginate(items, lambda v: (v.get("svm", ""), v.get("name", "")), limit, cursor)
@@ -4,30 +4,59 @@ Bootstrap commands for initial setup without Ansible.
 
 from __future__ import annotations
 
+import filecmp
 import os
 import shutil
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 
 import typer
 
-from arca_storage.cli.lib.config import load_config
+from arca_storage.cli.lib.config import clear_config_cache, load_config
 
 app = typer.Typer(help="Bootstrap initial system/cluster configuration")
 
 
+_DRBD_RES_TEMPLATE = """\
+resource {resource} {{
+  protocol C;
+  meta-disk internal;
+
+  on {node1} {{
+    device {device};
+    disk {disk};
+    address {node1_ip}:{port};
+  }}
+  on {node2} {{
+    device {device};
+    disk {disk};
+    address {node2_ip}:{port};
+  }}
+}}
+"""
+
+
 def _run(cmd: list[str], *, check: bool = True) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, capture_output=True, text=True, check=check)
+    return subprocess.run(cmd, capture_output=True, text=True, check=check, close_fds=False)
+
+
+def _run_rc(cmd: list[str]) -> int:
+    """Run an existence/status probe whose output is never read; return its exit code."""
+    return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False).returncode
 
 
 def _run_shell(command: str) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(["bash", "-lc", command], capture_output=True, text=True, check=True)
+    return subprocess.run(["bash", "-lc", command], capture_output=True, text=True, check=True, close_fds=False)
+
+
+# arca_storage/cli/commands/bootstrap.py -> arca_storage/resources/
+_RESOURCES_ROOT = Path(__file__).resolve().parents[2] / "resources"
 
 
 def _resource_path(*parts: str) -> Path:
-    # arca_storage/cli/commands/bootstrap.py -> arca_storage/resources/...
-    return Path(__file__).resolve().parents[2] / "resources" / Path(*parts)
+    return _RESOURCES_ROOT.joinpath(*parts)
 
 
 def _render_env(cfg) -> str:
@@ -43,12 +72,69 @@ def _render_env(cfg) -> str:
     return "\n".join(lines) + "\n"
 
 
-def _write_env_file(cfg) -> Path:
-    env_dst_dir = Path("/etc/arca-storage")
-    env_dst_dir.mkdir(parents=True, exist_ok=True)
-    env_dst = env_dst_dir / "arca-storage.env"
-    env_dst.write_text(_render_env(cfg), encoding="utf-8")
-    return env_dst
+def _copy_if_missing(src: Path, dst: Path) -> bool:
+    """
+    Copy src to dst (with metadata, like shutil.copy2) only if dst does not exist.
+
+    dst is created with O_EXCL, so the check and the copy are one atomic step.
+    A missing src is skipped. Returns True if dst was written.
+    """
+    try:
+        fsrc = open(src, "rb")
+    except FileNotFoundError:
+        return False
+    with fsrc:
+        try:
+            fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC, 0o600)
+        except FileExistsError:
+            return False
+        try:
+            with os.fdopen(fd, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst)
+            shutil.copystat(src, dst)
+        except BaseException:
+            # Never leave a partial file behind: it would be skipped as "already installed" next time.
+            dst.unlink(missing_ok=True)
+            raise
+    return True
+
+
+def _install_file(src: Path, dst: Path) -> bool:
+    """Copy src over dst unless dst already has the same content. Returns True if dst changed."""
+    if dst.exists() and filecmp.cmp(src, dst, shallow=False):
+        return False
+    shutil.copy2(src, dst)
+    return True
+
+
+def _needs_daemon_reload(units: list[str]) -> bool:
+    """
+    Ask systemd whether any of the given units changed on disk since the last daemon-reload.
+
+    Catches unit files installed by an earlier run whose reload failed or was skipped
+    with --no-reload. If systemd cannot be queried, assume a reload is needed.
+    """
+    result = _run(["systemctl", "show", "-p", "NeedDaemonReload", "--value", *units], check=False)
+    if result.returncode != 0:
+        return True
+    return any(line.strip() == "yes" for line in result.stdout.splitlines())
+
+
+def _env_file_path() -> Path:
+    return Path("/etc/arca-storage/arca-storage.env")
+
+
+def _write_env_file(cfg) -> bool:
+    """Write the rendered env file unless it already has that content. Returns True if it changed."""
+    env_dst = _env_file_path()
+    content = _render_env(cfg).encode("utf-8")
+    try:
+        if env_dst.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        env_dst.parent.mkdir(parents=True, exist_ok=True)
+    env_dst.write_bytes(content)
+    return True
 
 
 @app.command()
@@ -59,6 +145,13 @@ def install(
     install_config: bool = typer.Option(
         True, help="Install /etc/arca-storage/storage-bootstrap.conf and storage-runtime.conf if missing"
     ),
+    reload: bool = typer.Option(
+        True,
+        help=(
+            "Run 'systemctl daemon-reload' if unit files changed or systemd reports them stale. "
+            "With --no-reload, run 'systemctl daemon-reload' yourself afterwards"
+        ),
+    ),
 ):
     """
     Install local resource files (Pacemaker RA, systemd unit files).
@@ -71,17 +164,12 @@ def install(
             cfg_dst_dir = Path("/etc/arca-storage")
             cfg_dst_dir.mkdir(parents=True, exist_ok=True)
 
-            bootstrap_src = _resource_path("config", "storage-bootstrap.conf")
-            bootstrap_dst = cfg_dst_dir / "storage-bootstrap.conf"
-            if bootstrap_src.exists() and not bootstrap_dst.exists():
-                shutil.copy2(bootstrap_src, bootstrap_dst)
+            _copy_if_missing(_resource_path("config", "storage-bootstrap.conf"), cfg_dst_dir / "storage-bootstrap.conf")
+            _copy_if_missing(_resource_path("config", "storage-runtime.conf"), cfg_dst_dir / "storage-runtime.conf")
 
-            runtime_src = _resource_path("config", "storage-runtime.conf")
-            runtime_dst = cfg_dst_dir / "storage-runtime.conf"
-            if runtime_src.exists() and not runtime_dst.exists():
-                shutil.copy2(runtime_src, runtime_dst)
-
-            # Reload config after installing files so derived env matches.
+            # Reload config after installing files so derived env matches. copy2 keeps the
+            # packaged files' mtimes, so drop the cache rather than rely on the file signature.
+            clear_config_cache()
             cfg = load_config()
 
         # Pacemaker RA
@@ -92,27 +180,35 @@ def install(
         ra_dst_dir = Path(f"/usr/lib/ocf/resource.d/{ra_vendor or cfg.pacemaker_ra_vendor}")
         ra_dst_dir.mkdir(parents=True, exist_ok=True)
         ra_dst = ra_dst_dir / "NetnsVlan"
-        shutil.copy2(ra_src, ra_dst)
+        _install_file(ra_src, ra_dst)
         os.chmod(ra_dst, 0o755)
 
         # systemd units
+        units_changed = False
+        unit_names: list[str] = []
         if install_api_service:
             api_src = _resource_path("systemd", "arca-storage-api.service")
             api_dst = Path("/etc/systemd/system/arca-storage-api.service")
             if api_src.exists():
-                shutil.copy2(api_src, api_dst)
+                units_changed |= _install_file(api_src, api_dst)
+                unit_names.append(api_dst.name)
 
         if install_ganesha_unit:
             ganesha_src = _resource_path("systemd", "nfs-ganesha@.service")
             ganesha_dst = Path("/etc/systemd/system/nfs-ganesha@.service")
             if not ganesha_src.exists():
                 raise RuntimeError(f"Missing packaged systemd unit: {ganesha_src}")
-            shutil.copy2(ganesha_src, ganesha_dst)
+            units_changed |= _install_file(ganesha_src, ganesha_dst)
+            unit_names.append(ganesha_dst.name)
 
         # systemd environment file (used by nfs-ganesha@.service)
         _write_env_file(cfg)
 
-        _run(["systemctl", "daemon-reload"])
+        # Only unit file changes need a reload; EnvironmentFile= is read at unit start.
+        # Units left unchanged by this run may still be stale from an earlier run whose
+        # reload failed or was skipped, so ask systemd about those.
+        if reload and unit_names and (units_changed or _needs_daemon_reload(unit_names)):
+            _run(["systemctl", "daemon-reload"])
         typer.echo("Installed bootstrap resources successfully")
     except Exception as e:
         typer.echo(f"Error: {e}", err=True)
@@ -124,13 +220,17 @@ def render_env():
     """
     Re-generate /etc/arca-storage/arca-storage.env from current config files.
 
-    Use this after editing storage-bootstrap.conf / storage-runtime.conf.
+    Use this after editing storage-bootstrap.conf / storage-runtime.conf; the
+    file is left untouched if its content would not change. Units read the file
+    via EnvironmentFile= when they start, so no daemon-reload is needed; restart
+    the affected units to apply it.
     """
     try:
         cfg = load_config()
-        env_path = _write_env_file(cfg)
-        typer.echo(f"Wrote {env_path}")
-        _run(["systemctl", "daemon-reload"], check=False)
+        if _write_env_file(cfg):
+            typer.echo(f"Wrote {_env_file_path()}")
+        else:
+            typer.echo(f"Unchanged {_env_file_path()}")
     except Exception as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
@@ -148,40 +248,58 @@ def verify(
     """
     cfg = load_config()
     issues: list[str] = []
+    # Report lines are buffered per stream and written in one go by flush().
+    ok_lines: list[str] = []
+    ng_lines: list[str] = []
 
-    def check(cond: bool, ok: str, bad: str) -> None:
+    def check(cond: bool, ok: str, bad: Union[str, Callable[[], str]]) -> None:
+        # `bad` may be a callable so messages that embed command output are only
+        # built when the check actually fails.
         if cond:
-            typer.echo(f"OK: {ok}")
+            ok_lines.append(f"OK: {ok}")
         else:
-            typer.echo(f"NG: {bad}", err=True)
+            if callable(bad):
+                bad = bad()
+            ng_lines.append(f"NG: {bad}")
             issues.append(bad)
 
+    def flush() -> None:
+        if ok_lines:
+            typer.echo("\n".join(ok_lines))
+            ok_lines.clear()
+        if ng_lines:
+            typer.echo("\n".join(ng_lines), err=True)
+            ng_lines.clear()
+
     # Config files
-    check(Path("/etc/arca-storage/storage-bootstrap.conf").exists(), "bootstrap config present", "missing storage-bootstrap.conf")
-    check(Path("/etc/arca-storage/storage-runtime.conf").exists(), "runtime config present", "missing storage-runtime.conf")
+    check(os.path.exists("/etc/arca-storage/storage-bootstrap.conf"), "bootstrap config present", "missing storage-bootstrap.conf")
+    check(os.path.exists("/etc/arca-storage/storage-runtime.conf"), "runtime config present", "missing storage-runtime.conf")
 
     # systemd env
     check(
-        Path("/etc/arca-storage/arca-storage.env").exists(),
+        os.path.exists("/etc/arca-storage/arca-storage.env"),
         "arca-storage.env present",
         "missing arca-storage.env (run: arca bootstrap render-env)",
     )
 
-    # Key binaries (presence only)
-    for binary in ["systemctl", "pcs", "drbdadm", "pvcreate", "vgcreate", "lvcreate", "ganesha.nfsd", "ip"]:
-        check(shutil.which(binary) is not None, f"found binary: {binary}", f"missing binary in PATH: {binary}")
+    # Key binaries (presence only). Every lookup is done once here and reused by
+    # the system checks below.
+    binaries = ["systemctl", "pcs", "drbdadm", "pvcreate", "vgcreate", "lvcreate", "ganesha.nfsd", "ip"]
+    found = {binary: shutil.which(binary) is not None for binary in [*binaries, "vgs", "lvs"]}
+    for binary in binaries:
+        check(found[binary], f"found binary: {binary}", f"missing binary in PATH: {binary}")
 
     # Pacemaker RA
-    ra_path = Path(f"/usr/lib/ocf/resource.d/{cfg.pacemaker_ra_vendor}/NetnsVlan")
+    ra_path = f"/usr/lib/ocf/resource.d/{cfg.pacemaker_ra_vendor}/NetnsVlan"
     check(
-        ra_path.exists(),
+        os.path.exists(ra_path),
         f"NetnsVlan RA installed at {ra_path}",
         f"missing NetnsVlan RA at {ra_path} (run: arca bootstrap install)",
     )
 
     # systemd unit files
-    check(Path("/etc/systemd/system/nfs-ganesha@.service").exists(), "nfs-ganesha@.service present", "missing nfs-ganesha@.service (run: arca bootstrap install)")
-    check(Path("/etc/systemd/system/arca-storage-api.service").exists(), "arca-storage-api.service present", "missing arca-storage-api.service (run: arca bootstrap install)")
+    check(os.path.exists("/etc/systemd/system/nfs-ganesha@.service"), "nfs-ganesha@.service present", "missing nfs-ganesha@.service (run: arca bootstrap install)")
+    check(os.path.exists("/etc/systemd/system/arca-storage-api.service"), "arca-storage-api.service present", "missing arca-storage-api.service (run: arca bootstrap install)")
 
     # Config sanity (basic)
     check(cfg.export_dir.startswith("/"), f"export_dir={cfg.export_dir}", f"export_dir must be absolute: {cfg.export_dir}")
@@ -194,58 +312,88 @@ def verify(
     check(bool(cfg.parent_if), f"parent_if={cfg.parent_if}", "parent_if is empty")
     check(bool(cfg.drbd_resource), f"drbd_resource={cfg.drbd_resource}", "drbd_resource is empty")
 
+    # Show the local checks before waiting on the (slower) system status commands.
+    flush()
+
     if check_system:
-        # systemd health (only if systemctl exists)
-        if shutil.which("systemctl"):
-            for unit in ["pcsd", "corosync", "pacemaker"]:
-                res = _run(["systemctl", "is-active", unit], check=False)
-                check(res.returncode == 0, f"systemd {unit} is active", f"systemd {unit} is not active")
-        else:
-            check(False, "systemctl available", "systemctl not found; cannot verify services")
+        # The status commands below are read-only and independent, so they all run
+        # concurrently; results are reported in the usual order once collected.
+        with ThreadPoolExecutor(max_workers=8) as pool:
+
+            def start(cmd: list[str]) -> Future[subprocess.CompletedProcess[str]]:
+                return pool.submit(_run, cmd, check=False)
 
-        # Pacemaker cluster health
-        if shutil.which("pcs"):
-            res = _run(["pcs", "status"], check=False)
-            check(res.returncode == 0, "pcs status ok", f"pcs status failed: {(res.stderr or res.stdout).strip()}")
+            def probe(cmd: list[str]) -> Future[int]:
+                return pool.submit(_run_rc, cmd)
 
             master = f"ms_drbd_{cfg.drbd_resource}"
-            res = _run(["pcs", "resource", "show", master], check=False)
-            check(res.returncode == 0, f"Pacemaker DRBD master present: {master}", f"missing Pacemaker DRBD master: {master}")
-        else:
-            check(False, "pcs available", "pcs not found; cannot verify cluster resources")
-
-        # DRBD status
-        if shutil.which("drbdadm"):
-            res = _run(["drbdadm", "status", cfg.drbd_resource], check=False)
-            check(
-                res.returncode == 0,
-                f"drbdadm status ok: {cfg.drbd_resource}",
-                f"drbdadm status failed for {cfg.drbd_resource}: {(res.stderr or res.stdout).strip()}",
-            )
-        else:
-            check(False, "drbdadm available", "drbdadm not found; cannot verify DRBD")
-
-        # LVM status
-        if shutil.which("vgs") and shutil.which("lvs"):
-            res = _run(["vgs", cfg.vg_name], check=False)
-            check(res.returncode == 0, f"VG present: {cfg.vg_name}", f"missing VG: {cfg.vg_name}")
-            res = _run(["lvs", f"{cfg.vg_name}/{cfg.thinpool_name}"], check=False)
-            check(
-                res.returncode == 0,
-                f"Thin pool present: {cfg.vg_name}/{cfg.thinpool_name}",
-                f"missing thin pool: {cfg.vg_name}/{cfg.thinpool_name}",
-            )
-        else:
-            check(False, "lvm tools available", "vgs/lvs not found; cannot verify LVM")
+            thinpool_lv = f"{cfg.vg_name}/{cfg.thinpool_name}"
+            units = None
+            if found["systemctl"]:
+                units = {unit: probe(["systemctl", "is-active", unit]) for unit in ["pcsd", "corosync", "pacemaker"]}
+            pcs = None
+            if found["pcs"]:
+                pcs = (start(["pcs", "status"]), probe(["pcs", "resource", "show", master]))
+            drbd = start(["drbdadm", "status", cfg.drbd_resource]) if found["drbdadm"] else None
+            lvm = None
+            if found["vgs"] and found["lvs"]:
+                lvm = (probe(["vgs", cfg.vg_name]), probe(["lvs", thinpool_lv]))
+
+            # systemd health (only if systemctl exists)
+            if units is not None:
+                for unit, future in units.items():
+                    check(future.result() == 0, f"systemd {unit} is active", f"systemd {unit} is not active")
+            else:
+                check(False, "systemctl available", "systemctl not found; cannot verify services")
+
+            # Pacemaker cluster health
+            if pcs is not None:
+                res = pcs[0].result()
+                check(
+                    res.returncode == 0,
+                    "pcs status ok",
+                    lambda: f"pcs status failed: {(res.stderr or res.stdout).strip()}",
+                )
+
+                check(
+                    pcs[1].result() == 0,
+                    f"Pacemaker DRBD master present: {master}",
+                    f"missing Pacemaker DRBD master: {master}",
+                )
+            else:
+                check(False, "pcs available", "pcs not found; cannot verify cluster resources")
+
+            # DRBD status
+            if drbd is not None:
+                res = drbd.result()
+                check(
+                    res.returncode == 0,
+                    f"drbdadm status ok: {cfg.drbd_resource}",
+                    lambda: f"drbdadm status failed for {cfg.drbd_resource}: {(res.stderr or res.stdout).strip()}",
+                )
+            else:
+                check(False, "drbdadm available", "drbdadm not found; cannot verify DRBD")
+
+            # LVM status
+            if lvm is not None:
+                check(lvm[0].result() == 0, f"VG present: {cfg.vg_name}", f"missing VG: {cfg.vg_name}")
+                check(
+                    lvm[1].result() == 0,
+                    f"Thin pool present: {thinpool_lv}",
+                    f"missing thin pool: {thinpool_lv}",
+                )
+            else:
+                check(False, "lvm tools available", "vgs/lvs not found; cannot verify LVM")
 
         # Directories
-        check(Path(cfg.export_dir).exists(), f"export_dir exists: {cfg.export_dir}", f"missing export_dir: {cfg.export_dir}")
+        check(os.path.exists(cfg.export_dir), f"export_dir exists: {cfg.export_dir}", f"missing export_dir: {cfg.export_dir}")
         check(
-            Path(cfg.ganesha_config_dir).exists(),
+            os.path.exists(cfg.ganesha_config_dir),
             f"ganesha_config_dir exists: {cfg.ganesha_config_dir}",
             f"missing ganesha_config_dir: {cfg.ganesha_config_dir}",
         )
 
+    flush()
     if strict and issues:
         raise typer.Exit(2)
 
@@ -267,17 +415,24 @@ def pacemaker_cluster(
         if len(node_list) < 2:
             raise ValueError("Provide at least 2 nodes")
 
-        # Ensure pcsd is running
-        _run(["systemctl", "enable", "--now", "pcsd"])
-
-        # Ensure hacluster password
-        subprocess.run(
-            ["chpasswd"],
-            input=f"hacluster:{hacluster_password}\n",
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        # Starting pcsd and setting the hacluster password are independent;
+        # both must be done before `pcs host auth`.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # Ensure pcsd is running
+            pcsd = pool.submit(_run, ["systemctl", "enable", "--now", "pcsd"])
+
+            # Ensure hacluster password
+            passwd = pool.submit(
+                subprocess.run,
+                ["chpasswd"],
+                input=f"hacluster:{hacluster_password}\n",
+                capture_output=True,
+                text=True,
+                check=True,
+                close_fds=False,
+            )
+            pcsd.result()
+            passwd.result()
 
         # Authenticate and setup
         auth = _run(["pcs", "host", "auth", *node_list, "-u", "hacluster", "-p", hacluster_password], check=False)
@@ -290,10 +445,15 @@ def pacemaker_cluster(
                 raise RuntimeError(f"pcs cluster setup failed: {setup.stderr.strip()}")
 
         _run(["pcs", "cluster", "start", "--all"])
-        _run(["pcs", "cluster", "enable", "--all"])
 
+        # Once the cluster is up, enabling it at boot and setting properties
+        # don't depend on each other.
         stonith_value = "true" if stonith_enabled else "false"
-        _run(["pcs", "property", "set", f"stonith-enabled={stonith_value}"])
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            enable = pool.submit(_run, ["pcs", "cluster", "enable", "--all"])
+            prop = pool.submit(_run, ["pcs", "property", "set", f"stonith-enabled={stonith_value}"])
+            enable.result()
+            prop.result()
 
         typer.echo("Pacemaker cluster bootstrap completed")
     except Exception as e:
@@ -321,30 +481,26 @@ def drbd_config(
         dest_dir = Path("/etc/drbd.d")
         dest_dir.mkdir(parents=True, exist_ok=True)
         res_path = dest_dir / f"{resource}.res"
-        res_content = (
-            f"resource {resource} {{\n"
-            f"  protocol C;\n"
-            f"  meta-disk internal;\n\n"
-            f"  on {node1} {{\n"
-            f"    device {device};\n"
-            f"    disk {disk};\n"
-            f"    address {node1_ip}:{port};\n"
-            f"  }}\n"
-            f"  on {node2} {{\n"
-            f"    device {device};\n"
-            f"    disk {disk};\n"
-            f"    address {node2_ip}:{port};\n"
-            f"  }}\n"
-            f"}}\n"
+        res_content = _DRBD_RES_TEMPLATE.format_map(
+            {
+                "resource": resource,
+                "device": device,
+                "disk": disk,
+                "node1": node1,
+                "node1_ip": node1_ip,
+                "node2": node2,
+                "node2_ip": node2_ip,
+                "port": port,
+            }
         )
-        res_path.write_text(res_content, encoding="utf-8")
+        res_path.write_bytes(res_content.encode("utf-8"))
         typer.echo(f"Wrote DRBD resource config: {res_path}")
 
         if apply:
-            _run(["drbdadm", "create-md", resource], check=False)
-            _run(["drbdadm", "up", resource], check=False)
+            _run_rc(["drbdadm", "create-md", resource])
+            _run_rc(["drbdadm", "up", resource])
             if primary:
-                _run(["drbdadm", "primary", "--force", resource], check=False)
+                _run_rc(["drbdadm", "primary", "--force", resource])
             typer.echo("Applied DRBD configuration")
     except Exception as e:
         typer.echo(f"Error: {e}", err=True)
@@ -369,19 +525,16 @@ def lvm_thinpool(
         thinpool = thinpool or cfg.thinpool_name
 
         # PV
-        pv_check = _run(["pvs", pv], check=False)
-        if pv_check.returncode != 0:
+        if _run_rc(["pvs", pv]) != 0:
             _run(["pvcreate", pv])
 
         # VG
-        vg_check = _run(["vgs", vg], check=False)
-        if vg_check.returncode != 0:
+        if _run_rc(["vgs", vg]) != 0:
             _run(["vgcreate", vg, pv])
 
         # Thinpool
         lv_path = f"{vg}/{thinpool}"
-        lv_check = _run(["lvs", lv_path], check=False)
-        if lv_check.returncode != 0:
+        if _run_rc(["lvs", lv_path]) != 0:
             _run(
                 [
                     "lvcreate",
@@ -398,7 +551,7 @@ def lvm_thinpool(
                 ]
             )
 
-        _run(["systemctl", "enable", "--now", "lvm2-monitor"], check=False)
+        _run_rc(["systemctl", "enable", "--now", "lvm2-monitor"])
         typer.echo("LVM thin pool bootstrap completed")
     except Exception as e:
         typer.echo(f"Error: {e}", err=True)
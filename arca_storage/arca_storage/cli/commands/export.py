@@ -2,13 +2,15 @@
 Export management commands.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
+import orjson
 import typer
 
 from arca_storage.cli.lib.ganesha import add_export
-from arca_storage.cli.lib.ganesha import list_config_snapshots, read_config_snapshot_meta, rollback_config
+from arca_storage.cli.lib.ganesha import list_config_snapshots, list_export_svms
+from arca_storage.cli.lib.ganesha import read_config_snapshot_meta, rollback_config
 from arca_storage.cli.lib.ganesha import reload as reload_ganesha
 from arca_storage.cli.lib.ganesha import remove_export, render_config
 from arca_storage.cli.lib.ganesha import sync as sync_ganesha
@@ -26,11 +28,15 @@ def add(
     client: str = typer.Option(..., "--client", help="Client CIDR (e.g., 10.0.0.0/24)"),
     access: str = typer.Option("rw", "--access", help="Access type: rw or ro (default: rw)"),
     root_squash: bool = typer.Option(True, "--root-squash/--no-root-squash", help="Enable root squash (default: True)"),
+    reload: bool = typer.Option(
+        True, "--reload/--no-reload", help="Reload NFS-Ganesha afterwards (disable to batch; see 'export reload')"
+    ),
 ):
     """
     Add an NFS export.
 
     Adds an export entry to the NFS-Ganesha configuration and reloads the service.
+    When adding many exports, pass --no-reload and run 'arca export reload' once.
     """
     try:
         validate_name(volume)
@@ -43,12 +49,14 @@ def add(
         typer.echo(f"Adding export for volume: {volume} in SVM: {svm}")
 
         # Add export to configuration
-        add_export(svm, volume, client, access, root_squash)
+        # The reload is done here (or deferred) rather than inside add_export.
+        add_export(svm, volume, client, access, root_squash, reload_service=False)
         typer.echo(f"  Added export: {client} -> {volume}")
 
         # Reload ganesha
-        reload_ganesha(svm)
-        typer.echo(f"  Reloaded NFS-Ganesha service")
+        if reload:
+            reload_ganesha(svm)
+            typer.echo(f"  Reloaded NFS-Ganesha service")
 
         typer.echo(f"Export added successfully")
 
@@ -62,11 +70,15 @@ def remove(
     volume: str = typer.Option(..., "--volume", help="Volume name"),
     svm: str = typer.Option(..., "--svm", help="SVM name"),
     client: str = typer.Option(..., "--client", help="Client CIDR"),
+    reload: bool = typer.Option(
+        True, "--reload/--no-reload", help="Reload NFS-Ganesha afterwards (disable to batch; see 'export reload')"
+    ),
 ):
     """
     Remove an NFS export.
 
     Removes an export entry from the NFS-Ganesha configuration and reloads the service.
+    When removing many exports, pass --no-reload and run 'arca export reload' once.
     """
     try:
         validate_name(volume)
@@ -76,12 +88,13 @@ def remove(
         typer.echo(f"Removing export for volume: {volume} in SVM: {svm}")
 
         # Remove export from configuration
-        remove_export(svm, volume, client)
+        remove_export(svm, volume, client, reload_service=False)
         typer.echo(f"  Removed export: {client} -> {volume}")
 
         # Reload ganesha
-        reload_ganesha(svm)
-        typer.echo(f"  Reloaded NFS-Ganesha service")
+        if reload:
+            reload_ganesha(svm)
+            typer.echo(f"  Reloaded NFS-Ganesha service")
 
         typer.echo(f"Export removed successfully")
 
@@ -90,6 +103,25 @@ def remove(
         raise typer.Exit(1)
 
 
+@app.command("reload")
+def reload_(
+    svm: str = typer.Option(..., "--svm", help="SVM name"),
+):
+    """
+    Reload NFS-Ganesha for an SVM.
+
+    Applies exports added or removed with --no-reload in a single reload.
+    """
+    try:
+        validate_name(svm)
+        reload_ganesha(svm)
+        typer.echo(f"Reloaded NFS-Ganesha service for SVM: {svm}")
+
+    except Exception as e:
+        typer.echo(f"Error reloading exports: {e}", err=True)
+        raise typer.Exit(1)
+
+
 @app.command()
 def list(
     svm: Optional[str] = typer.Option(None, "--svm", help="Filter by SVM name"),
@@ -105,10 +137,14 @@ def list(
         if not exports:
             typer.echo("No exports found")
             return
+        # One write for the whole listing rather than one per row
+        lines = []
         for exp in exports:
-            typer.echo(
-                f"{exp.get('svm')}/{exp.get('volume')} client={exp.get('client')} access={exp.get('access')} export_id={exp.get('export_id')}"
+            g = exp.get
+            lines.append(
+                f"{g('svm')}/{g('volume')} client={g('client')} access={g('access')} export_id={g('export_id')}"
             )
+        typer.echo("\n".join(lines))
 
     except Exception as e:
         typer.echo(f"Error listing exports: {e}", err=True)
@@ -119,21 +155,18 @@ def list(
 def sync(
     svm: Optional[str] = typer.Option(None, "--svm", help="SVM name"),
     all_svms: bool = typer.Option(False, "--all", help="Sync all SVMs found in state"),
+    jobs: int = typer.Option(8, "--jobs", min=1, help="SVMs to sync in parallel with --all (default: 8)"),
 ):
     """
     Re-render ganesha.conf from current state and reload service.
 
-    Useful after changing runtime configuration (e.g., enabling NFSv3).
+    Useful after changing runtime configuration (e.g., enabling NFSv3). With --all,
+    every SVM is attempted even if some fail; the command fails if any did.
     """
     try:
         targets: List[str] = []
         if all_svms:
-            state_dir = get_state_dir()
-            if state_dir.exists():
-                for path in sorted(state_dir.glob("exports.*.json")):
-                    name = path.name[len("exports.") : -len(".json")]
-                    if name:
-                        targets.append(name)
+            targets = list_export_svms()
         else:
             if not svm:
                 raise ValueError("Specify --svm or --all")
@@ -144,9 +177,19 @@ def sync(
             typer.echo("No SVMs found to sync")
             return
 
-        for name in targets:
-            path = sync_ganesha(name)
-            typer.echo(f"Synced: {name} -> {path}")
+        # Each SVM has its own config file and ganesha unit, so they can be synced
+        # concurrently; results are reported in target order.
+        failed: List[str] = []
+        with ThreadPoolExecutor(max_workers=min(jobs, len(targets))) as pool:
+            futures = [(name, pool.submit(sync_ganesha, name)) for name in targets]
+            for name, future in futures:
+                try:
+                    typer.echo(f"Synced: {name} -> {future.result()}")
+                except Exception as e:
+                    typer.echo(f"Failed: {name}: {e}", err=True)
+                    failed.append(name)
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(targets)} SVM(s) failed: {', '.join(failed)}")
 
     except Exception as e:
         typer.echo(f"Error syncing exports: {e}", err=True)
@@ -166,9 +209,9 @@ def snapshots(
         if not snaps:
             typer.echo("No snapshots found")
             return
-        for s in snaps:
-            typer.echo(f"{s.get('config_version')} {s.get('path')}")
-        typer.echo(f"latest {get_state_dir()}/config/ganesha.{svm}.latest.conf")
+        lines = [f"{s.get('config_version')} {s.get('path')}" for s in snaps]
+        lines.append(f"latest {get_state_dir()}/config/ganesha.{svm}.latest.conf")
+        typer.echo("\n".join(lines))
     except Exception as e:
         typer.echo(f"Error listing snapshots: {e}", err=True)
         raise typer.Exit(1)
@@ -204,21 +247,30 @@ def snapshot_show(
         validate_name(svm)
         meta = read_config_snapshot_meta(svm, config_version)
         if as_json:
-            typer.echo(typer.style(json.dumps(meta, indent=2, ensure_ascii=False, sort_keys=True), dim=False))
+            # Echoing bytes writes them straight to the binary stdout buffer; orjson
+            # appends the newline so echo has nothing to concatenate.
+            typer.echo(
+                orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE),
+                nl=False,
+            )
             return
 
-        typer.echo(f"svm={svm} config_version={meta.get('config_version')} template_version={meta.get('template_version')}")
-        typer.echo(f"protocols={meta.get('protocols')} mountd_port={meta.get('mountd_port')} nlm_port={meta.get('nlm_port')}")
+        lines = [
+            f"svm={svm} config_version={meta.get('config_version')} template_version={meta.get('template_version')}",
+            f"protocols={meta.get('protocols')} mountd_port={meta.get('mountd_port')} nlm_port={meta.get('nlm_port')}",
+        ]
         exports = meta.get("exports") or []
         if not exports:
-            typer.echo("exports: (none)")
-            return
-        typer.echo("exports:")
-        for e in exports:
-            typer.echo(
-                f"  id={e.get('export_id')} client={e.get('client')} access={e.get('access')} "
-                f"sec={e.get('sec')} squash={e.get('squash')} path={e.get('path')}"
-            )
+            lines.append("exports: (none)")
+        else:
+            lines.append("exports:")
+            for e in exports:
+                g = e.get
+                lines.append(
+                    f"  id={g('export_id')} client={g('client')} access={g('access')} "
+                    f"sec={g('sec')} squash={g('squash')} path={g('path')}"
+                )
+        typer.echo("\n".join(lines))
     except Exception as e:
         typer.echo(f"Error showing snapshot: {e}", err=True)
         raise typer.Exit(1)
@@ -6,10 +6,11 @@ from typing import Optional
 
 import typer
 
+from arca_storage.cli.lib import names
 from arca_storage.cli.lib.ganesha import reload as reload_ganesha
-from arca_storage.cli.lib.ganesha import render_config
-from arca_storage.cli.lib.netns import attach_vlan, create_namespace, delete_namespace, allocate_vlan_ifname
+from arca_storage.cli.lib.netns import delete_namespace, allocate_vlan_ifname
 from arca_storage.cli.lib.pacemaker import create_group, delete_group
+from arca_storage.cli.lib.provision import create_svm_resources
 from arca_storage.cli.lib.state import delete_svm as state_delete_svm
 from arca_storage.cli.lib.state import list_svms as state_list_svms
 from arca_storage.cli.lib.state import upsert_svm as state_upsert_svm
@@ -21,8 +22,6 @@ from arca_storage.cli.lib.validators import (
     validate_name,
     validate_vlan,
 )
-from arca_storage.cli.lib.lvm import create_lv
-from arca_storage.cli.lib.xfs import format_xfs
 from arca_storage.cli.lib.config import load_config
 
 app = typer.Typer(help="SVM management commands")
@@ -61,39 +60,24 @@ def create(
         cfg = load_config()
         gateway_ip = gateway or infer_gateway_from_ip_cidr(ip)
 
-        # Create namespace
-        create_namespace(name)
-        typer.echo(f"  Created namespace: {name}")
-
-        # Attach VLAN
         vlan_ifname = allocate_vlan_ifname(name, vlan_id)
-        attach_vlan(name, cfg.parent_if, vlan_id, ip, gateway_ip, mtu, ifname=vlan_ifname)
+
+        # The root LV overlaps the namespace/VLAN setup; a failed step leaves no
+        # root LV or ganesha config behind (see create_svm_resources).
+        config_path, lv_path = create_svm_resources(
+            name, cfg.parent_if, vlan_id, ip, gateway_ip, mtu, vlan_ifname, root_size, cfg
+        )
+        typer.echo(f"  Created namespace: {name}")
         typer.echo(f"  Configured VLAN {vlan_id} with IP {ip}")
         typer.echo(f"  Gateway: {gateway_ip}")
-
-        # Generate ganesha config
-        config_path = render_config(name, [])
         typer.echo(f"  Generated ganesha config: {config_path}")
-
-        # Optionally create root LV (used by Pacemaker Filesystem resource)
-        if root_size:
-            vg_name = cfg.vg_name
-            lv_name = f"vol_{name}"
-            try:
-                lv_path = create_lv(vg_name, lv_name, root_size, thin=True, thinpool_name=cfg.thinpool_name)
-                format_xfs(lv_path)
-                typer.echo(f"  Created root LV: {lv_path}")
-            except Exception as e:
-                # Keep idempotent-ish behavior if it already exists.
-                if "already exists" not in str(e).lower():
-                    raise
-
-        export_dir = cfg.export_dir.rstrip("/")
+        if lv_path:
+            typer.echo(f"  Created root LV: {lv_path}")
 
         # Create Pacemaker resource group
         create_group(
             name,
-            f"{export_dir}/{name}",
+            names.svm_path(cfg.export_dir, name),
             vlan_id=vlan_id,
             ifname=vlan_ifname,
             ip=ip_addr,
@@ -176,10 +160,12 @@ def list():
         if not svms:
             typer.echo("No SVMs found")
             return
+        # One write for the whole listing rather than one per row
+        lines = []
         for svm in svms:
-            typer.echo(
-                f"{svm.get('name')} vlan={svm.get('vlan_id')} ip={svm.get('ip_cidr')} status={svm.get('status')}"
-            )
+            g = svm.get
+            lines.append(f"{g('name')} vlan={g('vlan_id')} ip={g('ip_cidr')} status={g('status')}")
+        typer.echo("\n".join(lines))
 
     except Exception as e:
         typer.echo(f"Error listing SVMs: {e}", err=True)
@@ -6,6 +6,7 @@ from typing import Optional
 
 import typer
 
+from arca_storage.cli.lib import names
 from arca_storage.cli.lib.lvm import create_lv, delete_lv, resize_lv
 from arca_storage.cli.lib.state import delete_volume as state_delete_volume
 from arca_storage.cli.lib.state import list_volumes as state_list_volumes
@@ -37,9 +38,8 @@ def create(
 
         cfg = load_config()
         vg_name = cfg.vg_name
-        export_dir = cfg.export_dir.rstrip("/")
-        mount_path = f"{export_dir}/{svm}/{name}"
-        lv_name = f"vol_{svm}_{name}"
+        mount_path = names.mount_path(cfg.export_dir, svm, name)
+        lv_name = names.lv_name(svm, name)
 
         # Create LV
         lv_path = create_lv(vg_name, lv_name, size, thin=thin, thinpool_name=cfg.thinpool_name)
@@ -93,9 +93,8 @@ def resize(
 
         cfg = load_config()
         vg_name = cfg.vg_name
-        export_dir = cfg.export_dir.rstrip("/")
-        mount_path = f"{export_dir}/{svm}/{name}"
-        lv_name = f"vol_{svm}_{name}"
+        mount_path = names.mount_path(cfg.export_dir, svm, name)
+        lv_name = names.lv_name(svm, name)
 
         # Resize LV
         resize_lv(vg_name, lv_name, new_size)
@@ -145,9 +144,8 @@ def delete(
 
         cfg = load_config()
         vg_name = cfg.vg_name
-        export_dir = cfg.export_dir.rstrip("/")
-        mount_path = f"{export_dir}/{svm}/{name}"
-        lv_name = f"vol_{svm}_{name}"
+        mount_path = names.mount_path(cfg.export_dir, svm, name)
+        lv_name = names.lv_name(svm, name)
 
         # Unmount
         umount_xfs(mount_path)
@@ -179,10 +177,12 @@ def list(
         if not volumes:
             typer.echo("No volumes found")
             return
+        # One write for the whole listing rather than one per row
+        lines = []
         for vol in volumes:
-            typer.echo(
-                f"{vol.get('svm')}/{vol.get('name')} size={vol.get('size_gib')}GiB thin={vol.get('thin')} mount={vol.get('mount_path')}"
-            )
+            g = vol.get
+            lines.append(f"{g('svm')}/{g('name')} size={g('size_gib')}GiB thin={g('thin')} mount={g('mount_path')}")
+        typer.echo("\n".join(lines))
     except Exception as e:
         typer.echo(f"Error listing volumes: {e}", err=True)
         raise typer.Exit(1)
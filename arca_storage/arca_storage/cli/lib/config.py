@@ -7,11 +7,10 @@ DRBD resource name, parent interface, state directory, etc.) in code.
 
 from __future__ import annotations
 
-import configparser
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 DEFAULT_BOOTSTRAP_CONFIG_PATH = Path("/etc/arca-storage/storage-bootstrap.conf")
@@ -28,12 +27,18 @@ class ArcaConfig:
     ganesha_nlm_port: int = 32768
     api_host: str = "127.0.0.1"
     api_port: int = 8080
+    api_workers: int = 1
     vg_name: str = "vg_pool_01"
     thinpool_name: str = "pool"
     parent_if: str = "bond0"
     drbd_resource: str = "r0"
     pacemaker_ra_vendor: str = "local"
 
+    def __post_init__(self) -> None:
+        # Normalize once so path builders can join onto export_dir directly
+        # ("/exports/" -> "/exports", "/" stays "/").
+        object.__setattr__(self, "export_dir", self.export_dir.rstrip("/") or "/")
+
 
 def _bootstrap_config_path() -> Path:
     env = os.environ.get("ARCA_BOOTSTRAP_CONFIG_PATH")
@@ -49,11 +54,60 @@ def _runtime_config_path() -> Path:
     return DEFAULT_RUNTIME_CONFIG_PATH
 
 
-def _read_ini(path: Path) -> configparser.ConfigParser:
-    parser = configparser.ConfigParser()
-    if path.exists():
-        parser.read(path, encoding="utf-8")
-    return parser
+def _read_storage_section(path: Path) -> Dict[str, str]:
+    """
+    Read the `[storage]` section of an INI-style config file in one pass.
+
+    Both config files only ever hold flat `key = value` pairs, so this covers the
+    subset of configparser syntax they use: `=` or `:` delimiters, full-line `#`/`;`
+    comments, lower-cased keys, and the last value winning for repeated keys.
+    Other sections and lines without a delimiter are ignored. A missing file
+    yields an empty dict.
+    """
+    try:
+        data = path.read_bytes().decode("utf-8", "replace")
+    except FileNotFoundError:
+        return {}
+
+    values: Dict[str, str] = {}
+    in_storage = False
+    for raw_line in data.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            in_storage = line[1:-1].strip() == "storage"
+            continue
+        if not in_storage:
+            continue
+        eq, colon = line.find("="), line.find(":")
+        sep = eq if colon < 0 or (0 <= eq < colon) else colon
+        if sep <= 0:
+            continue
+        values[line[:sep].strip().lower()] = line[sep + 1 :].strip()
+    return values
+
+
+_FileSignature = Optional[Tuple[int, int, int]]
+
+# (bootstrap path, its signature, runtime path, its signature) -> parsed config
+_config_cache: Optional[Tuple[Tuple[Path, _FileSignature, Path, _FileSignature], ArcaConfig]] = None
+
+
+def _file_signature(path: Path) -> _FileSignature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def clear_config_cache() -> None:
+    """
+    Forget the cached config so the next `load_config()` re-reads both files.
+    """
+    global _config_cache
+    _config_cache = None
 
 
 def load_config() -> ArcaConfig:
@@ -63,19 +117,32 @@ def load_config() -> ArcaConfig:
     - `ARCA_RUNTIME_CONFIG_PATH` or `/etc/arca-storage/storage-runtime.conf`
 
     Missing files are not an error; defaults are returned.
+
+    The parsed result is cached per process and reused while both config paths
+    and their mtime/size/inode stay the same, so edits are picked up on the next
+    call without re-parsing the files on every call.
     """
-    bootstrap_parser = _read_ini(_bootstrap_config_path())
-    runtime_parser = _read_ini(_runtime_config_path())
+    global _config_cache
+    bootstrap_path = _bootstrap_config_path()
+    runtime_path = _runtime_config_path()
+    key = (bootstrap_path, _file_signature(bootstrap_path), runtime_path, _file_signature(runtime_path))
+    cached = _config_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    cfg = _parse_config(bootstrap_path, runtime_path)
+    _config_cache = (key, cfg)
+    return cfg
+
 
-    bootstrap_section = bootstrap_parser["storage"] if bootstrap_parser.has_section("storage") else {}
-    runtime_section = runtime_parser["storage"] if runtime_parser.has_section("storage") else {}
+def _parse_config(bootstrap_path: Path, runtime_path: Path) -> ArcaConfig:
+    bootstrap_section = _read_storage_section(bootstrap_path)
+    runtime_section = _read_storage_section(runtime_path)
 
-    def _get(section: object, key: str, default: str) -> str:
-        if isinstance(section, dict):
-            return str(section.get(key, default)).strip()
-        return str(section.get(key, fallback=default)).strip()
+    def _get(section: Dict[str, str], key: str, default: str) -> str:
+        return section.get(key, default).strip()
 
-    def _get_int(section: object, key: str, default: int) -> int:
+    def _get_int(section: Dict[str, str], key: str, default: int) -> int:
         raw = _get(section, key, str(default))
         try:
             return int(raw)
@@ -110,6 +177,7 @@ def load_config() -> ArcaConfig:
         ganesha_nlm_port=_get_int(runtime_section, "ganesha_nlm_port", 32768),
         api_host=_get(runtime_section, "api_host", "127.0.0.1"),
         api_port=_get_int(runtime_section, "api_port", 8080),
+        api_workers=_get_int(runtime_section, "api_workers", 1),
         # Bootstrap config (stable)
         vg_name=_get(bootstrap_section, "vg_name", "vg_pool_01"),
         thinpool_name=_get(bootstrap_section, "thinpool_name", "pool"),
@@ -4,25 +4,52 @@ NFS-Ganesha configuration management functions.
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
 
-from jinja2 import Template
+import orjson
 
-from arca_storage.cli.lib.config import load_config
+from arca_storage.cli.lib import names
+from arca_storage.cli.lib.config import ArcaConfig, load_config
 from arca_storage.cli.lib.state import get_state_dir
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 TEMPLATE_VERSION = "1.0.0"
 
+# Layout of the JSON files written here (exports state, snapshot metadata)
+_JSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+
+# Per-SVM export state files are named exports.<svm>.json
+_EXPORTS_PREFIX = "exports."
+_EXPORTS_SUFFIX = ".json"
+
 
 def _template_path() -> Path:
     # arca_storage/cli/lib/ganesha.py -> arca_storage/templates/ganesha.conf.j2
     return Path(__file__).resolve().parents[2] / "templates" / "ganesha.conf.j2"
 
+
+@lru_cache(maxsize=1)
+def _get_template() -> Template:
+    """
+    Load and compile templates/ganesha.conf.j2 once per process.
+
+    The template ships with the package, so it only changes on a package upgrade,
+    which also restarts the API service.
+    """
+    # jinja2 is only needed for rendering; importing it lazily keeps it out of
+    # every other `arca` subcommand's startup.
+    from jinja2 import Template
+
+    return Template(_template_path().read_text(encoding="utf-8"))
+
+
 def _config_snapshot_dir() -> Path:
     # Keep snapshots under the same persistent state directory as exports.*.json.
     return get_state_dir() / "config"
@@ -70,57 +97,96 @@ def _stable_config_version(
             for e in exports
         ],
     }
+    # Imported here for the same reason as jinja2 in _get_template(): only
+    # rendering needs it, and it loads OpenSSL.
+    import hashlib
+
+    # Stays on json.dumps: its separators define existing config_version IDs.
     digest = hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
     return digest[:12]
 
 
 def _write_if_changed(path: Path, content: str) -> None:
+    _write_bytes_if_changed(path, content.encode("utf-8"))
+
+
+def _write_bytes_if_changed(path: Path, data: bytes) -> None:
     # Keep this using built-in open() so unit tests can easily mock writes.
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                if f.read() == content:
-                    return
-        except Exception:
-            # If we can't read, fall back to writing.
-            pass
+    try:
+        with open(path, "rb") as f:
+            # A size mismatch already proves a change; only read equal-sized files.
+            if os.fstat(f.fileno()).st_size == len(data) and f.read() == data:
+                return
+    except Exception:
+        # Missing or unreadable: fall back to writing.
+        pass
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    with open(path, "wb") as f:
+        f.write(data)
 
 
 def _write_json_if_changed(path: Path, data: object) -> None:
-    content = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+    # Byte-for-byte the same layout as json.dumps(indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+    content = orjson.dumps(data, option=_JSON_FILE_OPTIONS).decode("utf-8")
     _write_if_changed(path, content)
 
 
-def render_config(svm_name: str, exports: List[Dict]) -> str:
+def _point_latest(link: Path, target: Path) -> bool:
+    """
+    Point a "latest" snapshot alias at a versioned snapshot file.
+
+    The alias is a relative symlink swapped in with a rename, so updating it
+    costs no content I/O. Returns False if symlinks are unavailable so the
+    caller can fall back to writing a copy.
+    """
+    try:
+        if os.readlink(link) == target.name:
+            return True
+    except OSError:
+        pass
+    tmp = link.with_name(f".{link.name}.tmp")
+    try:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        os.symlink(target.name, tmp)
+        os.replace(tmp, link)
+        return True
+    except OSError:
+        return False
+
+
+def render_config(svm_name: str, exports: List[Dict], cfg: Optional[ArcaConfig] = None) -> str:
     """
     Render ganesha.conf configuration file.
     
     Args:
         svm_name: SVM name
         exports: List of export dictionaries
+        cfg: Config already loaded by the caller (loaded here if omitted)
         
     Returns:
         Path to the generated config file
     """
-    cfg = load_config()
+    if cfg is None:
+        cfg = load_config()
     config_dir = Path(cfg.ganesha_config_dir)
     config_dir.mkdir(parents=True, exist_ok=True)
     
     config_path = config_dir / f"ganesha.{svm_name}.conf"
 
     # Render template from templates/ganesha.conf.j2 (single source of truth).
-    template = Template(_template_path().read_text(encoding="utf-8"))
+    template = _get_template()
     protocol_tokens = [p.strip() for p in cfg.ganesha_protocols.split(",") if p.strip()]
     # Render as "3, 4" to match ganesha.conf conventions.
     protocols = ", ".join(protocol_tokens) if protocol_tokens else "4"
     enable_v3 = "3" in protocol_tokens
 
-    # Stable ordering for deterministic output.
+    # Stable ordering for deterministic output. The key runs once per export
+    # (not per comparison) and tolerates missing/None fields from older state.
     exports_sorted = sorted(
-        list(exports),
+        exports,
         key=lambda e: (
             int(e.get("export_id") or 0),
             str(e.get("path") or ""),
@@ -172,10 +238,17 @@ def render_config(svm_name: str, exports: List[Dict]) -> str:
     # Save snapshots for rollback purposes.
     snapshot_dir = _config_snapshot_dir()
     snapshot_dir.mkdir(parents=True, exist_ok=True)
-    _write_if_changed(_snapshot_path(svm_name, config_version), config_content)
-    _write_if_changed(snapshot_dir / f"ganesha.{svm_name}.latest.conf", config_content)
-    _write_json_if_changed(_snapshot_meta_path(svm_name, config_version), meta)
-    _write_json_if_changed(snapshot_dir / f"ganesha.{svm_name}.latest.json", meta)
+    snapshot_path = _snapshot_path(svm_name, config_version)
+    snapshot_meta_path = _snapshot_meta_path(svm_name, config_version)
+    _write_if_changed(snapshot_path, config_content)
+    _write_json_if_changed(snapshot_meta_path, meta)
+    # "latest" aliases the versioned files instead of duplicating them.
+    latest_path = snapshot_dir / f"ganesha.{svm_name}.latest.conf"
+    if not _point_latest(latest_path, snapshot_path):
+        _write_if_changed(latest_path, config_content)
+    latest_meta_path = snapshot_dir / f"ganesha.{svm_name}.latest.json"
+    if not _point_latest(latest_meta_path, snapshot_meta_path):
+        _write_json_if_changed(latest_meta_path, meta)
 
     _write_if_changed(config_path, config_content)
     
@@ -199,7 +272,8 @@ def reload(svm_name: str) -> None:
         ["systemctl", "reload", f"nfs-ganesha@{svm_name}"],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -213,7 +287,9 @@ def add_export(
     access: str = "rw",
     root_squash: bool = True,
     sec: Optional[List[str]] = None,
-) -> None:
+    *,
+    reload_service: bool = True,
+) -> Dict:
     """
     Add an export to the ganesha configuration.
     
@@ -223,40 +299,73 @@ def add_export(
         client: Client CIDR
         access: Access type (rw or ro)
         root_squash: Enable root squash
-        
+        reload_service: Reload NFS-Ganesha afterwards (pass False to batch
+            several changes and call reload() once)
+
+    Returns:
+        The export entry as stored in the state file
+
     Raises:
         RuntimeError: If adding export fails
     """
+    entry = {"volume": volume_name, "client": client, "access": access, "root_squash": root_squash, "sec": sec}
+    return add_exports(svm_name, [entry], reload_service=reload_service)[0]
+
+
+def add_exports(svm_name: str, entries: Sequence[Dict], *, reload_service: bool = True) -> List[Dict]:
+    """
+    Add several exports to one SVM with a single state save, render and reload.
+
+    Args:
+        svm_name: SVM name
+        entries: Dicts with "volume" and "client", and optionally "access"
+            (default "rw"), "root_squash" (default True) and "sec"
+        reload_service: Reload NFS-Ganesha afterwards
+
+    Returns:
+        The export entries as stored in the state file, in input order
+
+    Raises:
+        RuntimeError: If adding exports fails
+    """
     # Load existing exports
     exports = _load_exports(svm_name)
     
-    # Generate export ID (simple increment)
-    export_id = max([e.get("export_id", 0) for e in exports], default=0) + 1
+    # Generate export IDs (simple increment)
+    export_id = max([e.get("export_id", 0) for e in exports], default=0)
     
-    # Create export entry
+    # Create export entries
     cfg = load_config()
-    export_dir = cfg.export_dir.rstrip("/")
-    export_entry = {
-        "export_id": export_id,
-        "path": f"{export_dir}/{svm_name}/{volume_name}",
-        "pseudo": f"{export_dir}/{svm_name}/{volume_name}",
-        "access": access.upper(),
-        "squash": "Root_Squash" if root_squash else "No_Root_Squash",
-        "sec": sec or ["sys"],
-        "client": client,
-    }
+    added: List[Dict] = []
+    for entry in entries:
+        export_id += 1
+        path = names.mount_path(cfg.export_dir, svm_name, entry["volume"])
+        added.append(
+            {
+                "export_id": export_id,
+                "path": path,
+                "pseudo": path,
+                "access": str(entry.get("access") or "rw").upper(),
+                "squash": "Root_Squash" if entry.get("root_squash", True) else "No_Root_Squash",
+                "sec": entry.get("sec") or ["sys"],
+                "client": entry["client"],
+            }
+        )
     
-    exports.append(export_entry)
+    exports.extend(added)
     
     # Save exports and regenerate config
     _save_exports(svm_name, exports)
-    render_config(svm_name, exports)
+    render_config(svm_name, exports, cfg=cfg)
     
     # Reload service
-    reload(svm_name)
+    if reload_service:
+        reload(svm_name)
+
+    return added
 
 
-def remove_export(svm_name: str, volume_name: str, client: str) -> None:
+def remove_export(svm_name: str, volume_name: str, client: str, *, reload_service: bool = True) -> None:
     """
     Remove an export from the ganesha configuration.
     
@@ -264,6 +373,8 @@ def remove_export(svm_name: str, volume_name: str, client: str) -> None:
         svm_name: SVM name
         volume_name: Volume name
         client: Client CIDR
+        reload_service: Reload NFS-Ganesha afterwards (pass False to batch
+            several changes and call reload() once)
         
     Raises:
         RuntimeError: If removing export fails
@@ -273,38 +384,32 @@ def remove_export(svm_name: str, volume_name: str, client: str) -> None:
     
     # Remove matching export
     cfg = load_config()
-    export_dir = cfg.export_dir.rstrip("/")
-    exports = [
-        e for e in exports
-        if not (e.get("path") == f"/exports/{svm_name}/{volume_name}" and e.get("client") == client)
-    ]
-    # Support old default path too (backward compatibility)
-    exports = [
-        e
-        for e in exports
-        if not (e.get("path") == f"{export_dir}/{svm_name}/{volume_name}" and e.get("client") == client)
-    ]
+    # Match the old default path too (backward compatibility)
+    paths = {
+        names.mount_path("/exports", svm_name, volume_name),
+        names.mount_path(cfg.export_dir, svm_name, volume_name),
+    }
+    exports = [e for e in exports if not (e.get("path") in paths and e.get("client") == client)]
     
     # Save exports and regenerate config
     _save_exports(svm_name, exports)
-    render_config(svm_name, exports)
+    render_config(svm_name, exports, cfg=cfg)
     
     # Reload service
-    reload(svm_name)
+    if reload_service:
+        reload(svm_name)
 
 
 def _load_exports(svm_name: str) -> List[Dict]:
     """Load exports from state file."""
-    state_dir = get_state_dir()
-    state_dir.mkdir(parents=True, exist_ok=True)
-    
-    state_file = state_dir / f"exports.{svm_name}.json"
-    
-    if state_file.exists():
-        with open(state_file, "r") as f:
-            return json.load(f)
-    
-    return []
+    state_file = get_state_dir() / f"exports.{svm_name}.json"
+
+    # Reading needs no directory setup; a missing file (or state dir) means no exports.
+    try:
+        with open(state_file, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return []
 
 
 def _save_exports(svm_name: str, exports: List[Dict]) -> None:
@@ -316,9 +421,8 @@ def _save_exports(svm_name: str, exports: List[Dict]) -> None:
 
     tmp_fd, tmp_path = tempfile.mkstemp(prefix=f".{state_file.name}.", dir=str(state_file.parent))
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
-            json.dump(exports, f, indent=2, ensure_ascii=False, sort_keys=True)
-            f.write("\n")
+        with os.fdopen(tmp_fd, "wb") as f:
+            f.write(orjson.dumps(exports, option=_JSON_FILE_OPTIONS))
         os.replace(tmp_path, state_file)
     finally:
         try:
@@ -327,29 +431,49 @@ def _save_exports(svm_name: str, exports: List[Dict]) -> None:
             pass
 
 
-def list_exports(svm_name: Optional[str] = None, volume_name: Optional[str] = None) -> List[Dict]:
+def list_export_svms() -> List[str]:
     """
-    List exports from state files.
+    List SVMs that have an exports state file, sorted by name.
     """
-    state_dir = get_state_dir()
-    if not state_dir.exists():
+    prefix_len = len(_EXPORTS_PREFIX)
+    suffix_len = len(_EXPORTS_SUFFIX)
+    try:
+        # DirEntry.is_file() reuses the type from the directory read, so this
+        # needs no per-entry stat (unlike Path.glob).
+        with os.scandir(get_state_dir()) as it:
+            return sorted(
+                entry.name[prefix_len:-suffix_len]
+                for entry in it
+                if entry.name.startswith(_EXPORTS_PREFIX)
+                and entry.name.endswith(_EXPORTS_SUFFIX)
+                and len(entry.name) > prefix_len + suffix_len
+                and entry.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
         return []
 
-    exports: List[Dict] = []
-    if svm_name:
-        per_svm = _load_exports(svm_name)
+
+def iter_exports(svm_name: Optional[str] = None, volume_name: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Yield exports from state files, ordered by (svm, export_id).
+
+    SVM state files are read one at a time, only as far as the caller iterates.
+    """
+    svm_names = [svm_name] if svm_name else list_export_svms()
+    for name in svm_names:
+        per_svm = sorted(_load_exports(name), key=lambda e: int(e.get("export_id") or 0))
         for e in per_svm:
-            exports.append({"svm": svm_name, "volume": _volume_from_path(e.get("path", "")), **e})
-    else:
-        for path in state_dir.glob("exports.*.json"):
-            name = path.name[len("exports.") : -len(".json")]
-            per_svm = _load_exports(name)
-            for e in per_svm:
-                exports.append({"svm": name, "volume": _volume_from_path(e.get("path", "")), **e})
+            volume = _volume_from_path(e.get("path", ""))
+            if volume_name and volume != volume_name:
+                continue
+            yield {"svm": name, "volume": volume, **e}
 
-    if volume_name:
-        exports = [e for e in exports if e.get("volume") == volume_name]
-    return exports
+
+def list_exports(svm_name: Optional[str] = None, volume_name: Optional[str] = None) -> List[Dict]:
+    """
+    List exports from state files.
+    """
+    return list(iter_exports(svm_name, volume_name))
 
 
 def sync(svm_name: str) -> str:
@@ -368,22 +492,23 @@ def list_config_snapshots(svm_name: str) -> List[Dict]:
     """
     List saved ganesha.conf snapshots for a given SVM.
     """
-    snapshot_dir = _config_snapshot_dir()
-    if not snapshot_dir.exists():
-        return []
-
     results: List[Dict] = []
     prefix = f"ganesha.{svm_name}."
     suffix = ".conf"
-    for p in snapshot_dir.glob(f"{prefix}*{suffix}"):
-        if p.name == f"ganesha.{svm_name}.latest.conf":
-            continue
-        version = p.name[len(prefix) : -len(suffix)]
-        try:
-            mtime = p.stat().st_mtime
-        except Exception:
-            mtime = 0.0
-        results.append({"config_version": version, "path": str(p), "mtime": mtime})
+    latest = f"{prefix}latest{suffix}"
+    try:
+        with os.scandir(_config_snapshot_dir()) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)) or name == latest:
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except Exception:
+                    mtime = 0.0
+                results.append({"config_version": name[len(prefix) : -len(suffix)], "path": entry.path, "mtime": mtime})
+    except FileNotFoundError:
+        return []
 
     results.sort(key=lambda x: float(x.get("mtime") or 0.0), reverse=True)
     return results
@@ -411,8 +536,8 @@ def rollback_config(svm_name: str, config_version: str) -> str:
     if not snap.exists():
         raise FileNotFoundError(f"Snapshot not found: {snap}")
 
-    content = snap.read_text(encoding="utf-8")
-    _write_if_changed(config_path, content)
+    # Snapshots are written as UTF-8, so copy the bytes without decoding them.
+    _write_bytes_if_changed(config_path, snap.read_bytes())
     reload(svm_name)
     return str(config_path)
 
@@ -425,13 +550,10 @@ def read_config_snapshot_meta(svm_name: str, config_version: str) -> Dict:
         path = _snapshot_meta_path(svm_name, config_version)
     if not path.exists():
         raise FileNotFoundError(f"Snapshot metadata not found: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def _volume_from_path(path: str) -> str:
     # Expected: <export_dir>/<svm>/<volume> (base dir is configurable)
-    parts = [p for p in path.split("/") if p]
-    if not parts:
-        return ""
-    return parts[-1]
+    return path.rstrip("/").rpartition("/")[2]
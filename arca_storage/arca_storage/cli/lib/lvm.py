@@ -30,7 +30,8 @@ def create_lv(vg_name: str, lv_name: str, size_gib: int, thin: bool = True, *, t
         ["lvdisplay", lv_path],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode == 0:
@@ -57,7 +58,8 @@ def create_lv(vg_name: str, lv_name: str, size_gib: int, thin: bool = True, *, t
         cmd,
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -85,7 +87,8 @@ def resize_lv(vg_name: str, lv_name: str, new_size_gib: int) -> None:
         ["lvdisplay", lv_path],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -96,7 +99,8 @@ def resize_lv(vg_name: str, lv_name: str, new_size_gib: int) -> None:
         ["lvextend", "-L", f"{new_size_gib}G", lv_path],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -121,7 +125,8 @@ def delete_lv(vg_name: str, lv_name: str) -> None:
         ["lvdisplay", lv_path],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
 
     if result.returncode != 0:
@@ -133,7 +138,8 @@ def delete_lv(vg_name: str, lv_name: str) -> None:
         ["lvremove", "-f", lv_path],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
 
     if result.returncode != 0:
@@ -163,7 +169,8 @@ def create_snapshot_lv(vg_name: str, source_lv: str, snap_lv: str) -> str:
         ["lvdisplay", source_path],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
 
     if result.returncode != 0:
@@ -174,7 +181,8 @@ def create_snapshot_lv(vg_name: str, source_lv: str, snap_lv: str) -> str:
         ["lvdisplay", snap_path],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
 
     if result.returncode == 0:
@@ -192,7 +200,8 @@ def create_snapshot_lv(vg_name: str, source_lv: str, snap_lv: str) -> str:
         cmd,
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
 
     if result.returncode != 0:
@@ -0,0 +1,78 @@
+"""
+Naming helpers for LVs and export paths.
+
+The CLI, the API services and the ganesha export state all derive LV names and
+mount paths from (svm, volume[, snapshot]); keeping the scheme in one place
+keeps them in agreement.
+"""
+
+
+def lv_name(svm: str, volume: str) -> str:
+    """
+    Build the LV name of a volume.
+
+    Args:
+        svm: SVM name
+        volume: Volume name
+
+    Returns:
+        LV name (e.g., "vol_tenant_a_vol1")
+    """
+    return f"vol_{svm}_{volume}"
+
+
+def snapshot_lv_name(svm: str, volume: str, snapshot: str) -> str:
+    """
+    Build the LV name of a volume snapshot.
+
+    Args:
+        svm: SVM name
+        volume: Source volume name
+        snapshot: Snapshot name
+
+    Returns:
+        LV name (e.g., "vol_tenant_a_vol1_snap_daily")
+    """
+    return f"vol_{svm}_{volume}_snap_{snapshot}"
+
+
+def svm_root_lv_name(svm: str) -> str:
+    """
+    Build the LV name of an SVM's optional root volume.
+
+    Args:
+        svm: SVM name
+
+    Returns:
+        LV name (e.g., "vol_tenant_a")
+    """
+    return f"vol_{svm}"
+
+
+def svm_path(export_dir: str, svm: str) -> str:
+    """
+    Build an SVM's export root directory.
+
+    Args:
+        export_dir: Configured export base directory (a trailing "/" is ignored)
+        svm: SVM name
+
+    Returns:
+        Directory path (e.g., "/exports/tenant_a")
+    """
+    return f"{export_dir.rstrip('/')}/{svm}"
+
+
+def mount_path(export_dir: str, svm: str, volume: str) -> str:
+    """
+    Build a volume's mount point, which is also its NFS export path.
+
+    Args:
+        export_dir: Configured export base directory (a trailing "/" is ignored)
+        svm: SVM name
+        volume: Volume name
+
+    Returns:
+        Mount point (e.g., "/exports/tenant_a/vol1")
+    """
+    return f"{export_dir.rstrip('/')}/{svm}/{volume}"
@@ -2,7 +2,6 @@
 Network Namespace management functions.
 """
 
-import hashlib
 import re
 import shlex
 import subprocess
@@ -20,6 +19,9 @@ def _hash2_base62_sha256(data: bytes) -> str:
     c1 = CHARS[value % 62]
     c2 = CHARS[(value // 62) % 62]
     """
+    # Only SVM creation names interfaces; keep OpenSSL out of every other import.
+    import hashlib
+
     digest = hashlib.sha256(data).digest()
     value = int.from_bytes(digest, "big")
     c1 = CHARS[value % 62]
@@ -59,6 +61,7 @@ def _ifname_exists_in_root(ifname: str) -> bool:
         capture_output=True,
         text=True,
         check=False,
+        close_fds=False,
     )
     return result.returncode == 0
 
@@ -97,7 +100,8 @@ def create_namespace(name: str) -> None:
         ["ip", "netns", "list"],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if name in result.stdout:
@@ -109,7 +113,8 @@ def create_namespace(name: str) -> None:
         ["ip", "netns", "add", name],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -146,7 +151,8 @@ def attach_vlan(
         ["ip", "link", "show", vlan_if],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode == 0:
@@ -155,7 +161,8 @@ def attach_vlan(
             ["ip", "netns", "exec", namespace, "ip", "link", "show", vlan_if],
             capture_output=True,
             text=True,
-            check=False
+            check=False,
+            close_fds=False
         )
         
         if result.returncode == 0:
@@ -166,19 +173,22 @@ def attach_vlan(
             # Move to namespace
             subprocess.run(
                 ["ip", "link", "set", vlan_if, "netns", namespace],
-                check=True
+                check=True,
+                close_fds=False
             )
     else:
         # Create VLAN interface
         subprocess.run(
             ["ip", "link", "add", "link", parent_if, "name", vlan_if, "type", "vlan", "id", str(vlan_id)],
-            check=True
+            check=True,
+            close_fds=False
         )
         
         # Move to namespace
         subprocess.run(
             ["ip", "link", "set", vlan_if, "netns", namespace],
-            check=True
+            check=True,
+            close_fds=False
         )
     
     # Configure IP and bring up
@@ -197,7 +207,8 @@ def _configure_ip(
     if mtu != 1500:
         subprocess.run(
             ["ip", "netns", "exec", namespace, "ip", "link", "set", interface, "mtu", str(mtu)],
-            check=True
+            check=True,
+            close_fds=False
         )
     
     # Check if IP is already configured
@@ -205,20 +216,23 @@ def _configure_ip(
         ["ip", "netns", "exec", namespace, "ip", "addr", "show", interface],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if ip_cidr not in result.stdout:
         # Add IP address
         subprocess.run(
             ["ip", "netns", "exec", namespace, "ip", "addr", "add", ip_cidr, "dev", interface],
-            check=True
+            check=True,
+            close_fds=False
         )
     
     # Bring interface up
     subprocess.run(
         ["ip", "netns", "exec", namespace, "ip", "link", "set", interface, "up"],
-        check=True
+        check=True,
+        close_fds=False
     )
     
     # Configure gateway if provided
@@ -227,13 +241,15 @@ def _configure_ip(
         subprocess.run(
             ["ip", "netns", "exec", namespace, "ip", "route", "del", "default"],
             capture_output=True,
-            check=False
+            check=False,
+            close_fds=False
         )
         
         # Add default route
         subprocess.run(
             ["ip", "netns", "exec", namespace, "ip", "route", "add", "default", "via", gateway],
-            check=True
+            check=True,
+            close_fds=False
         )
 
 
@@ -252,7 +268,8 @@ def delete_namespace(name: str) -> None:
         ["ip", "netns", "list"],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if name not in result.stdout:
@@ -264,7 +281,8 @@ def delete_namespace(name: str) -> None:
         ["ip", "netns", "del", name],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -9,7 +9,7 @@ from arca_storage.cli.lib.netns import make_vlan_ifname
 
 
 def _run(cmd: Sequence[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(list(cmd), capture_output=True, text=True, check=False)
+    return subprocess.run(list(cmd), capture_output=True, text=True, check=False, close_fds=False)
 
 
 def _resource_exists(name: str) -> bool:
@@ -0,0 +1,146 @@
+"""
+SVM provisioning steps shared by the CLI and the API.
+
+`arca svm create` and `POST /v1/svms` run the same network, ganesha config and
+root LV steps (including rollback on failure); keeping them here keeps both
+create paths in agreement.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from arca_storage.cli.lib import names
+from arca_storage.cli.lib.config import ArcaConfig
+from arca_storage.cli.lib.ganesha import render_config
+from arca_storage.cli.lib.lvm import create_lv, delete_lv
+from arca_storage.cli.lib.netns import attach_vlan, create_namespace
+from arca_storage.cli.lib.xfs import format_xfs
+
+
+def setup_svm_network(
+    name: str,
+    parent_if: str,
+    vlan_id: int,
+    ip_cidr: str,
+    gateway: Optional[str],
+    mtu: int,
+    vlan_ifname: str,
+) -> None:
+    """
+    Create the SVM namespace and attach its VLAN interface.
+
+    Args:
+        name: SVM name (also the namespace name)
+        parent_if: Parent interface (e.g., "bond0")
+        vlan_id: VLAN ID
+        ip_cidr: IP address with CIDR (e.g., "192.168.10.5/24")
+        gateway: Optional gateway IP address
+        mtu: MTU size
+        vlan_ifname: VLAN interface name (see `allocate_vlan_ifname`)
+
+    Raises:
+        RuntimeError: If namespace creation fails
+        subprocess.CalledProcessError: If VLAN attachment fails
+    """
+    create_namespace(name)
+    attach_vlan(name, parent_if, vlan_id, ip_cidr, gateway, mtu, ifname=vlan_ifname)
+
+
+def create_svm_root_lv(name: str, size_gib: int, cfg: ArcaConfig) -> Optional[str]:
+    """
+    Create and format the SVM root LV (used by the Pacemaker Filesystem resource).
+
+    An LV that already exists is left as is, so re-running a create is harmless.
+
+    Args:
+        name: SVM name
+        size_gib: LV size in GiB
+        cfg: Loaded config (VG and thin pool names)
+
+    Returns:
+        Path of the created LV, or None if it already existed
+
+    Raises:
+        RuntimeError: If LV creation or formatting fails
+    """
+    try:
+        lv_path = create_lv(
+            cfg.vg_name, names.svm_root_lv_name(name), size_gib, thin=True, thinpool_name=cfg.thinpool_name
+        )
+        format_xfs(lv_path)
+        return lv_path
+    except Exception as e:
+        if "already exists" not in str(e).lower():
+            raise
+        return None
+
+
+def _discard_root_lv(name: str, root_lv: "Future[Optional[str]]", cfg: ArcaConfig, error: BaseException) -> None:
+    """
+    Delete the root LV if this create made it, after a later step failed with `error`.
+
+    An LV that already existed (create_svm_root_lv returned None) is kept.
+    """
+    try:
+        lv_path = root_lv.result()
+    except Exception:
+        # The LV step failed too; there is nothing of ours to remove.
+        return
+    if not lv_path:
+        return
+    try:
+        delete_lv(cfg.vg_name, names.svm_root_lv_name(name))
+    except Exception as cleanup_error:
+        raise RuntimeError(f"{error} (root LV {lv_path} was left behind: {cleanup_error})") from error
+
+
+def create_svm_resources(
+    name: str,
+    parent_if: str,
+    vlan_id: int,
+    ip_cidr: str,
+    gateway: Optional[str],
+    mtu: int,
+    vlan_ifname: str,
+    root_size_gib: Optional[int],
+    cfg: ArcaConfig,
+) -> Tuple[str, Optional[str]]:
+    """
+    Set up the SVM network, its ganesha config and the optional root LV.
+
+    The root LV is created while the namespace and VLAN are set up. The ganesha
+    config is written only once the network is up, and if the network or the
+    config step fails, a root LV created by this call is deleted again before
+    the error is raised. A failed create therefore leaves no root LV or ganesha
+    config behind, as when the steps ran one after another.
+
+    Args:
+        name: SVM name (also the namespace name)
+        parent_if: Parent interface (e.g., "bond0")
+        vlan_id: VLAN ID
+        ip_cidr: IP address with CIDR (e.g., "192.168.10.5/24")
+        gateway: Optional gateway IP address
+        mtu: MTU size
+        vlan_ifname: VLAN interface name (see `allocate_vlan_ifname`)
+        root_size_gib: Root LV size in GiB, or None for no root LV
+        cfg: Loaded config
+
+    Returns:
+        Tuple of (ganesha config path, root LV path or None if not created)
+
+    Raises:
+        RuntimeError: If a step fails
+        subprocess.CalledProcessError: If VLAN attachment fails
+    """
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="arca-svm-create") as pool:
+        network = pool.submit(setup_svm_network, name, parent_if, vlan_id, ip_cidr, gateway, mtu, vlan_ifname)
+        root_lv = pool.submit(create_svm_root_lv, name, root_size_gib, cfg) if root_size_gib else None
+        try:
+            network.result()
+            config_path = render_config(name, [])
+        except BaseException as e:
+            if root_lv is not None:
+                _discard_root_lv(name, root_lv, cfg, e)
+            raise
+        lv_path = root_lv.result() if root_lv is not None else None
+    return config_path, lv_path
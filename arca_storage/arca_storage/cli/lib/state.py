@@ -12,10 +12,18 @@ import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
 
 from arca_storage.cli.lib.config import load_config
 
+_FileSignature = Optional[Tuple[int, int, int]]
+_VolumeIndex = Dict[Tuple[str, str], Dict[str, Any]]
+
+# (volumes.json path, file signature, {(svm, name): record}) of the last index build.
+_volume_index_cache: Optional[Tuple[Path, _FileSignature, _VolumeIndex]] = None
+
 
 def get_state_dir() -> Path:
     """
@@ -70,25 +78,40 @@ def _snapshots_file() -> Path:
     return _state_dir() / "snapshots.json"
 
 
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return utc_now().isoformat()
+
+
+def _json_default(obj: Any) -> Any:
+    # Records may carry datetimes (e.g. created_at); they are stored as ISO 8601 strings.
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def _load_json(path: Path, default: Any) -> Any:
     if not path.exists():
         return default
-    with open(path, "r", encoding="utf-8") as file:
-        return json.load(file)
+    with open(path, "rb") as file:
+        return orjson.loads(file.read())
 
 
 def _atomic_write_json(path: Path, data: Any) -> None:
+    global _volume_index_cache
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
     try:
         with os.fdopen(tmp_fd, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2, ensure_ascii=False, sort_keys=True)
+            json.dump(data, file, indent=2, ensure_ascii=False, sort_keys=True, default=_json_default)
             file.write("\n")
         os.replace(tmp_path, path)
+        # Do not rely on the file signature for our own writes (mtime granularity).
+        _volume_index_cache = None
     finally:
         try:
             os.unlink(tmp_path)
@@ -96,11 +119,15 @@ def _atomic_write_json(path: Path, data: Any) -> None:
             pass
 
 
+def iter_svms(name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield SVM records in stored (name) order, filtered lazily."""
+    for s in _load_json(_svms_file(), {"items": []}).get("items", []):
+        if not name or s.get("name") == name:
+            yield s
+
+
 def list_svms(name: Optional[str] = None) -> List[Dict[str, Any]]:
-    svms = _load_json(_svms_file(), {"items": []}).get("items", [])
-    if name:
-        svms = [s for s in svms if s.get("name") == name]
-    return svms
+    return list(iter_svms(name))
 
 
 def upsert_svm(svm: Dict[str, Any]) -> None:
@@ -125,13 +152,54 @@ def delete_svm(name: str) -> bool:
     return True
 
 
+def iter_volumes(svm: Optional[str] = None, name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield volume records in stored (svm, name) order, filtered lazily."""
+    for v in _load_json(_volumes_file(), {"items": []}).get("items", []):
+        if (not svm or v.get("svm") == svm) and (not name or v.get("name") == name):
+            yield v
+
+
 def list_volumes(svm: Optional[str] = None, name: Optional[str] = None) -> List[Dict[str, Any]]:
-    volumes = _load_json(_volumes_file(), {"items": []}).get("items", [])
-    if svm:
-        volumes = [v for v in volumes if v.get("svm") == svm]
-    if name:
-        volumes = [v for v in volumes if v.get("name") == name]
-    return volumes
+    return list(iter_volumes(svm, name))
+
+
+def _file_signature(path: Path) -> _FileSignature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _volume_index() -> _VolumeIndex:
+    global _volume_index_cache
+    path = _volumes_file()
+    sig = _file_signature(path)
+    cached = _volume_index_cache
+    if cached is not None and cached[0] == path and cached[1] == sig:
+        return cached[2]
+
+    index: _VolumeIndex = {}
+    for v in _load_json(path, {"items": []}).get("items", []):
+        index.setdefault((v.get("svm"), v.get("name")), v)
+    _volume_index_cache = (path, sig, index)
+    return index
+
+
+def preload_volume_index() -> None:
+    """Build the volume index ahead of the first `get_volume` call."""
+    _volume_index()
+
+
+def get_volume(svm: str, name: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a single volume record by (svm, name).
+
+    The parsed volumes.json is indexed and reused until the file changes, so
+    repeated point lookups do not re-read and scan the whole state file.
+    """
+    record = _volume_index().get((svm, name))
+    return dict(record) if record is not None else None
 
 
 def upsert_volume(volume: Dict[str, Any]) -> None:
@@ -156,17 +224,23 @@ def delete_volume(svm: str, name: str) -> bool:
     return True
 
 
+def iter_snapshots(
+    svm: Optional[str] = None, volume: Optional[str] = None, name: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield snapshot records in stored (svm, volume, name) order, filtered lazily."""
+    for s in _load_json(_snapshots_file(), {"items": []}).get("items", []):
+        if (
+            (not svm or s.get("svm") == svm)
+            and (not volume or s.get("volume") == volume)
+            and (not name or s.get("name") == name)
+        ):
+            yield s
+
+
 def list_snapshots(
     svm: Optional[str] = None, volume: Optional[str] = None, name: Optional[str] = None
 ) -> List[Dict[str, Any]]:
-    snapshots = _load_json(_snapshots_file(), {"items": []}).get("items", [])
-    if svm:
-        snapshots = [s for s in snapshots if s.get("svm") == svm]
-    if volume:
-        snapshots = [s for s in snapshots if s.get("volume") == volume]
-    if name:
-        snapshots = [s for s in snapshots if s.get("name") == name]
-    return snapshots
+    return list(iter_snapshots(svm, volume, name))
 
 
 def upsert_snapshot(snapshot: Dict[str, Any]) -> None:
@@ -19,7 +19,8 @@ def start_unit(unit_name: str) -> None:
         ["systemctl", "start", unit_name],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -40,7 +41,8 @@ def stop_unit(unit_name: str) -> None:
         ["systemctl", "stop", unit_name],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -61,7 +63,8 @@ def is_active(unit_name: str) -> bool:
         ["systemctl", "is-active", unit_name],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     return result.returncode == 0
@@ -3,9 +3,16 @@ Input validation functions.
 """
 
 import ipaddress
-import re
+import string
+from functools import lru_cache
 from typing import Tuple
 
+_NAME_FIRST_CHARS = frozenset(string.ascii_letters + string.digits)
+_NAME_CHARS = (string.ascii_letters + string.digits + "._-").encode("ascii")
+# Well above the longest IPv4 CIDR ("255.255.255.255/32") so padded input that
+# int() accepts, e.g. "10.0.0.1/ 24" or "10.0.0.1/024", still parses as before
+_MAX_CIDR_LEN = 64
+
 
 def validate_name(name: str) -> None:
     """
@@ -23,8 +30,9 @@ def validate_name(name: str) -> None:
     if len(name) < 1 or len(name) > 64:
         raise ValueError("Name must be between 1 and 64 characters")
     
-    # Allow alphanumeric, dots, underscores, hyphens
-    if not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9._-]*$', name):
+    # Allow alphanumeric, dots, underscores, hyphens; translate() deletes every
+    # allowed byte in C, so anything left over is an invalid character
+    if name[0] not in _NAME_FIRST_CHARS or not name.isascii() or name.encode("ascii").translate(None, _NAME_CHARS):
         raise ValueError("Name must start with alphanumeric and contain only alphanumeric, dots, underscores, or hyphens")
 
 
@@ -42,9 +50,13 @@ def validate_vlan(vlan_id: int) -> None:
         raise ValueError("VLAN ID must be between 1 and 4094")
 
 
+@lru_cache(maxsize=1024)
 def validate_ip_cidr(cidr: str) -> Tuple[str, int]:
     """
     Validate an IP address with CIDR notation.
+
+    Successful results are cached per input string; invalid input is
+    re-checked (and raises) on every call.
     
     Args:
         cidr: IP address with CIDR (e.g., "192.168.10.5/24")
@@ -55,6 +67,10 @@ def validate_ip_cidr(cidr: str) -> Tuple[str, int]:
     Raises:
         ValueError: If CIDR is invalid
     """
+    if len(cidr) > _MAX_CIDR_LEN:
+        # Reject oversized input before splitting/int-parsing it
+        raise ValueError(f"Invalid CIDR format: longer than {_MAX_CIDR_LEN} characters")
+
     try:
         parts = cidr.split("/")
         if len(parts) != 2:
@@ -3,9 +3,42 @@ XFS filesystem management functions.
 """
 
 import os
+import re
 import subprocess
 from typing import List, Optional
 
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+_MOUNTINFO_ESCAPE_RE = re.compile(r"\\([0-7]{3})")
+
+
+def _unescape_mountinfo(field: str) -> str:
+    """Decode the octal escapes (e.g. "\\040" for a space) used in mountinfo paths."""
+    if "\\" not in field:
+        return field
+    return _MOUNTINFO_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _is_mountpoint(mount_point: str) -> bool:
+    """
+    Check whether a directory is a mount point without forking mountpoint(1).
+    
+    Args:
+        mount_point: Mount point directory
+        
+    Returns:
+        True if a filesystem is mounted on the directory
+    """
+    target = os.path.realpath(mount_point)
+    try:
+        with open(MOUNTINFO_PATH, "r", encoding="utf-8", errors="surrogateescape") as f:
+            for line in f:
+                fields = line.split(" ", 5)
+                if len(fields) > 4 and _unescape_mountinfo(fields[4]) == target:
+                    return True
+    except OSError:
+        return os.path.ismount(target)
+    return False
+
 
 def format_xfs(device: str, options: Optional[List[str]] = None) -> None:
     """
@@ -27,7 +60,8 @@ def format_xfs(device: str, options: Optional[List[str]] = None) -> None:
         ["blkid", device],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode == 0 and "xfs" in result.stdout.lower():
@@ -52,7 +86,8 @@ def format_xfs(device: str, options: Optional[List[str]] = None) -> None:
         cmd,
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -74,14 +109,7 @@ def mount_xfs(device: str, mount_point: str) -> None:
     os.makedirs(mount_point, exist_ok=True)
     
     # Check if already mounted
-    result = subprocess.run(
-        ["mountpoint", "-q", mount_point],
-        capture_output=True,
-        text=True,
-        check=False
-    )
-    
-    if result.returncode == 0:
+    if _is_mountpoint(mount_point):
         # Already mounted, skip
         return
     
@@ -98,7 +126,8 @@ def mount_xfs(device: str, mount_point: str) -> None:
         ["mount", "-o", ",".join(mount_options), device, mount_point],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -116,14 +145,7 @@ def umount_xfs(mount_point: str) -> None:
         RuntimeError: If unmounting fails
     """
     # Check if mounted
-    result = subprocess.run(
-        ["mountpoint", "-q", mount_point],
-        capture_output=True,
-        text=True,
-        check=False
-    )
-    
-    if result.returncode != 0:
+    if not _is_mountpoint(mount_point):
         # Not mounted, skip
         return
     
@@ -131,7 +153,8 @@ def umount_xfs(mount_point: str) -> None:
         ["umount", mount_point],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
@@ -149,14 +172,7 @@ def grow_xfs(mount_point: str) -> None:
         RuntimeError: If growing fails
     """
     # Check if mounted
-    result = subprocess.run(
-        ["mountpoint", "-q", mount_point],
-        capture_output=True,
-        text=True,
-        check=False
-    )
-    
-    if result.returncode != 0:
+    if not _is_mountpoint(mount_point):
         raise RuntimeError(f"Mount point {mount_point} is not mounted")
     
     # Grow filesystem
@@ -164,7 +180,8 @@ def grow_xfs(mount_point: str) -> None:
         ["xfs_growfs", mount_point],
         capture_output=True,
         text=True,
-        check=False
+        check=False,
+        close_fds=False
     )
     
     if result.returncode != 0:
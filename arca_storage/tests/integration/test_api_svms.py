@@ -2,6 +2,8 @@
 Integration tests for API SVM endpoints.
 """
 
+import logging
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -137,3 +139,92 @@ class TestDeleteSVM:
         response = client.delete("/v1/svms/nonexistent")
 
         assert response.status_code == 404
+
+
+class TestInternalError:
+    """Tests for the global exception handler."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.services.svm_service.list_svms")
+    def test_unhandled_error_returns_envelope(self, mock_list):
+        """Test unexpected errors return the standard 500 error envelope."""
+        mock_list.side_effect = KeyError("boom")
+
+        response = TestClient(app, raise_server_exceptions=False).get("/v1/svms")
+
+        assert response.status_code == 500
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["status"] == "error"
+        assert data["error"] == {"code": "INTERNAL_ERROR", "message": "Internal server error", "details": {}}
+        assert data["request_id"]
+        assert response.headers["x-request-id"] == data["request_id"]
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.services.svm_service.list_svms")
+    def test_unhandled_error_logged_off_request_thread(self, mock_list):
+        """Test unexpected errors are logged with a traceback by the background log listener."""
+        mock_list.side_effect = KeyError("boom")
+        records = []
+
+        class _Collect(logging.Handler):
+            def emit(self, record):
+                records.append((record, threading.current_thread().name))
+
+        root = logging.getLogger()
+        handler = _Collect(level=logging.ERROR)
+        root.addHandler(handler)
+        try:
+            with TestClient(app, raise_server_exceptions=False) as lifespan_client:
+                response = lifespan_client.get("/v1/svms")
+        finally:
+            root.removeHandler(handler)
+
+        assert response.status_code == 500
+        assert len(records) == 1
+        record, thread_name = records[0]
+        assert response.headers["x-request-id"] in record.getMessage()
+        assert record.exc_info[0] is KeyError
+        assert thread_name != threading.current_thread().name
+
+
+class TestRequestID:
+    """Tests for the request-id middleware."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.services.svm_service.list_svms")
+    def test_request_id_header_matches_body(self, mock_list, client):
+        """Test the X-Request-ID header echoes the request_id in the envelope."""
+        mock_list.return_value = {"items": [], "next_cursor": None}
+
+        first = client.get("/v1/svms")
+        second = client.get("/v1/svms")
+
+        assert first.headers["x-request-id"] == first.json()["request_id"]
+        assert second.headers["x-request-id"] == second.json()["request_id"]
+        assert first.json()["request_id"] != second.json()["request_id"]
+
+
+class TestLifespan:
+    """Tests for application startup."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.main.preload_volume_index")
+    @patch("arca_storage.api.main.load_config")
+    def test_startup_warms_caches(self, mock_config, mock_preload):
+        """Test the config and volume index are loaded before requests are served."""
+        with TestClient(app):
+            mock_config.assert_called_once_with()
+            mock_preload.assert_called_once_with()
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.services.svm_service.list_svms")
+    @patch("arca_storage.api.main.preload_volume_index")
+    @patch("arca_storage.api.main.load_config")
+    def test_startup_survives_warmup_failure(self, mock_config, mock_preload, mock_list):
+        """Test a failing warmup does not prevent the app from serving requests."""
+        mock_config.side_effect = PermissionError("denied")
+        mock_list.return_value = {"items": [], "next_cursor": None}
+
+        with TestClient(app) as lifespan_client:
+            assert lifespan_client.get("/v1/svms").status_code == 200
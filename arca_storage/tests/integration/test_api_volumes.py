@@ -99,3 +99,79 @@ class TestDeleteVolume:
         data = response.json()
         assert data["status"] == "ok"
         assert data["data"]["deleted"] is True
+
+
+class TestApplyQosBulk:
+    """Tests for POST /v1/qos/bulk."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.services.qos_service.apply_qos_bulk")
+    def test_apply_qos_bulk_success(self, mock_bulk, client):
+        """Test bulk QoS passes every item to the service in order."""
+        mock_bulk.return_value = [
+            {"svm": "tenant_a", "volume": "vol1", "device_id": "253:1", "read_iops": 100},
+            {"svm": "tenant_a", "volume": "vol2", "device_id": "253:2"},
+        ]
+
+        response = client.post(
+            "/v1/qos/bulk",
+            json={
+                "items": [
+                    {"svm": "tenant_a", "volume": "vol1", "read_iops": 100},
+                    {"svm": "tenant_a", "volume": "vol2"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert [i["volume"] for i in response.json()["data"]["items"]] == ["vol1", "vol2"]
+        specs = mock_bulk.call_args.args[0]
+        assert [(s["volume"], s["read_iops"]) for s in specs] == [("vol1", 100), ("vol2", None)]
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.services.qos_service.apply_qos_bulk")
+    def test_apply_qos_bulk_unknown_volume(self, mock_bulk, client):
+        """Test an unknown volume maps to 404."""
+        mock_bulk.side_effect = RuntimeError("Volume missing not found in SVM tenant_a")
+
+        response = client.post("/v1/qos/bulk", json={"items": [{"svm": "tenant_a", "volume": "missing"}]})
+
+        assert response.status_code == 404
+
+    @pytest.mark.integration
+    @patch("arca_storage.api.services.qos_service._get_device_id")
+    @patch("arca_storage.api.services.qos_service.state_get_volume")
+    @patch("arca_storage.api.services.qos_service._get_cgroup_base")
+    def test_apply_qos_bulk_unresolvable_device(self, mock_base, mock_get, mock_devid, client, temp_dir):
+        """Test a device that cannot be resolved maps to 404 and no limits are written."""
+        mock_base.return_value = temp_dir / "arca"
+        mock_get.side_effect = lambda svm, name: {"lv_path": f"/dev/vg_pool_01/vol_{svm}_{name}"}
+        mock_devid.side_effect = ["253:1", RuntimeError("Failed to get device ID for vol_tenant_a_vol2")]
+
+        response = client.post(
+            "/v1/qos/bulk",
+            json={
+                "items": [
+                    {"svm": "tenant_a", "volume": "vol1", "read_iops": 100},
+                    {"svm": "tenant_a", "volume": "vol2", "read_iops": 100},
+                ]
+            },
+        )
+
+        assert response.status_code == 404
+        assert not (temp_dir / "arca").exists()
+
+    @pytest.mark.integration
+    def test_apply_qos_bulk_empty(self, client):
+        """Test an empty item list is rejected."""
+        response = client.post("/v1/qos/bulk", json={"items": []})
+
+        assert response.status_code == 422
+
+    @pytest.mark.integration
+    def test_apply_qos_bulk_schema(self, client):
+        """Test the OpenAPI schema documents the bulk response model."""
+        schema = client.get("/openapi.json").json()
+
+        response_schema = schema["paths"]["/v1/qos/bulk"]["post"]["responses"]["200"]["content"]["application/json"]
+        assert response_schema["schema"]["$ref"].endswith("/VolumeQoSBulkResponse")
@@ -2,6 +2,7 @@
 Integration tests for CLI export commands.
 """
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -57,3 +58,130 @@ class TestExportRemove:
         assert "Removing export" in result.stdout
         mock_remove.assert_called_once()
         mock_reload.assert_called_once_with("tenant_a")
+
+
+class TestExportReload:
+    """Tests for batching reloads with --no-reload and export reload."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.export.add_export")
+    @patch("arca_storage.cli.commands.export.reload_ganesha")
+    def test_add_no_reload_then_reload(self, mock_reload, mock_add):
+        """Test --no-reload skips the reload and export reload runs it once."""
+        runner = CliRunner()
+        for client in ["10.0.0.0/24", "10.0.1.0/24"]:
+            result = runner.invoke(
+                app,
+                ["export", "add", "--volume", "vol1", "--svm", "tenant_a", "--client", client, "--no-reload"],
+            )
+            assert result.exit_code == 0
+        assert mock_add.call_count == 2
+        # add_export itself must not reload either, or --no-reload would not batch anything.
+        assert all(c.kwargs["reload_service"] is False for c in mock_add.call_args_list)
+        mock_reload.assert_not_called()
+
+        result = runner.invoke(app, ["export", "reload", "--svm", "tenant_a"])
+
+        assert result.exit_code == 0
+        mock_reload.assert_called_once_with("tenant_a")
+
+
+class TestExportSync:
+    """Tests for export sync command."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.export.sync_ganesha")
+    def test_sync_all(self, mock_sync, temp_dir, monkeypatch):
+        """Test --all syncs every SVM with an exports state file, in name order."""
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+        for filename in ["exports.tenant_b.json", "exports.tenant_a.json", "exports.json", "svms.json"]:
+            (temp_dir / filename).write_text("[]")
+        (temp_dir / "exports.dir.json").mkdir()
+        mock_sync.side_effect = lambda name: f"/etc/ganesha/ganesha.{name}.conf"
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["export", "sync", "--all"])
+
+        assert result.exit_code == 0
+        assert sorted(c.args[0] for c in mock_sync.call_args_list) == ["tenant_a", "tenant_b"]
+        assert result.stdout.splitlines() == [
+            "Synced: tenant_a -> /etc/ganesha/ganesha.tenant_a.conf",
+            "Synced: tenant_b -> /etc/ganesha/ganesha.tenant_b.conf",
+        ]
+
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.export.sync_ganesha")
+    def test_sync_all_continues_after_failure(self, mock_sync, temp_dir, monkeypatch):
+        """Test a failing SVM does not stop the others, but fails the command."""
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+        for filename in ["exports.tenant_a.json", "exports.tenant_b.json"]:
+            (temp_dir / filename).write_text("[]")
+
+        def fake_sync(name):
+            if name == "tenant_a":
+                raise RuntimeError("reload failed")
+            return f"/etc/ganesha/ganesha.{name}.conf"
+
+        mock_sync.side_effect = fake_sync
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["export", "sync", "--all", "--jobs", "1"])
+
+        assert result.exit_code == 1
+        assert "Synced: tenant_b" in result.stdout
+        assert "Failed: tenant_a: reload failed" in result.stderr
+        assert "1 of 2 SVM(s) failed: tenant_a" in result.stderr
+
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.export.sync_ganesha")
+    def test_sync_all_missing_state_dir(self, mock_sync, temp_dir, monkeypatch):
+        """Test --all with no state directory syncs nothing."""
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir / "missing"))
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["export", "sync", "--all"])
+
+        assert result.exit_code == 0
+        assert "No SVMs found to sync" in result.stdout
+        mock_sync.assert_not_called()
+
+
+class TestExportSnapshotShow:
+    """Tests for export snapshot-show command."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.export.read_config_snapshot_meta")
+    def test_snapshot_show_json(self, mock_meta):
+        """Test --json prints the metadata as sorted, indented JSON."""
+        mock_meta.return_value = {"svm": "tenant_a", "config_version": "abc", "exports": [{"client": "10.0.0.0/24"}]}
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["export", "snapshot-show", "--svm", "tenant_a", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == mock_meta.return_value
+        assert result.stdout.index('"config_version"') < result.stdout.index('"svm"')
+        mock_meta.assert_called_once_with("tenant_a", "latest")
+
+
+class TestExportList:
+    """Tests for export list command."""
+
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.export.ganesha_list_exports")
+    def test_list_exports(self, mock_list):
+        """Test one line is printed per export."""
+        mock_list.return_value = [
+            {"svm": "tenant_a", "volume": "vol1", "client": "10.0.0.0/24", "access": "rw", "export_id": 101},
+            {"svm": "tenant_a", "volume": "vol2", "client": "10.0.1.0/24", "access": "ro", "export_id": 102},
+        ]
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["export", "list", "--svm", "tenant_a"])
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [
+            "tenant_a/vol1 client=10.0.0.0/24 access=rw export_id=101",
+            "tenant_a/vol2 client=10.0.1.0/24 access=ro export_id=102",
+        ]
+        mock_list.assert_called_once_with(svm_name="tenant_a", volume_name=None)
@@ -14,9 +14,9 @@ class TestSVMCreate:
     """Tests for svm create command."""
 
     @pytest.mark.integration
-    @patch("arca_storage.cli.commands.svm.create_namespace")
-    @patch("arca_storage.cli.commands.svm.attach_vlan")
-    @patch("arca_storage.cli.commands.svm.render_config")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.render_config")
     @patch("arca_storage.cli.commands.svm.create_group")
     def test_create_svm_success(self, mock_create_group, mock_render, mock_attach, mock_create_ns):
         """Test successful SVM creation."""
@@ -32,6 +32,61 @@ class TestSVMCreate:
         mock_render.assert_called_once()
         mock_create_group.assert_called_once()
 
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.svm.state_upsert_svm")
+    @patch("arca_storage.cli.commands.svm.allocate_vlan_ifname", return_value="v100-tenantaXy")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.render_config", return_value="/etc/ganesha/ganesha.tenant_a.conf")
+    @patch("arca_storage.cli.lib.provision.create_lv", return_value="/dev/vg_pool_01/vol_tenant_a")
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.commands.svm.create_group")
+    def test_create_svm_with_root_volume(
+        self, mock_create_group, mock_format, mock_create_lv, mock_render, mock_attach, mock_create_ns, *_
+    ):
+        """Test root LV creation runs alongside network setup and is reported in order."""
+        runner = CliRunner()
+        result = runner.invoke(
+            app, ["svm", "create", "tenant_a", "--vlan", "100", "--ip", "192.168.10.5/24", "--root-size", "10"]
+        )
+
+        assert result.exit_code == 0
+        mock_create_ns.assert_called_once_with("tenant_a")
+        mock_format.assert_called_once_with("/dev/vg_pool_01/vol_tenant_a")
+        assert mock_create_group.call_args.kwargs["create_filesystem"] is True
+        lines = result.stdout.splitlines()
+        assert lines.index("  Generated ganesha config: /etc/ganesha/ganesha.tenant_a.conf") < lines.index(
+            "  Created root LV: /dev/vg_pool_01/vol_tenant_a"
+        )
+
+    @pytest.mark.integration
+    @patch("arca_storage.cli.commands.svm.state_upsert_svm")
+    @patch("arca_storage.cli.commands.svm.allocate_vlan_ifname", return_value="v100-tenantaXy")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.render_config")
+    @patch("arca_storage.cli.lib.provision.create_lv", return_value="/dev/vg_pool_01/vol_tenant_a")
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.lib.provision.delete_lv")
+    @patch("arca_storage.cli.commands.svm.create_group")
+    def test_create_svm_with_root_volume_network_failure(
+        self, mock_create_group, mock_delete_lv, mock_format, mock_create_lv, mock_render, mock_attach, *_
+    ):
+        """Test a failed VLAN attach removes the root LV created alongside it and writes no config."""
+        mock_attach.side_effect = RuntimeError("RTNETLINK answers: File exists")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app, ["svm", "create", "tenant_a", "--vlan", "100", "--ip", "192.168.10.5/24", "--root-size", "10"]
+        )
+
+        assert result.exit_code == 1
+        assert "RTNETLINK answers: File exists" in result.stderr
+        mock_delete_lv.assert_called_once_with("vg_pool_01", "vol_tenant_a")
+        mock_render.assert_not_called()
+        mock_create_group.assert_not_called()
+        assert "Created root LV" not in result.stdout
+
     @pytest.mark.integration
     def test_create_svm_invalid_name(self):
         """Test creating SVM with invalid name."""
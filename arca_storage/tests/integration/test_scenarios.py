@@ -17,9 +17,9 @@ class TestSVMWorkflow:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    @patch("arca_storage.cli.commands.svm.create_namespace")
-    @patch("arca_storage.cli.commands.svm.attach_vlan")
-    @patch("arca_storage.cli.commands.svm.render_config")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.render_config")
     @patch("arca_storage.cli.commands.svm.create_group")
     @patch("arca_storage.cli.commands.volume.create_lv")
     @patch("arca_storage.cli.commands.volume.format_xfs")
@@ -168,7 +168,7 @@ class TestErrorHandling:
     """Test error handling scenarios."""
 
     @pytest.mark.integration
-    @patch("arca_storage.cli.commands.svm.create_namespace")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
     def test_svm_create_failure_rollback(self, mock_create_ns):
         """Test SVM creation failure triggers rollback."""
         mock_create_ns.side_effect = RuntimeError("Failed to create namespace")
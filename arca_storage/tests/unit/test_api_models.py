@@ -0,0 +1,79 @@
+"""
+Unit tests for API request models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from arca_storage.api.models import ExportCreate, SnapshotCreate, SVMCreate, VolumeCreate, _is_plain_ipv4_cidr
+
+
+class TestNameValidation:
+    """Tests for name validation in request models."""
+
+    @pytest.mark.unit
+    def test_valid_names(self):
+        """Test valid names are accepted."""
+        for name in ["tenant_a", "tenant-1", "tenant.1", "a", "A9", "a" * 64]:
+            VolumeCreate(name=name, svm="tenant_a", size_gib=1)
+
+    @pytest.mark.unit
+    def test_invalid_names(self):
+        """Test invalid names are rejected."""
+        for name in ["tenant a", "tenant@a", "-tenant", "_tenant", ".tenant", "tenant\n", "tenänt", "vol/1"]:
+            with pytest.raises(ValidationError):
+                VolumeCreate(name=name, svm="tenant_a", size_gib=1)
+
+    @pytest.mark.unit
+    def test_all_name_fields_validated(self):
+        """Test every name field of a model is validated."""
+        with pytest.raises(ValidationError):
+            SnapshotCreate(name="snap1", svm="tenant_a", volume="bad volume")
+
+
+class TestRequestModelConfig:
+    """Tests for the shared request model configuration."""
+
+    @pytest.mark.unit
+    def test_unknown_fields_rejected(self):
+        """Test request bodies with unknown fields are rejected."""
+        with pytest.raises(ValidationError):
+            VolumeCreate(name="vol1", svm="tenant_a", size_gib=1, size_gb=1)
+
+    @pytest.mark.unit
+    def test_request_models_frozen(self):
+        """Test validated request models cannot be modified."""
+        volume = VolumeCreate(name="vol1", svm="tenant_a", size_gib=1)
+        with pytest.raises(ValidationError):
+            volume.size_gib = 2
+
+
+class TestCIDRValidation:
+    """Tests for CIDR validation in request models."""
+
+    @pytest.mark.unit
+    def test_fast_path_accepts_plain_cidrs(self):
+        """Test the fast path recognizes common CIDRs."""
+        for value in ["10.0.0.0/24", "192.168.10.5/32", "0.0.0.0/0", "255.255.255.255/16"]:
+            assert _is_plain_ipv4_cidr(value)
+
+    @pytest.mark.unit
+    def test_fast_path_defers_unusual_input(self):
+        """Test the fast path leaves anything unusual to ipaddress."""
+        unusual = ["10.0.0.0", "10.0.0.0/33", "010.0.0.0/24", "10.0.0/24", "10.0.0.0/255.255.255.0", "10.0.0.0/24/1"]
+        for value in unusual:
+            assert not _is_plain_ipv4_cidr(value)
+
+    @pytest.mark.unit
+    def test_client_netmask_still_accepted(self):
+        """Test netmask-style client CIDRs are still accepted via ipaddress."""
+        ExportCreate(svm="tenant_a", volume="vol1", client="10.0.0.0/255.255.255.0")
+
+    @pytest.mark.unit
+    def test_invalid_cidrs_rejected(self):
+        """Test invalid CIDRs are rejected by both validators."""
+        for value in ["10.0.0.0", "10.0.0.256/24", "10.0.0.0/33", "010.0.0.1/24", "a.b.c.d/24"]:
+            with pytest.raises(ValidationError):
+                SVMCreate(name="tenant_a", vlan_id=100, ip_cidr=value)
+            with pytest.raises(ValidationError):
+                ExportCreate(svm="tenant_a", volume="vol1", client=value)
@@ -0,0 +1,180 @@
+"""
+Unit tests for bootstrap command helpers.
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from arca_storage.cli.commands import bootstrap
+
+
+class TestCopyIfMissing:
+    """Tests for _copy_if_missing."""
+
+    @pytest.mark.unit
+    def test_copies_with_metadata(self, temp_dir):
+        """Test a missing destination gets the source's content, mode and mtime."""
+        src = temp_dir / "storage-runtime.conf"
+        dst = temp_dir / "installed.conf"
+        src.write_text("[storage]\n")
+        os.chmod(src, 0o640)
+        os.utime(src, (1_000_000, 1_000_000))
+
+        assert bootstrap._copy_if_missing(src, dst) is True
+
+        assert dst.read_text() == "[storage]\n"
+        assert dst.stat().st_mode & 0o777 == 0o640
+        assert dst.stat().st_mtime == 1_000_000
+
+    @pytest.mark.unit
+    def test_existing_destination_untouched(self, temp_dir):
+        """Test an existing destination is left alone."""
+        src = temp_dir / "storage-runtime.conf"
+        dst = temp_dir / "installed.conf"
+        src.write_text("packaged\n")
+        dst.write_text("edited by the operator\n")
+
+        assert bootstrap._copy_if_missing(src, dst) is False
+        assert dst.read_text() == "edited by the operator\n"
+
+    @pytest.mark.unit
+    def test_missing_source(self, temp_dir):
+        """Test a missing source is skipped without creating the destination."""
+        dst = temp_dir / "installed.conf"
+
+        assert bootstrap._copy_if_missing(temp_dir / "missing.conf", dst) is False
+        assert not dst.exists()
+
+    @pytest.mark.unit
+    def test_failed_copy_removes_partial_file(self, temp_dir):
+        """Test a failing copy leaves no partial destination to be skipped next time."""
+        src = temp_dir / "storage-runtime.conf"
+        dst = temp_dir / "installed.conf"
+        src.write_text("[storage]\n")
+
+        with patch("arca_storage.cli.commands.bootstrap.shutil.copyfileobj", side_effect=OSError("No space left")):
+            with pytest.raises(OSError, match="No space left"):
+                bootstrap._copy_if_missing(src, dst)
+
+        assert not dst.exists()
+
+
+class TestInstallFile:
+    """Tests for _install_file."""
+
+    @pytest.mark.unit
+    def test_install_file(self, temp_dir):
+        """Test new and changed content is copied and identical content is skipped."""
+        src = temp_dir / "nfs-ganesha@.service"
+        dst = temp_dir / "installed.service"
+        src.write_text("[Unit]\n")
+
+        assert bootstrap._install_file(src, dst) is True
+        assert dst.read_text() == "[Unit]\n"
+
+        with patch("arca_storage.cli.commands.bootstrap.shutil.copy2") as mock_copy:
+            assert bootstrap._install_file(src, dst) is False
+        mock_copy.assert_not_called()
+
+        src.write_text("[Unit]\nDescription=changed\n")
+        assert bootstrap._install_file(src, dst) is True
+        assert dst.read_text() == "[Unit]\nDescription=changed\n"
+
+
+class TestWriteEnvFile:
+    """Tests for _write_env_file."""
+
+    @pytest.mark.unit
+    def test_write_env_file(self, temp_dir):
+        """Test the env file is created with its directory and rewritten only on change."""
+        env_path = temp_dir / "arca-storage" / "arca-storage.env"
+        cfg = SimpleNamespace(
+            ganesha_config_dir="/etc/ganesha", export_dir="/exports", api_host="0.0.0.0", api_port=8080, state_dir=None
+        )
+
+        with patch("arca_storage.cli.commands.bootstrap._env_file_path", return_value=env_path):
+            assert bootstrap._write_env_file(cfg) is True
+            assert "ARCA_API_PORT=8080\n" in env_path.read_text()
+            mtime = env_path.stat().st_mtime_ns
+
+            assert bootstrap._write_env_file(cfg) is False
+            assert env_path.stat().st_mtime_ns == mtime
+
+            cfg.api_port = 8081
+            assert bootstrap._write_env_file(cfg) is True
+            assert "ARCA_API_PORT=8081\n" in env_path.read_text()
+
+
+class TestDaemonReload:
+    """Tests for the daemon-reload decision in install."""
+
+    @pytest.mark.unit
+    @patch("arca_storage.cli.commands.bootstrap.subprocess.run")
+    def test_needs_daemon_reload(self, mock_run):
+        """Test any unit reporting NeedDaemonReload=yes requires a reload."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="no\nyes\n")
+
+        assert bootstrap._needs_daemon_reload(["arca-storage-api.service", "nfs-ganesha@.service"]) is True
+        assert mock_run.call_args.args[0] == [
+            "systemctl",
+            "show",
+            "-p",
+            "NeedDaemonReload",
+            "--value",
+            "arca-storage-api.service",
+            "nfs-ganesha@.service",
+        ]
+
+        mock_run.return_value = MagicMock(returncode=0, stdout="no\nno\n")
+        assert bootstrap._needs_daemon_reload(["arca-storage-api.service", "nfs-ganesha@.service"]) is False
+
+    @pytest.mark.unit
+    @patch("arca_storage.cli.commands.bootstrap.subprocess.run")
+    def test_needs_daemon_reload_query_fails(self, mock_run):
+        """Test a failing systemctl query errs on the side of reloading."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="")
+
+        assert bootstrap._needs_daemon_reload(["nfs-ganesha@.service"]) is True
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "args,units_changed,stale,expect_reload",
+        [
+            ([], True, False, True),
+            ([], False, True, True),
+            ([], False, False, False),
+            (["--no-reload"], True, True, False),
+        ],
+    )
+    @patch("arca_storage.cli.commands.bootstrap._write_env_file")
+    @patch("arca_storage.cli.commands.bootstrap.os.chmod")
+    @patch("arca_storage.cli.commands.bootstrap.Path.mkdir")
+    @patch("arca_storage.cli.commands.bootstrap._needs_daemon_reload")
+    @patch("arca_storage.cli.commands.bootstrap._install_file")
+    @patch("arca_storage.cli.commands.bootstrap._run")
+    def test_install_reloads_changed_or_stale_units(
+        self,
+        mock_run,
+        mock_install,
+        mock_stale,
+        mock_mkdir,
+        mock_chmod,
+        mock_env,
+        args,
+        units_changed,
+        stale,
+        expect_reload,
+    ):
+        """Test install reloads when this run changed units or systemd still sees stale ones."""
+        mock_install.return_value = units_changed
+        mock_stale.return_value = stale
+
+        result = CliRunner().invoke(bootstrap.app, ["install", "--no-install-config", *args])
+
+        assert result.exit_code == 0, result.output
+        reloads = [c for c in mock_run.call_args_list if c.args[0] == ["systemctl", "daemon-reload"]]
+        assert len(reloads) == (1 if expect_reload else 0)
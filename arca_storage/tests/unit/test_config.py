@@ -63,3 +63,57 @@ def test_load_config_reads_values(monkeypatch, temp_dir):
     assert cfg.ganesha_protocols == "3,4"
     assert cfg.ganesha_mountd_port == 20048
     assert cfg.ganesha_nlm_port == 32768
+
+
+@pytest.mark.unit
+def test_load_config_cached_until_file_changes(monkeypatch, temp_dir):
+    runtime_path = temp_dir / "storage-runtime.conf"
+    runtime_path.write_text("[storage]\napi_port = 18080\n", encoding="utf-8")
+    monkeypatch.setenv("ARCA_BOOTSTRAP_CONFIG_PATH", str(temp_dir / "missing-bootstrap.conf"))
+    monkeypatch.setenv("ARCA_RUNTIME_CONFIG_PATH", str(runtime_path))
+    from arca_storage.cli.lib.config import load_config
+
+    first = load_config()
+    assert load_config() is first
+
+    runtime_path.write_text("[storage]\napi_port = 28080\n", encoding="utf-8")
+    assert load_config().api_port == 28080
+
+
+@pytest.mark.unit
+def test_load_config_reads_only_storage_section(monkeypatch, temp_dir):
+    bootstrap_path = temp_dir / "storage-bootstrap.conf"
+    bootstrap_path.write_text(
+        "\n".join(
+            [
+                "# vg_name = vg_commented",
+                "[other]",
+                "vg_name = vg_other",
+                "[storage]",
+                "; parent_if = bond_commented",
+                "VG_Name = vg_test",
+                "parent_if: bond9",
+                "drbd_resource = r9",
+                "drbd_resource = r10",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("ARCA_BOOTSTRAP_CONFIG_PATH", str(bootstrap_path))
+    monkeypatch.setenv("ARCA_RUNTIME_CONFIG_PATH", str(temp_dir / "missing-runtime.conf"))
+    from arca_storage.cli.lib.config import load_config
+
+    cfg = load_config()
+    assert cfg.vg_name == "vg_test"
+    assert cfg.parent_if == "bond9"
+    assert cfg.drbd_resource == "r10"
+    assert cfg.api_port == 8080
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("raw, expected", [("/exports", "/exports"), ("/srv/exports//", "/srv/exports"), ("/", "/")])
+def test_export_dir_is_normalized(raw, expected):
+    from arca_storage.cli.lib.config import ArcaConfig
+
+    assert ArcaConfig(export_dir=raw).export_dir == expected
@@ -2,12 +2,15 @@
 Unit tests for ganesha module.
 """
 
+import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
-from arca_storage.cli.lib.ganesha import add_export, reload, remove_export, render_config, sync
+from arca_storage.cli.lib import ganesha
+from arca_storage.cli.lib.ganesha import add_export, iter_exports, reload, remove_export, render_config, sync
 
 
 class TestRenderConfig:
@@ -47,6 +50,40 @@ class TestRenderConfig:
         # Verify file was written
         assert mock_file().write.call_count >= 1
 
+    @pytest.mark.unit
+    @patch("pathlib.Path.mkdir")
+    @patch("builtins.open", new_callable=mock_open)
+    def test_render_config_compiles_template_once(self, mock_file, mock_mkdir):
+        """Test the template is read and compiled once, then reused."""
+        ganesha._get_template.cache_clear()
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as mock_read:
+            render_config("tenant_a", [])
+            render_config("tenant_b", [])
+
+        template_reads = [c for c in mock_read.call_args_list if c.args[0].name == "ganesha.conf.j2"]
+        assert len(template_reads) == 1
+
+    @pytest.mark.unit
+    def test_render_config_latest_links_to_snapshot(self, temp_dir, monkeypatch):
+        """Test latest.conf/json are symlinks that follow the newest snapshot."""
+        from arca_storage.cli.lib.config import ArcaConfig
+
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+        cfg = ArcaConfig(ganesha_config_dir=str(temp_dir / "ganesha"))
+        with patch("arca_storage.cli.lib.ganesha.load_config", return_value=cfg):
+            render_config("tenant_a", [])
+            export = {"export_id": 101, "path": "/exports/tenant_a/vol1", "client": "10.0.0.0/24", "access": "RW"}
+            config_path = render_config("tenant_a", [export])
+
+        snapshot_dir = temp_dir / "config"
+        latest = snapshot_dir / "ganesha.tenant_a.latest.conf"
+        latest_meta = snapshot_dir / "ganesha.tenant_a.latest.json"
+        assert latest.is_symlink() and latest_meta.is_symlink()
+        assert latest.read_text(encoding="utf-8") == Path(config_path).read_text(encoding="utf-8")
+        version = json.loads(latest_meta.read_text(encoding="utf-8"))["config_version"]
+        assert latest.resolve() == snapshot_dir / f"ganesha.tenant_a.{version}.conf"
+        assert [s["config_version"] for s in ganesha.list_config_snapshots("tenant_a")].count(version) == 1
+
 
 class TestReload:
     """Tests for reload function."""
@@ -59,7 +96,11 @@ class TestReload:
         reload("tenant_a")
 
         mock_subprocess.assert_called_once_with(
-            ["systemctl", "reload", "nfs-ganesha@tenant_a"], capture_output=True, text=True, check=False
+            ["systemctl", "reload", "nfs-ganesha@tenant_a"],
+            capture_output=True,
+            text=True,
+            check=False,
+            close_fds=False,
         )
 
     @pytest.mark.unit
@@ -83,11 +124,15 @@ class TestAddExport:
         """Test adding a new export."""
         mock_load.return_value = []
 
-        add_export("tenant_a", "vol1", "10.0.0.0/24", "rw", True)
+        entry = add_export("tenant_a", "vol1", "10.0.0.0/24", "rw", True)
 
+        assert entry == mock_save.call_args[0][1][-1]
+        assert entry["export_id"] == 1
         mock_load.assert_called_once_with("tenant_a")
         mock_save.assert_called_once()
         mock_render.assert_called_once()
+        # The config loaded by add_export is handed down rather than reloaded.
+        assert mock_render.call_args.kwargs["cfg"] is not None
         mock_reload.assert_called_once_with("tenant_a")
 
     @pytest.mark.unit
@@ -106,6 +151,32 @@ class TestAddExport:
         exports = call_args[1]
         assert exports[-1]["export_id"] == 102
 
+    @pytest.mark.unit
+    @patch("arca_storage.cli.lib.ganesha._load_exports")
+    @patch("arca_storage.cli.lib.ganesha._save_exports")
+    @patch("arca_storage.cli.lib.ganesha.render_config")
+    @patch("arca_storage.cli.lib.ganesha.reload")
+    def test_add_exports_batch(self, mock_reload, mock_render, mock_save, mock_load):
+        """Test a batch is saved, rendered and reloaded once with consecutive IDs."""
+        mock_load.return_value = [{"export_id": 101, "path": "/exports/tenant_a/vol1", "client": "10.0.0.0/24"}]
+
+        added = ganesha.add_exports(
+            "tenant_a",
+            [
+                {"volume": "vol2", "client": "10.0.0.0/24"},
+                {"volume": "vol3", "client": "10.0.1.0/24", "access": "ro", "root_squash": False},
+            ],
+        )
+
+        assert [(e["export_id"], e["access"], e["squash"]) for e in added] == [
+            (102, "RW", "Root_Squash"),
+            (103, "RO", "No_Root_Squash"),
+        ]
+        mock_save.assert_called_once()
+        assert [e["export_id"] for e in mock_save.call_args[0][1]] == [101, 102, 103]
+        mock_render.assert_called_once()
+        mock_reload.assert_called_once_with("tenant_a")
+
 
 class TestRemoveExport:
     """Tests for remove_export function."""
@@ -141,6 +212,21 @@ class TestRemoveExport:
 
         mock_reload.assert_called_once_with("tenant_a")
 
+    @pytest.mark.unit
+    @patch("arca_storage.cli.lib.ganesha._load_exports")
+    @patch("arca_storage.cli.lib.ganesha._save_exports")
+    @patch("arca_storage.cli.lib.ganesha.render_config")
+    @patch("arca_storage.cli.lib.ganesha.reload")
+    def test_remove_export_without_reload(self, mock_reload, mock_render, mock_save, mock_load):
+        """Test reload_service=False saves and renders but leaves the reload to the caller."""
+        mock_load.return_value = [{"export_id": 101, "path": "/exports/tenant_a/vol1", "client": "10.0.0.0/24"}]
+
+        remove_export("tenant_a", "vol1", "10.0.0.0/24", reload_service=False)
+
+        mock_save.assert_called_once_with("tenant_a", [])
+        mock_render.assert_called_once()
+        mock_reload.assert_not_called()
+
 
 class TestSync:
     @pytest.mark.unit
@@ -157,3 +243,153 @@ class TestSync:
         mock_load.assert_called_once_with("tenant_a")
         mock_render.assert_called_once_with("tenant_a", [])
         mock_reload.assert_called_once_with("tenant_a")
+
+
+class TestListConfigSnapshots:
+    """Tests for list_config_snapshots function."""
+
+    @pytest.mark.unit
+    def test_list_config_snapshots(self, temp_dir, monkeypatch):
+        """Test snapshots are listed newest first, skipping latest, metadata and other SVMs."""
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+        assert ganesha.list_config_snapshots("tenant_a") == []
+
+        snapshot_dir = temp_dir / "config"
+        snapshot_dir.mkdir()
+        for i, name in enumerate(
+            [
+                "ganesha.tenant_a.aaaa.conf",
+                "ganesha.tenant_a.bbbb.conf",
+                "ganesha.tenant_a.bbbb.json",
+                "ganesha.tenant_a.latest.conf",
+                "ganesha.tenant_b.cccc.conf",
+            ]
+        ):
+            (snapshot_dir / name).write_text("")
+            os.utime(snapshot_dir / name, (1000 + i, 1000 + i))
+
+        snaps = ganesha.list_config_snapshots("tenant_a")
+
+        assert [s["config_version"] for s in snaps] == ["bbbb", "aaaa"]
+        assert snaps[0]["path"] == str(snapshot_dir / "ganesha.tenant_a.bbbb.conf")
+        assert snaps[0]["mtime"] == 1001
+
+
+class TestRollbackConfig:
+    """Tests for rollback_config function."""
+
+    @pytest.mark.unit
+    @patch("arca_storage.cli.lib.ganesha.reload")
+    def test_rollback_restores_snapshot(self, mock_reload, temp_dir, monkeypatch):
+        """Test the live config is restored byte-for-byte from a snapshot."""
+        from arca_storage.cli.lib.config import ArcaConfig
+
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+        cfg = ArcaConfig(ganesha_config_dir=str(temp_dir / "ganesha"))
+        with patch("arca_storage.cli.lib.ganesha.load_config", return_value=cfg):
+            config_path = Path(render_config("tenant_a", []))
+            original = config_path.read_bytes()
+            version = ganesha.read_config_snapshot_meta("tenant_a", "latest")["config_version"]
+            export = {"export_id": 101, "path": "/exports/tenant_a/vol1", "client": "10.0.0.0/24", "access": "RW"}
+            render_config("tenant_a", [export])
+            assert config_path.read_bytes() != original
+
+            assert ganesha.rollback_config("tenant_a", version) == str(config_path)
+
+        assert config_path.read_bytes() == original
+        mock_reload.assert_called_once_with("tenant_a")
+
+
+class TestIterExports:
+    """Tests for iter_exports function."""
+
+    @pytest.mark.unit
+    def test_iter_exports_ordered_and_lazy(self, temp_dir, monkeypatch):
+        """Test exports are yielded by (svm, export_id) and later SVM files are read on demand."""
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+        (temp_dir / "exports.tenant_b.json").write_text(
+            json.dumps([{"export_id": 1, "path": "/exports/tenant_b/vol1", "client": "10.0.0.0/24"}])
+        )
+        (temp_dir / "exports.tenant_a.json").write_text(
+            json.dumps(
+                [
+                    {"export_id": 2, "path": "/exports/tenant_a/vol2", "client": "10.0.0.0/24"},
+                    {"export_id": 1, "path": "/exports/tenant_a/vol1", "client": "10.0.0.0/24"},
+                ]
+            )
+        )
+
+        with patch("arca_storage.cli.lib.ganesha._load_exports", wraps=ganesha._load_exports) as mock_load:
+            first = next(iter_exports())
+            assert (first["svm"], first["volume"], first["export_id"]) == ("tenant_a", "vol1", 1)
+            mock_load.assert_called_once_with("tenant_a")
+
+        assert [(e["svm"], e["export_id"]) for e in iter_exports()] == [
+            ("tenant_a", 1),
+            ("tenant_a", 2),
+            ("tenant_b", 1),
+        ]
+        assert [e["volume"] for e in iter_exports(volume_name="vol2")] == ["vol2"]
+
+    @pytest.mark.unit
+    def test_iter_exports_missing_state_dir(self, temp_dir, monkeypatch):
+        """Test reading with no state directory yields nothing and creates nothing."""
+        state_dir = temp_dir / "missing"
+        monkeypatch.setenv("ARCA_STATE_DIR", str(state_dir))
+
+        assert list(iter_exports()) == []
+        assert list(iter_exports(svm_name="tenant_a")) == []
+        assert not state_dir.exists()
+
+
+class TestSaveExports:
+    """Tests for the exports state file layout."""
+
+    @pytest.mark.unit
+    def test_save_exports_layout_unchanged(self, temp_dir, monkeypatch):
+        """Test the file matches json.dumps(indent=2, sort_keys=True) and round-trips."""
+        monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+        exports = [{"export_id": 101, "path": "/exports/tenant_a/vol1", "sec": ["sys"], "client": "10.0.0.0/24"}]
+
+        ganesha._save_exports("tenant_a", exports)
+
+        content = (temp_dir / "exports.tenant_a.json").read_text(encoding="utf-8")
+        assert content == json.dumps(exports, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+        assert ganesha._load_exports("tenant_a") == exports
+
+
+class TestWriteIfChanged:
+    """Tests for _write_if_changed."""
+
+    @pytest.mark.unit
+    def test_write_if_changed(self, temp_dir):
+        """Test new, unchanged and changed content."""
+        path = temp_dir / "ganesha.tenant_a.conf"
+
+        ganesha._write_if_changed(path, "EXPORT {}\n")
+        assert path.read_text(encoding="utf-8") == "EXPORT {}\n"
+        mtime = path.stat().st_mtime_ns
+
+        with patch("builtins.open", wraps=open) as mock_open_:
+            ganesha._write_if_changed(path, "EXPORT {}\n")
+        assert [c.args[1] for c in mock_open_.call_args_list] == ["rb"]
+        assert path.stat().st_mtime_ns == mtime
+
+        ganesha._write_if_changed(path, "EXPORT { Export_Id = 1; }\n")
+        assert path.read_text(encoding="utf-8") == "EXPORT { Export_Id = 1; }\n"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/exports/tenant_a/vol1", "vol1"),
+        ("/exports/tenant_a/vol1/", "vol1"),
+        ("/srv//tenant_a//vol1//", "vol1"),
+        ("vol1", "vol1"),
+        ("/", ""),
+        ("", ""),
+    ],
+)
+def test_volume_from_path(path, expected):
+    assert ganesha._volume_from_path(path) == expected
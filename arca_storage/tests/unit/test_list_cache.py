@@ -0,0 +1,82 @@
+"""
+Unit tests for the list service cache.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from arca_storage.api.services.cache import ListCache
+
+
+class TestListCache:
+    """Tests for ListCache."""
+
+    @pytest.mark.unit
+    def test_hit_within_ttl(self):
+        """Test repeated lookups reuse the cached value."""
+        cache = ListCache(ttl=60)
+        compute = MagicMock(return_value={"items": []})
+
+        assert cache.get_or_compute("volumes", ("a",), compute) == {"items": []}
+        assert cache.get_or_compute("volumes", ("a",), compute) == {"items": []}
+        compute.assert_called_once()
+
+    @pytest.mark.unit
+    def test_distinct_keys(self):
+        """Test different filters are cached separately."""
+        cache = ListCache(ttl=60)
+        compute = MagicMock(side_effect=[1, 2])
+
+        assert cache.get_or_compute("volumes", ("a",), compute) == 1
+        assert cache.get_or_compute("volumes", ("b",), compute) == 2
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.cache.time.monotonic")
+    def test_expires_after_ttl(self, mock_monotonic):
+        """Test entries are recomputed once the TTL has passed."""
+        cache = ListCache(ttl=2)
+        compute = MagicMock(side_effect=[1, 2])
+
+        mock_monotonic.return_value = 100.0
+        assert cache.get_or_compute("svms", (), compute) == 1
+        mock_monotonic.return_value = 103.0
+        assert cache.get_or_compute("svms", (), compute) == 2
+
+    @pytest.mark.unit
+    def test_invalidate_resource(self):
+        """Test invalidation only drops the affected resource class."""
+        cache = ListCache(ttl=60)
+        volumes = MagicMock(side_effect=[1, 2])
+        svms = MagicMock(return_value=3)
+        cache.get_or_compute("volumes", (), volumes)
+        cache.get_or_compute("svms", (), svms)
+
+        cache.invalidate("volumes")
+
+        assert cache.get_or_compute("volumes", (), volumes) == 2
+        assert cache.get_or_compute("svms", (), svms) == 3
+        svms.assert_called_once()
+
+    @pytest.mark.unit
+    def test_invalidate_during_compute_is_not_cached(self):
+        """Test a result computed across an invalidation is not stored."""
+        cache = ListCache(ttl=60)
+
+        def stale():
+            cache.invalidate("volumes")
+            return "stale"
+
+        assert cache.get_or_compute("volumes", (), stale) == "stale"
+        assert cache.get_or_compute("volumes", (), lambda: "fresh") == "fresh"
+
+    @pytest.mark.unit
+    def test_maxsize_evicts_oldest(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ListCache(ttl=60, maxsize=2)
+        cache.get_or_compute("volumes", (1,), lambda: 1)
+        cache.get_or_compute("volumes", (2,), lambda: 2)
+        cache.get_or_compute("volumes", (3,), lambda: 3)
+
+        compute = MagicMock(return_value="recomputed")
+        assert cache.get_or_compute("volumes", (1,), compute) == "recomputed"
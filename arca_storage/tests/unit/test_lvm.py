@@ -28,6 +28,7 @@ class TestCreateLv:
             capture_output=True,
             text=True,
             check=False,
+            close_fds=False,
         )
 
     @pytest.mark.unit
@@ -42,7 +43,11 @@ class TestCreateLv:
 
         assert result == "/dev/vg_pool_01/vol1"
         mock_subprocess.assert_any_call(
-            ["lvcreate", "-L", "100G", "-n", "vol1", "vg_pool_01"], capture_output=True, text=True, check=False
+            ["lvcreate", "-L", "100G", "-n", "vol1", "vg_pool_01"],
+            capture_output=True,
+            text=True,
+            check=False,
+            close_fds=False,
         )
 
     @pytest.mark.unit
@@ -79,7 +84,11 @@ class TestResizeLv:
         resize_lv("vg_pool_01", "vol1", 200)
 
         mock_subprocess.assert_any_call(
-            ["lvextend", "-L", "200G", "/dev/vg_pool_01/vol1"], capture_output=True, text=True, check=False
+            ["lvextend", "-L", "200G", "/dev/vg_pool_01/vol1"],
+            capture_output=True,
+            text=True,
+            check=False,
+            close_fds=False,
         )
 
     @pytest.mark.unit
@@ -116,7 +125,7 @@ class TestDeleteLv:
         delete_lv("vg_pool_01", "vol1")
 
         mock_subprocess.assert_any_call(
-            ["lvremove", "-f", "/dev/vg_pool_01/vol1"], capture_output=True, text=True, check=False
+            ["lvremove", "-f", "/dev/vg_pool_01/vol1"], capture_output=True, text=True, check=False, close_fds=False
         )
 
     @pytest.mark.unit
@@ -0,0 +1,25 @@
+"""
+Unit tests for LV and export path naming helpers.
+"""
+
+import pytest
+
+from arca_storage.cli.lib import names
+
+
+class TestNames:
+    """Tests for naming helpers."""
+
+    @pytest.mark.unit
+    def test_lv_names(self):
+        """Test LV names follow the vol_{svm}_{volume}[_snap_{snapshot}] scheme."""
+        assert names.lv_name("tenant_a", "vol1") == "vol_tenant_a_vol1"
+        assert names.snapshot_lv_name("tenant_a", "vol1", "daily") == "vol_tenant_a_vol1_snap_daily"
+        assert names.svm_root_lv_name("tenant_a") == "vol_tenant_a"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("export_dir", ["/exports", "/exports/", "/exports//"])
+    def test_paths_ignore_trailing_slash(self, export_dir):
+        """Test export paths are built from a normalized export_dir."""
+        assert names.svm_path(export_dir, "tenant_a") == "/exports/tenant_a"
+        assert names.mount_path(export_dir, "tenant_a", "vol1") == "/exports/tenant_a/vol1"
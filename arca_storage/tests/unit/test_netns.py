@@ -24,8 +24,12 @@ class TestCreateNamespace:
         create_namespace("test_ns")
 
         assert mock_subprocess.call_count == 2
-        mock_subprocess.assert_any_call(["ip", "netns", "list"], capture_output=True, text=True, check=False)
-        mock_subprocess.assert_any_call(["ip", "netns", "add", "test_ns"], capture_output=True, text=True, check=False)
+        mock_subprocess.assert_any_call(
+            ["ip", "netns", "list"], capture_output=True, text=True, check=False, close_fds=False
+        )
+        mock_subprocess.assert_any_call(
+            ["ip", "netns", "add", "test_ns"], capture_output=True, text=True, check=False, close_fds=False
+        )
 
     @pytest.mark.unit
     def test_namespace_already_exists(self, mock_subprocess):
@@ -110,7 +114,9 @@ class TestAttachVlan:
 
         # Check gateway route was added
         mock_subprocess.assert_any_call(
-            ["ip", "netns", "exec", "test_ns", "ip", "route", "add", "default", "via", "192.168.10.1"], check=True
+            ["ip", "netns", "exec", "test_ns", "ip", "route", "add", "default", "via", "192.168.10.1"],
+            check=True,
+            close_fds=False,
         )
 
 
@@ -127,7 +133,9 @@ class TestDeleteNamespace:
 
         delete_namespace("test_ns")
 
-        mock_subprocess.assert_any_call(["ip", "netns", "del", "test_ns"], capture_output=True, text=True, check=False)
+        mock_subprocess.assert_any_call(
+            ["ip", "netns", "del", "test_ns"], capture_output=True, text=True, check=False, close_fds=False
+        )
 
     @pytest.mark.unit
     def test_delete_nonexistent_namespace(self, mock_subprocess):
@@ -0,0 +1,70 @@
+"""
+Unit tests for cursor pagination.
+"""
+
+import pytest
+
+from arca_storage.api.services.pagination import decode_cursor, encode_cursor, paginate
+
+
+def _key(item):
+    return (item["svm"], item["name"])
+
+
+ITEMS = [{"svm": "tenant_a", "name": f"vol{i}"} for i in range(5)]
+
+
+class TestPaginate:
+    """Tests for paginate function."""
+
+    @pytest.mark.unit
+    def test_single_page(self):
+        """Test all items fit in one page."""
+        result = paginate(ITEMS, _key, 10)
+        assert result["items"] == ITEMS
+        assert result["next_cursor"] is None
+
+    @pytest.mark.unit
+    def test_walk_pages(self):
+        """Test following next_cursor visits every item exactly once."""
+        seen = []
+        cursor = None
+        while True:
+            result = paginate(ITEMS, _key, 2, cursor)
+            seen.extend(result["items"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == ITEMS
+
+    @pytest.mark.unit
+    def test_exact_limit_has_no_next_cursor(self):
+        """Test a full last page does not produce a dangling cursor."""
+        result = paginate(ITEMS, _key, 5)
+        assert len(result["items"]) == 5
+        assert result["next_cursor"] is None
+
+    @pytest.mark.unit
+    def test_cursor_survives_deleted_item(self):
+        """Test the next page starts after the cursor key even if that item is gone."""
+        first = paginate(ITEMS, _key, 2)
+        remaining = [i for i in ITEMS if i["name"] != "vol1"]
+        second = paginate(remaining, _key, 2, first["next_cursor"])
+        assert [i["name"] for i in second["items"]] == ["vol2", "vol3"]
+
+    @pytest.mark.unit
+    def test_invalid_cursor(self):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            paginate(ITEMS, _key, 2, "not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            paginate(ITEMS, _key, 2, encode_cursor([1, 2]))
+
+
+class TestCursorEncoding:
+    """Tests for cursor encoding."""
+
+    @pytest.mark.unit
+    def test_roundtrip(self):
+        """Test cursors decode back to the original key."""
+        assert decode_cursor(encode_cursor(("tenant_a", 7))) == ("tenant_a", 7)
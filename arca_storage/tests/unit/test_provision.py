@@ -0,0 +1,37 @@
+"""
+Unit tests for shared SVM provisioning steps.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from arca_storage.cli.lib.config import ArcaConfig
+from arca_storage.cli.lib.provision import create_svm_root_lv
+
+
+class TestCreateSvmRootLv:
+    """Tests for create_svm_root_lv function."""
+
+    @pytest.mark.unit
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.lib.provision.create_lv", return_value="/dev/vg_pool_01/vol_tenant_a")
+    def test_creates_and_formats(self, mock_lv, mock_format):
+        """Test a new root LV is created thin in the configured pool and formatted."""
+        assert create_svm_root_lv("tenant_a", 10, ArcaConfig()) == "/dev/vg_pool_01/vol_tenant_a"
+
+        assert mock_lv.call_args.kwargs == {"thin": True, "thinpool_name": ArcaConfig().thinpool_name}
+        mock_format.assert_called_once_with("/dev/vg_pool_01/vol_tenant_a")
+
+    @pytest.mark.unit
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.lib.provision.create_lv")
+    def test_existing_lv_is_kept(self, mock_lv, mock_format):
+        """Test an existing root LV is left alone and other errors are raised."""
+        mock_lv.side_effect = RuntimeError("Logical volume /dev/vg_pool_01/vol_tenant_a already exists")
+        assert create_svm_root_lv("tenant_a", 10, ArcaConfig()) is None
+        mock_format.assert_not_called()
+
+        mock_lv.side_effect = RuntimeError("Failed to create logical volume: insufficient free space")
+        with pytest.raises(RuntimeError, match="insufficient free space"):
+            create_svm_root_lv("tenant_a", 10, ArcaConfig())
@@ -0,0 +1,142 @@
+"""
+Unit tests for QoS service.
+"""
+
+import os
+import stat
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from arca_storage.api.services.qos_service import _get_device_id, apply_qos_bulk, get_qos_settings
+
+
+class TestGetDeviceId:
+    """Tests for _get_device_id function."""
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service.os.stat")
+    def test_block_device(self, mock_stat):
+        """Test major:minor is read from st_rdev."""
+        mock_stat.return_value = SimpleNamespace(st_mode=stat.S_IFBLK | 0o660, st_rdev=os.makedev(253, 7))
+
+        assert _get_device_id("/dev/vg_pool_01/vol_tenant_a_vol1") == "253:7"
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service.os.stat")
+    def test_missing_device(self, mock_stat):
+        """Test a missing device raises RuntimeError."""
+        mock_stat.side_effect = FileNotFoundError("No such file or directory")
+        with pytest.raises(RuntimeError, match="Failed to get device ID"):
+            _get_device_id("/dev/vg_pool_01/missing")
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service.os.stat")
+    def test_not_block_device(self, mock_stat):
+        """Test a non-block path raises RuntimeError."""
+        mock_stat.return_value = SimpleNamespace(st_mode=stat.S_IFREG | 0o644, st_rdev=0)
+        with pytest.raises(RuntimeError, match="not a block device"):
+            _get_device_id("/tmp/not-a-device")
+
+
+class TestApplyQosBulk:
+    """Tests for apply_qos_bulk function."""
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service._get_device_id")
+    @patch("arca_storage.api.services.qos_service.state_get_volume")
+    @patch("arca_storage.api.services.qos_service._get_cgroup_base")
+    def test_apply_bulk(self, mock_base, mock_get, mock_devid, temp_dir):
+        """Test limits are written for every volume."""
+        mock_base.return_value = temp_dir / "arca"
+        mock_get.side_effect = lambda svm, name: {"lv_path": f"/dev/vg_pool_01/vol_{svm}_{name}"}
+        mock_devid.side_effect = ["253:1", "253:2"]
+
+        results = apply_qos_bulk(
+            [
+                {"svm": "tenant_a", "volume": "vol1", "read_iops": 100},
+                {"svm": "tenant_a", "volume": "vol2"},
+            ]
+        )
+
+        assert [r["device_id"] for r in results] == ["253:1", "253:2"]
+        assert (temp_dir / "arca/svm_tenant_a/vol_vol1/io.max").read_text() == "253:1 riops=100"
+        assert (temp_dir / "arca/svm_tenant_a/vol_vol2/io.max").read_text() == (
+            "253:2 rbps=max wbps=max riops=max wiops=max"
+        )
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service.state_get_volume")
+    @patch("arca_storage.api.services.qos_service._get_cgroup_base")
+    def test_unknown_volume_writes_nothing(self, mock_base, mock_get, temp_dir):
+        """Test an unknown volume fails the batch before any limits are written."""
+        mock_base.return_value = temp_dir / "arca"
+        mock_get.side_effect = lambda svm, name: (
+            {"lv_path": "/dev/vg_pool_01/vol_tenant_a_vol1"} if name == "vol1" else None
+        )
+
+        with pytest.raises(RuntimeError, match="not found"):
+            apply_qos_bulk([{"svm": "tenant_a", "volume": "vol1"}, {"svm": "tenant_a", "volume": "missing"}])
+
+        assert not (temp_dir / "arca").exists()
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service._get_device_id")
+    @patch("arca_storage.api.services.qos_service.state_get_volume")
+    @patch("arca_storage.api.services.qos_service._get_cgroup_base")
+    def test_unresolvable_device_writes_nothing(self, mock_base, mock_get, mock_devid, temp_dir):
+        """Test a device that cannot be resolved fails the batch before any limits are written."""
+        mock_base.return_value = temp_dir / "arca"
+        mock_get.side_effect = lambda svm, name: {"lv_path": f"/dev/vg_pool_01/vol_{svm}_{name}"}
+        mock_devid.side_effect = ["253:1", RuntimeError("Failed to get device ID for vol_tenant_a_vol2")]
+
+        with pytest.raises(RuntimeError, match="Failed to get device ID"):
+            apply_qos_bulk(
+                [
+                    {"svm": "tenant_a", "volume": "vol1", "read_iops": 100},
+                    {"svm": "tenant_a", "volume": "vol2", "read_iops": 100},
+                ]
+            )
+
+        assert not (temp_dir / "arca/svm_tenant_a/vol_vol1/io.max").exists()
+        assert not (temp_dir / "arca").exists()
+
+
+class TestGetQosSettings:
+    """Tests for get_qos_settings function."""
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service._get_device_id")
+    @patch("arca_storage.api.services.qos_service.state_get_volume")
+    @patch("arca_storage.api.services.qos_service._get_cgroup_base")
+    def test_parses_only_own_device_line(self, mock_base, mock_get, mock_devid, temp_dir):
+        """Test limits are read from the volume's own io.max line and "max" values are skipped."""
+        mock_base.return_value = temp_dir / "arca"
+        mock_get.return_value = {"svm": "tenant_a", "name": "vol1", "lv_path": "/dev/vg_pool_01/vol_tenant_a_vol1"}
+        mock_devid.return_value = "253:1"
+        cgroup_path = temp_dir / "arca" / "svm_tenant_a" / "vol_vol1"
+        cgroup_path.mkdir(parents=True)
+        (cgroup_path / "io.max").write_text(
+            "253:10 rbps=1 wbps=2 riops=3 wiops=4\n253:1 rbps=524288000 wbps=max riops=5000 wiops=max\n"
+        )
+
+        settings = get_qos_settings("tenant_a", "vol1")
+
+        assert settings["qos_enabled"] is True
+        assert settings["read_bps"] == 524288000
+        assert settings["read_iops"] == 5000
+        assert "write_bps" not in settings
+        assert "write_iops" not in settings
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.qos_service._get_device_id")
+    @patch("arca_storage.api.services.qos_service.state_get_volume")
+    @patch("arca_storage.api.services.qos_service._get_cgroup_base")
+    def test_no_cgroup(self, mock_base, mock_get, mock_devid, temp_dir):
+        """Test a volume without a cgroup reports QoS disabled without resolving its device."""
+        mock_base.return_value = temp_dir / "arca"
+        mock_get.return_value = {"svm": "tenant_a", "name": "vol1", "lv_path": "/dev/vg_pool_01/vol_tenant_a_vol1"}
+
+        assert get_qos_settings("tenant_a", "vol1") == {"svm": "tenant_a", "volume": "vol1", "qos_enabled": False}
+        mock_devid.assert_not_called()
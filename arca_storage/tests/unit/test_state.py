@@ -29,3 +29,55 @@ def test_state_roundtrip(temp_dir, monkeypatch):
     assert state.delete_svm("tenant_a") is True
     assert state.list_svms() == []
 
+
+
+@pytest.mark.unit
+def test_iter_volumes_filters_in_order(temp_dir, monkeypatch):
+    monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+
+    from arca_storage.cli.lib import state
+
+    for svm, name in [("tenant_b", "vol1"), ("tenant_a", "vol2"), ("tenant_a", "vol1")]:
+        state.upsert_volume({"svm": svm, "name": name})
+
+    assert [(v["svm"], v["name"]) for v in state.iter_volumes()] == [
+        ("tenant_a", "vol1"),
+        ("tenant_a", "vol2"),
+        ("tenant_b", "vol1"),
+    ]
+    assert [v["name"] for v in state.iter_volumes(svm="tenant_a", name="vol2")] == ["vol2"]
+
+
+@pytest.mark.unit
+def test_get_volume_follows_writes(temp_dir, monkeypatch):
+    monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+
+    from arca_storage.cli.lib import state
+
+    assert state.get_volume("tenant_a", "vol1") is None
+
+    state.upsert_volume({"svm": "tenant_a", "name": "vol1", "size_gib": 10})
+    assert state.get_volume("tenant_a", "vol1")["size_gib"] == 10
+
+    state.upsert_volume({"svm": "tenant_a", "name": "vol1", "size_gib": 20})
+    record = state.get_volume("tenant_a", "vol1")
+    assert record["size_gib"] == 20
+
+    # Returned records are copies; mutating one must not leak into later lookups.
+    record["size_gib"] = 0
+    assert state.get_volume("tenant_a", "vol1")["size_gib"] == 20
+
+    assert state.delete_volume("tenant_a", "vol1") is True
+    assert state.get_volume("tenant_a", "vol1") is None
+
+
+@pytest.mark.unit
+def test_upsert_stores_datetimes_as_iso(temp_dir, monkeypatch):
+    monkeypatch.setenv("ARCA_STATE_DIR", str(temp_dir))
+
+    from arca_storage.cli.lib import state
+
+    created_at = state.utc_now()
+    state.upsert_volume({"svm": "tenant_a", "name": "vol1", "created_at": created_at})
+
+    assert state.get_volume("tenant_a", "vol1")["created_at"] == created_at.isoformat()
@@ -0,0 +1,114 @@
+"""
+Unit tests for SVM service.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from arca_storage.api.models import SVMCreate
+from arca_storage.api.services import svm_service
+from arca_storage.cli.lib.config import ArcaConfig
+
+_SVM = SVMCreate(name="tenant_a", vlan_id=100, ip_cidr="192.168.10.5/24", root_volume_size_gib=10)
+
+
+class TestCreateSVM:
+    """Tests for create_svm function."""
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.svm_service.state_upsert_svm")
+    @patch("arca_storage.api.services.svm_service.create_group")
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.lib.provision.create_lv")
+    @patch("arca_storage.cli.lib.provision.render_config")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.api.services.svm_service.load_config", return_value=ArcaConfig())
+    def test_independent_steps_overlap(
+        self, mock_config, mock_ns, mock_vlan, mock_render, mock_lv, mock_format, mock_group, mock_upsert
+    ):
+        """Test namespace setup and root LV creation run concurrently before the group is created."""
+        both_started = threading.Barrier(2, timeout=5)
+        mock_ns.side_effect = lambda name: both_started.wait()
+
+        def create_lv(*args, **kwargs):
+            both_started.wait()
+            return "/dev/vg_pool_01/vol_tenant_a"
+
+        mock_lv.side_effect = create_lv
+
+        svm = svm_service.create_svm(_SVM)
+
+        assert svm["name"] == "tenant_a"
+        mock_vlan.assert_called_once()
+        mock_render.assert_called_once_with("tenant_a", [])
+        mock_format.assert_called_once_with("/dev/vg_pool_01/vol_tenant_a")
+        mock_group.assert_called_once()
+        assert mock_group.call_args.kwargs["create_filesystem"] is True
+        assert svm["created_at"].tzinfo is not None
+        assert mock_upsert.call_args.args[0]["created_at"] == svm["created_at"]
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.svm_service.create_group")
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.lib.provision.create_lv", return_value="/dev/vg_pool_01/vol_tenant_a")
+    @patch("arca_storage.cli.lib.provision.render_config")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.api.services.svm_service.load_config", return_value=ArcaConfig())
+    def test_network_failure_skips_group(
+        self, mock_config, mock_ns, mock_vlan, mock_render, mock_lv, mock_format, mock_group
+    ):
+        """Test a failed VLAN attach is raised and the Pacemaker group is not created."""
+        mock_vlan.side_effect = RuntimeError("Failed to attach VLAN")
+
+        with pytest.raises(RuntimeError, match="Failed to attach VLAN"):
+            svm_service.create_svm(_SVM)
+
+        mock_group.assert_not_called()
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.svm_service.create_group")
+    @patch("arca_storage.cli.lib.provision.delete_lv")
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.lib.provision.create_lv", return_value="/dev/vg_pool_01/vol_tenant_a")
+    @patch("arca_storage.cli.lib.provision.render_config")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.api.services.svm_service.load_config", return_value=ArcaConfig())
+    def test_namespace_failure_rolls_back_root_lv(
+        self, mock_config, mock_ns, mock_vlan, mock_render, mock_lv, mock_format, mock_delete, mock_group
+    ):
+        """Test a failed namespace setup removes the root LV created alongside it and writes no config."""
+        mock_ns.side_effect = RuntimeError("Failed to create namespace tenant_a: File exists")
+
+        with pytest.raises(RuntimeError, match="Failed to create namespace"):
+            svm_service.create_svm(_SVM)
+
+        mock_delete.assert_called_once_with("vg_pool_01", "vol_tenant_a")
+        mock_render.assert_not_called()
+        mock_group.assert_not_called()
+
+    @pytest.mark.unit
+    @patch("arca_storage.api.services.svm_service.create_group")
+    @patch("arca_storage.cli.lib.provision.delete_lv")
+    @patch("arca_storage.cli.lib.provision.format_xfs")
+    @patch("arca_storage.cli.lib.provision.create_lv")
+    @patch("arca_storage.cli.lib.provision.render_config")
+    @patch("arca_storage.cli.lib.provision.attach_vlan")
+    @patch("arca_storage.cli.lib.provision.create_namespace")
+    @patch("arca_storage.api.services.svm_service.load_config", return_value=ArcaConfig())
+    def test_render_failure_keeps_existing_root_lv(
+        self, mock_config, mock_ns, mock_vlan, mock_render, mock_lv, mock_format, mock_delete, mock_group
+    ):
+        """Test a config failure is raised and a root LV that already existed is not deleted."""
+        mock_lv.side_effect = RuntimeError("Logical volume /dev/vg_pool_01/vol_tenant_a already exists")
+        mock_render.side_effect = PermissionError("/etc/ganesha/ganesha.tenant_a.conf")
+
+        with pytest.raises(PermissionError):
+            svm_service.create_svm(_SVM)
+
+        mock_delete.assert_not_called()
+        mock_group.assert_not_called()
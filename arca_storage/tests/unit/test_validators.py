@@ -44,6 +44,10 @@ class TestValidateName:
             validate_name("-tenant")  # starts with hyphen
         with pytest.raises(ValueError):
             validate_name("_tenant")  # starts with underscore
+        with pytest.raises(ValueError):
+            validate_name("tenant_a\n")  # trailing newline
+        with pytest.raises(ValueError):
+            validate_name("tenänt")  # non-ASCII
 
 
 class TestValidateVlan:
@@ -113,3 +117,13 @@ class TestValidateIpCidr:
 
         with pytest.raises(ValueError, match="Prefix length must be between"):
             validate_ip_cidr("192.168.10.5/-1")
+
+    @pytest.mark.unit
+    def test_oversized_input(self):
+        """Test clearly oversized input is rejected up front and padded prefixes still parse."""
+        validate_ip_cidr("255.255.255.255/32")
+        assert validate_ip_cidr("192.168.10.5/024") == ("192.168.10.5", 24)
+        assert validate_ip_cidr("10.0.0.1/ 24") == ("10.0.0.1", 24)
+
+        with pytest.raises(ValueError, match="longer than 64 characters"):
+            validate_ip_cidr("1.1.1.1/" + "5" * 5000)
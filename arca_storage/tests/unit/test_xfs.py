@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from arca_storage.cli.lib.xfs import format_xfs, grow_xfs, mount_xfs, umount_xfs
+from arca_storage.cli.lib.xfs import _is_mountpoint, format_xfs, grow_xfs, mount_xfs, umount_xfs
 
 
 class TestFormatXfs:
@@ -40,6 +40,7 @@ class TestFormatXfs:
             capture_output=True,
             text=True,
             check=False,
+            close_fds=False,
         )
 
     @pytest.mark.unit
@@ -72,22 +73,37 @@ class TestFormatXfs:
             format_xfs("/dev/vg_pool_01/vol1")
 
 
+class TestIsMountpoint:
+    """Tests for _is_mountpoint function."""
+
+    @pytest.mark.unit
+    def test_reads_mountinfo(self, temp_dir):
+        """Test mount points are matched on the decoded mountinfo mount point field."""
+        mountinfo = temp_dir / "mountinfo"
+        mountinfo.write_text(
+            "22 1 253:0 / / rw,relatime shared:1 - xfs /dev/mapper/root rw\n"
+            "97 22 253:7 / /exports/tenant_a/my\\040vol rw,noatime shared:50 - xfs /dev/vg/lv rw\n"
+        )
+
+        with patch("arca_storage.cli.lib.xfs.MOUNTINFO_PATH", str(mountinfo)):
+            assert _is_mountpoint("/exports/tenant_a/my vol") is True
+            assert _is_mountpoint("/exports/tenant_a/vol1") is False
+
+
 class TestMountXfs:
     """Tests for mount_xfs function."""
 
     @pytest.mark.unit
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=False)
     @patch("os.makedirs")
-    def test_mount_new_filesystem(self, mock_makedirs, mock_subprocess):
+    def test_mount_new_filesystem(self, mock_makedirs, mock_is_mountpoint, mock_subprocess):
         """Test mounting a new filesystem."""
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=1),  # mountpoint (not mounted)
-            MagicMock(returncode=0),  # mount
-        ]
+        mock_subprocess.return_value = MagicMock(returncode=0)  # mount
 
         mount_xfs("/dev/vg_pool_01/vol1", "/exports/tenant_a/vol1")
 
         mock_makedirs.assert_called_once_with("/exports/tenant_a/vol1", exist_ok=True)
-        mock_subprocess.assert_any_call(
+        mock_subprocess.assert_called_once_with(
             [
                 "mount",
                 "-o",
@@ -98,25 +114,25 @@ class TestMountXfs:
             capture_output=True,
             text=True,
             check=False,
+            close_fds=False,
         )
 
     @pytest.mark.unit
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=True)
     @patch("os.makedirs")
-    def test_mount_already_mounted(self, mock_makedirs, mock_subprocess):
+    def test_mount_already_mounted(self, mock_makedirs, mock_is_mountpoint, mock_subprocess):
         """Test mounting filesystem that's already mounted."""
-        mock_subprocess.return_value = MagicMock(returncode=0)  # mountpoint (mounted)
-
         # Should not raise error, just skip
         mount_xfs("/dev/vg_pool_01/vol1", "/exports/tenant_a/vol1")
 
+        mock_subprocess.assert_not_called()
+
     @pytest.mark.unit
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=False)
     @patch("os.makedirs")
-    def test_mount_fails(self, mock_makedirs, mock_subprocess):
+    def test_mount_fails(self, mock_makedirs, mock_is_mountpoint, mock_subprocess):
         """Test mounting fails."""
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=1),  # mountpoint (not mounted)
-            MagicMock(returncode=1, stderr="Error"),  # mount fails
-        ]
+        mock_subprocess.return_value = MagicMock(returncode=1, stderr="Error")  # mount fails
 
         with pytest.raises(RuntimeError, match="Failed to mount XFS"):
             mount_xfs("/dev/vg_pool_01/vol1", "/exports/tenant_a/vol1")
@@ -126,34 +142,31 @@ class TestUmountXfs:
     """Tests for umount_xfs function."""
 
     @pytest.mark.unit
-    def test_umount_mounted_filesystem(self, mock_subprocess):
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=True)
+    def test_umount_mounted_filesystem(self, mock_is_mountpoint, mock_subprocess):
         """Test unmounting a mounted filesystem."""
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0),  # mountpoint (mounted)
-            MagicMock(returncode=0),  # umount
-        ]
+        mock_subprocess.return_value = MagicMock(returncode=0)  # umount
 
         umount_xfs("/exports/tenant_a/vol1")
 
-        mock_subprocess.assert_any_call(
-            ["umount", "/exports/tenant_a/vol1"], capture_output=True, text=True, check=False
+        mock_subprocess.assert_called_once_with(
+            ["umount", "/exports/tenant_a/vol1"], capture_output=True, text=True, check=False, close_fds=False
         )
 
     @pytest.mark.unit
-    def test_umount_not_mounted(self, mock_subprocess):
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=False)
+    def test_umount_not_mounted(self, mock_is_mountpoint, mock_subprocess):
         """Test unmounting filesystem that's not mounted."""
-        mock_subprocess.return_value = MagicMock(returncode=1)  # mountpoint (not mounted)
-
         # Should not raise error, just skip
         umount_xfs("/exports/tenant_a/vol1")
 
+        mock_subprocess.assert_not_called()
+
     @pytest.mark.unit
-    def test_umount_fails(self, mock_subprocess):
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=True)
+    def test_umount_fails(self, mock_is_mountpoint, mock_subprocess):
         """Test unmounting fails."""
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0),  # mountpoint (mounted)
-            MagicMock(returncode=1, stderr="Error"),  # umount fails
-        ]
+        mock_subprocess.return_value = MagicMock(returncode=1, stderr="Error")  # umount fails
 
         with pytest.raises(RuntimeError, match="Failed to unmount XFS"):
             umount_xfs("/exports/tenant_a/vol1")
@@ -163,34 +176,29 @@ class TestGrowXfs:
     """Tests for grow_xfs function."""
 
     @pytest.mark.unit
-    def test_grow_xfs(self, mock_subprocess):
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=True)
+    def test_grow_xfs(self, mock_is_mountpoint, mock_subprocess):
         """Test growing XFS filesystem."""
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0),  # mountpoint (mounted)
-            MagicMock(returncode=0),  # xfs_growfs
-        ]
+        mock_subprocess.return_value = MagicMock(returncode=0)  # xfs_growfs
 
         grow_xfs("/exports/tenant_a/vol1")
 
-        mock_subprocess.assert_any_call(
-            ["xfs_growfs", "/exports/tenant_a/vol1"], capture_output=True, text=True, check=False
+        mock_subprocess.assert_called_once_with(
+            ["xfs_growfs", "/exports/tenant_a/vol1"], capture_output=True, text=True, check=False, close_fds=False
         )
 
     @pytest.mark.unit
-    def test_grow_not_mounted(self, mock_subprocess):
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=False)
+    def test_grow_not_mounted(self, mock_is_mountpoint, mock_subprocess):
         """Test growing filesystem that's not mounted."""
-        mock_subprocess.return_value = MagicMock(returncode=1)  # mountpoint (not mounted)
-
         with pytest.raises(RuntimeError, match="is not mounted"):
             grow_xfs("/exports/tenant_a/vol1")
 
     @pytest.mark.unit
-    def test_grow_fails(self, mock_subprocess):
+    @patch("arca_storage.cli.lib.xfs._is_mountpoint", return_value=True)
+    def test_grow_fails(self, mock_is_mountpoint, mock_subprocess):
         """Test growing filesystem fails."""
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0),  # mountpoint (mounted)
-            MagicMock(returncode=1, stderr="Error"),  # xfs_growfs fails
-        ]
+        mock_subprocess.return_value = MagicMock(returncode=1, stderr="Error")  # xfs_growfs fails
 
         with pytest.raises(RuntimeError, match="Failed to grow XFS"):
             grow_xfs("/exports/tenant_a/vol1")